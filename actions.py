@@ -4,8 +4,7 @@ sur des cases spéciales.
 """
 
 # Import d'autres fichiers
-import board
-import player
+import rules
 
 
 # Définition des classes
@@ -18,7 +17,7 @@ class Action:
     # Si l'action requiert un autre joueur pour mettre fin
     other_player_rescue = False
 
-    def __init__(self, distance: int, tile: 'board.Tile', p: 'player.Player'):
+    def __init__(self, distance: int, tile: 'rules.Tile', p: 'rules.Player'):
         """
         Construit une nouvelle instance de la classe 'Action'.
         Une action possède un nom, et permet de se souvenir de tout un tas d'informations
@@ -69,7 +68,7 @@ class Action:
         # Retire l'action des effets du joueur
         return self.player.discard_effect(self.tile.name)
 
-    def rescue(self, player_: 'player.Player'):
+    def rescue(self, player_: 'rules.Player'):
         """
         Permet de secourir le joueur possédant l'action en fournissant le joueur délivrant en paramètre.
         """
@@ -92,15 +91,14 @@ class Bridge(Action):
         Action par défaut, téléporte le joueur sur la prochaine case pont.
         """
 
-        # Itère parmi les cases et leur position
-        for position, tile in self.player.game.board.tiles.items():
+        # Récupère la prochaine case pont à l'aide de l'index du plateau
+        tile = self.player.game.board.next_tile(self.tile)
 
-            # Si la position de la case est supérieure à celle du joueur
-            # et que la case est un pont
-            if position > self.tile.index and tile.name == self.tile.name:
+        # Si une case pont se trouve plus loin sur le plateau
+        if tile is not None:
 
-                # Téléporte le joueur dessus
-                self.player.goose.go_to(tile.index)
+            # Téléporte le joueur dessus
+            self.player.goose.go_to(tile.index)
 
 
 class Dices(Action):
@@ -173,6 +171,8 @@ class Hotel(Action):
 
         # Libère le joueur
         self.player.stopped = False
+        # Supprime l'action
+        self.discard()
 
 
 class Jail(Action):
@@ -191,7 +191,7 @@ class Jail(Action):
         # Stoppe le joueur
         self.player.stopped = True
 
-    def rescue(self, player_: 'player.Player'):
+    def rescue(self, player_: 'rules.Player'):
         """
         Porte secours au joueur
         """
@@ -249,15 +249,18 @@ class Well(Action):
         # Stoppe le joueur
         self.player.stopped = True
 
-    def rescue(self, player_: 'player.Player'):
+    def rescue(self, player_: 'rules.Player'):
         """
         Porte secours au joueur.
         """
 
         # Libère le joueur prisonnier
         self.player.stopped = False
-        # Extrait l'ancienne action des effets de l'ancien joueur et la stocke dans les effets du nouveau joueur
-        player_.add_effect(self.tile.name, self.discard())
+        # Extrait l'ancienne action des effets de l'ancien joueur
+        self.discard()
+        # Transmet l'action au nouveau joueur, et la stocke dans ses effets
+        self.player = player_
+        player_.add_effect(self.tile.name, self)
         # Emprisonne le joueur arrivant
         self.activate()
 
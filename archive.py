@@ -0,0 +1,281 @@
+"""
+Ce fichier contient l'archive des ressources du jeu : les images et les fichiers de données regroupés
+dans un seul fichier indexé, pour éviter d'ouvrir un fichier par ressource au démarrage
+(chaque ouverture peut être lente, par exemple lorsque le jeu est installé sur un lecteur réseau).
+
+L'archive est construite à l'aide de la commande 'python archive.py', puis elle est projetée en mémoire (mmap)
+lors de sa première utilisation : un seul fichier est ouvert, et chaque ressource est lue à travers une vue
+sur la projection (les octets lus sont copiés dans les tampons des fonctions de lecture, comme pour un fichier).
+Lorsqu'une ressource ne fait pas partie de l'archive (ou s'il n'y a pas d'archive), le fichier est lu directement :
+l'archive doit donc être reconstruite après avoir modifié une ressource, ou supprimée.
+
+Ce fichier n'inclut aucun autre fichier du jeu, il peut donc être inclus partout, y compris sans affichage.
+"""
+
+# Imports des bibliothèques
+import argparse
+import functools
+import io
+import json
+import mmap
+import os
+import struct
+
+
+# Définition des constantes
+
+# Chemin de l'archive des ressources
+ARCHIVE_PATH = "resources.pack"
+# Dossiers et extensions des fichiers regroupés dans l'archive
+DIRECTORIES = ("assets", "data")
+EXTENSIONS = ('.jpg', '.json', '.png')
+
+# En-tête de l'archive : signature, puis taille de l'index (en octets)
+MAGIC = b"GOOSEPAK"
+HEADER = struct.Struct("<8sQ")
+
+
+# Définition des fonctions
+
+def build(path: str = ARCHIVE_PATH, directories: tuple[str, ...] = DIRECTORIES) -> int:
+    """
+    Construit l'archive des ressources à partir des fichiers des dossiers donnés (et de leurs sous-dossiers).
+    L'archive est constituée d'un en-tête, d'un index au format JSON (emplacement et taille de chaque fichier
+    selon son chemin), puis du contenu des fichiers les uns à la suite des autres.
+    Retourne le nombre de fichiers regroupés.
+    """
+
+    # Index des fichiers, et contenu des fichiers
+    index = dict[str, tuple[int, int]]()
+    contents = list[bytes]()
+    offset = 0
+
+    # Pour chaque fichier des dossiers, trié par chemin pour que l'archive ne dépende pas de l'ordre du système
+    for directory in directories:
+        for name in sorted(walk(directory)):
+            if os.path.splitext(name)[1] in EXTENSIONS:
+
+                # Lit le fichier et l'ajoute à l'index
+                with open(name, "rb") as file:
+                    content = file.read()
+                index[name] = (offset, len(content))
+                contents.append(content)
+                offset += len(content)
+
+    # Écrit l'en-tête, l'index et le contenu des fichiers
+    encoded = json.dumps(index).encode("UTF-8")
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(encoded)))
+        file.write(encoded)
+        file.writelines(contents)
+
+    # Retourne le nombre de fichiers
+    return len(index)
+
+
+@functools.lru_cache(maxsize=None)
+def get_archive(path: str = ARCHIVE_PATH) -> 'Archive' or None:
+    """
+    Retourne l'archive des ressources, projetée en mémoire lors du premier appel puis partagée,
+    ou None si l'archive n'a pas été construite ou qu'elle est illisible (vide, tronquée, corrompue...) :
+    les ressources sont alors lues directement depuis leurs fichiers.
+    """
+
+    # Tente d'ouvrir l'archive
+    try:
+        return Archive(path) if os.path.isfile(path) else None
+
+    # Si l'archive ne peut pas être ouverte, lit les fichiers directement
+    except (OSError, ValueError):
+        return None
+
+
+def list_files(directory: str) -> list[str]:
+    """
+    Retourne les chemins des fichiers d'un dossier et de ses sous-dossiers,
+    depuis l'archive si elle contient le dossier, sinon depuis le système de fichiers.
+    """
+
+    # Si l'archive contient des fichiers du dossier
+    archive_ = get_archive()
+    if archive_ is not None:
+        names = archive_.list(directory)
+        if len(names) > 0:
+            return names
+
+    # Sinon, parcourt le dossier
+    return walk(directory)
+
+
+def normalize(name: str) -> str:
+    """
+    Retourne le chemin d'un fichier tel qu'il est enregistré dans l'index de l'archive
+    (relatif au dossier du jeu, séparé par des '/').
+    """
+    return os.path.normpath(name).replace(os.sep, '/')
+
+
+def open_file(name: str) -> io.RawIOBase:
+    """
+    Ouvre un fichier en lecture binaire : depuis l'archive si elle contient le fichier, sinon depuis le disque.
+    Lève une exception 'FileNotFoundError' si le fichier n'existe pas.
+    """
+
+    # Si l'archive contient le fichier
+    archive_ = get_archive()
+    if archive_ is not None and normalize(name) in archive_.index:
+        return archive_.open(name)
+
+    # Sinon, ouvre le fichier
+    return open(name, "rb")
+
+
+def walk(directory: str) -> list[str]:
+    """
+    Retourne les chemins des fichiers d'un dossier et de ses sous-dossiers, depuis le système de fichiers.
+    """
+    return [
+        normalize(os.path.join(root, file))
+        for root, _, files in os.walk(directory) for file in files
+    ]
+
+
+# Définition des classes
+
+class Archive:
+    """
+    Une classe représentant une archive des ressources, projetée en mémoire.
+    """
+
+    def __init__(self, path: str):
+        """
+        Construit une nouvelle instance de la classe 'Archive' en projetant en mémoire le fichier donné,
+        puis en lisant son index. Lève une exception 'ValueError' si le fichier n'est pas une archive.
+        """
+
+        # Projette le fichier en mémoire (le fichier peut être fermé, la projection reste valide)
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data = memoryview(self.map)
+
+        # Vérifie l'en-tête
+        if len(self.map) < HEADER.size or HEADER.unpack_from(self.map)[0] != MAGIC:
+            raise ValueError(f"The file '{path}' is not a resource archive!")
+
+        # Lit l'index, et l'emplacement du contenu des fichiers
+        _, length = HEADER.unpack_from(self.map)
+        self.index: dict[str, list[int]] = json.loads(self.data[HEADER.size:HEADER.size + length].tobytes())
+        self.start = HEADER.size + length
+
+        # Vérifie que l'index est complet, et que chaque fichier est entièrement contenu dans l'archive
+        if self.start > len(self.map) or not isinstance(self.index, dict) or not all(
+                isinstance(entry, list) and len(entry) == 2 and all(isinstance(value, int) for value in entry)
+                and 0 <= entry[0] and 0 <= entry[1] and self.start + entry[0] + entry[1] <= len(self.map)
+                for entry in self.index.values()
+        ):
+            raise ValueError(f"The resource archive '{path}' is truncated or corrupted!")
+
+    def list(self, directory: str) -> list[str]:
+        """
+        Retourne les chemins des fichiers de l'archive contenus dans un dossier et ses sous-dossiers.
+        """
+        prefix = normalize(directory) + '/'
+        return [name for name in self.index if name.startswith(prefix)]
+
+    def open(self, name: str) -> 'ArchiveFile':
+        """
+        Ouvre un fichier de l'archive en lecture, sous forme d'une vue sur la projection en mémoire.
+        Lève une exception 'FileNotFoundError' si le fichier ne fait pas partie de l'archive.
+        """
+
+        # Si le fichier ne fait pas partie de l'archive
+        if normalize(name) not in self.index:
+            raise FileNotFoundError(f"The file '{name}' is not in the resource archive!")
+
+        # Retourne une vue sur le contenu du fichier
+        offset, size = self.index[normalize(name)]
+        return ArchiveFile(self.data[self.start + offset:self.start + offset + size])
+
+
+class ArchiveFile(io.RawIOBase):
+    """
+    Une classe représentant un fichier de l'archive ouvert en lecture binaire : une vue sur la projection
+    en mémoire, utilisable partout où un fichier est attendu (json.load, pygame.image.load...).
+    """
+
+    def __init__(self, data: memoryview):
+        """
+        Construit une nouvelle instance de la classe 'ArchiveFile' à partir du contenu du fichier.
+        """
+
+        # Appel du constructeur de la superclasse
+        super().__init__()
+
+        # Contenu du fichier, et position de lecture
+        self.data = data
+        self.position = 0
+
+    def close(self):
+        """
+        Ferme le fichier, et libère la vue sur la projection en mémoire.
+        """
+        self.data.release()
+        super().close()
+
+    def readable(self) -> bool:
+        """
+        Indique que le fichier peut être lu.
+        """
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Copie la suite du contenu du fichier dans un tampon, et retourne le nombre d'octets copiés.
+        """
+
+        # Copie autant d'octets que possible depuis la projection en mémoire (aucun après la fin du fichier)
+        size = max(0, min(len(buffer), len(self.data) - self.position))
+        memoryview(buffer).cast('B')[:size] = self.data[self.position:self.position + size]
+        self.position += size
+
+        # Retourne le nombre d'octets copiés
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Déplace la position de lecture, depuis le début, la position actuelle ou la fin du fichier.
+        """
+
+        # Position de référence
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.data)
+
+        # Déplace la position de lecture
+        self.position = max(offset, 0)
+        return self.position
+
+    def seekable(self) -> bool:
+        """
+        Indique que la position de lecture peut être déplacée.
+        """
+        return True
+
+    def tell(self) -> int:
+        """
+        Retourne la position de lecture.
+        """
+        return self.position
+
+
+# Vérifie si ce fichier que ce fichier est exécuté et non importé.
+if __name__ == '__main__':
+
+    # Lit les arguments de la ligne de commande
+    parser = argparse.ArgumentParser(description="Construit l'archive des ressources du jeu.")
+    parser.add_argument("output", nargs="?", default=ARCHIVE_PATH, help="Le fichier de l'archive.")
+    arguments = parser.parse_args()
+
+    # Construit l'archive
+    print(f"{build(arguments.output)} fichiers regroupés dans '{arguments.output}'.")
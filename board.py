@@ -7,182 +7,263 @@ en rapport avec le plateau de jeu.
 from common import *
 
 # Import d'autres fichiers
-import actions
-import player
+import rules
 
 
-# Définition des fonctions
+# Définition des classes
 
-def spiral(width: int, height: int, position: int, padding: int = 0) -> (int, int):
+class Board(rules.Board, Savable):
     """
-    Un algorithme permettant de déterminer les coordonnées d'une case dans une spirale carrée,
-    dans le sens des aiguilles d'une montre, à partir de sa position, dans un repère en deux dimensions.
-    Cet algorithme utilise une fonction récursive (qui s'appelle elle-même), ce genre de fonction
-    est à manipuler avec précaution, ne pas mettre des valeurs qui ne pourraient potentiellement
-    pas être calculées.
-
-    NOTE : Cet algorithme est de plus en plus lorsque la taille de la spirale augmente ainsi que la position,
-    il est donc conseillé de n'utiliser qu'un nombre limité de fois cette fonction, et de stocker les résultats
-    dans un tableau de valeur ou un dictionnaire.
-
-    :param width : La largeur de la spirale.
-    :param height : La hauteur de la spirale.
-    :param position : Les cases restantes (ou nombre de cases).
-    :param padding : L'écartement par rapport au bord de la spirale. S'incrémente de 1 à chaque appel récursif.
-
-    :returns : Un tuple à deux valeurs entières, représentant les coordonnées d'un point.
+    Une classe qui représente le plateau du jeu.
+    Le plateau graphique hérite du plateau du moteur de règles, et y ajoute une surface d'affichage.
     """
 
-    # La largeur et la hauteur sont décrémentés.
-    width -= 1
-    height -= 1
+    @classmethod
+    def from_file(cls, file_name: str = rules.BOARD_PATH, tiles_file: str = rules.TILES_PATH) -> 'Board':
+        """
+        Charge un plateau de jeu depuis un fichier JSON.
+        Lève une exception de chargement si le fichier est invalide.
+        """
+
+        # Tente de charger le plateau à l'aide du moteur de règles
+        try:
+            return super().from_file(file_name, tiles_file)
+
+        # Si le plateau ne peut pas être chargé
+        except rules.LayoutException as error:
+            # Lève une exception de chargement
+            raise LoadingException(error.file, error.message)
 
-    # Variable qui est égale à 0 lors du premier contour puis à 1 pour tous les autres.
-    v = padding - 1 if padding > 0 else 0
+    @classmethod
+    def create_tile(cls, name: str, index: int, position: (int, int), action: type or None) -> 'Tile':
+        """
+        Construit une case graphique du plateau lors du chargement.
+        """
+        return Tile(name, index, position, action)
 
-    # Lorsque le nombre de cases (position) est supérieur à la nouvelle largeur.
-    if position > width - padding:
-        position -= width
+    def __init__(self, width: int, height: int, tiles: dict[int, 'Tile']):
+        """
+        Construit une nouvelle instance de la classe Board avec les cases
+        et les dimensions du plateau en paramètre.
+        """
 
-        # Lorsque le nombre de cases restantes (position) est supérieur à la nouvelle hauteur.
-        if position > height - padding - v:
-            position -= height - padding - v
+        # Version des cases du plateau, incrémentée à chaque modification des cases
+        self.version = 0
 
-            # Lorsque le nombre de cases (position) est supérieur à la nouvelle largeur.
-            if position > width - padding:
-                position -= width - padding
+        # Appel du constructeur de la superclasse
+        super().__init__(width, height, tiles)
 
-                # Lorsque le nombre de cases (position) est supérieur à la nouvelle largeur moins un,
-                # dû à la rangée supérieure, cette ligne est une case plus petite que les autres.
-                if position > height - padding - 1:
-                    position -= height - padding - 1
+    def __getstate__(self) -> dict: ...
 
-                    # Appel de la fonction de manière récursive.
-                    return spiral(width, height, position, padding + 1)
+    def __setstate__(self, state: dict): ...
 
-                # Retourne les coordonnées (ligne horizontale du haut).
-                return padding, height - position
+    def display(self, camera: 'Camera'):
+        """
+        Affiche les cases du plateau visibles par la caméra sur la surface de la caméra.
+        Les cases hors de la fenêtre d'affichage ne sont pas affichées, le temps d'affichage
+        ne dépend donc pas de la taille du plateau.
 
-            # Retourne les coordonnées (ligne horizontale du haut).
-            return width - position, height
+        La surface de la caméra est une couche statique : elle n'est redessinée que lorsque la caméra
+        se déplace, zoome, ou que les cases du plateau sont modifiées, et est sinon réutilisée telle quelle.
+        """
 
-        # Retourne les coordonnées (ligne verticale du droite).
-        return width, position + padding + v
+        # État de la couche statique (position et zoom de la caméra, version des cases)
+        state = (camera.x, camera.y, camera.zoom, self.version)
 
-    # Retourne les coordonnées (ligne horizontale du haut).
-    return position + v, padding
+        # Si la couche statique est à jour, il n'y a rien à redessiner
+        if camera.state == state:
+            return
+        camera.state = state
 
+        # Vide la surface de la caméra
+        camera.surface.fill('#000000')
 
-# Définition des classes
+        # Atlas des textures à la taille correspondant au zoom de la caméra
+        atlas = get_atlas().get_scaled(camera.zoom)
 
-class Board(Savable):
-    """
-    Une classe qui représente le plateau du jeu.
-    """
+        # Affiche les cases visibles depuis l'atlas, puis leur indice
+        for tile in camera.get_visible():
+            position = camera.to_screen(tile.rect.topleft)
+            atlas.blit(camera.surface, tile.texture, position)
+            if tile.label is not None:
+                offset = round(4 * camera.zoom)
+                camera.surface.blit(tile.get_label(camera.zoom), (position[0] + offset, position[1] + offset))
 
-    @staticmethod
-    def from_file(file_name: str):
+    def get_tile_at(self, point: (int, int)) -> 'Tile' or None:
         """
-        Charge un plateau de jeu depuis un fichier JSON.
+        Retourne la case se trouvant sous un point donné (en pixels, relativement à la surface du plateau),
+        ou None s'il n'y en a pas, à l'aide de l'index des coordonnées de la spirale.
         """
 
-        # Tente d'ouvrir et de charger le contenu du fichier
-        try:
+        # Récupère la position correspondant aux coordonnées du point
+        position = self.get_position(point[0] // Tile.WIDTH, point[1] // Tile.HEIGHT)
 
-            # Ouvre un fichier
-            with open(file_name, "r") as file:
-                # Charge les informations du fichier
-                data = json.load(file)
-                # Ferme le fichier
-                file.close()
+        # Retourne la case à cette position
+        return self.tiles.get(position) if position is not None else None
 
-        # Si le fichier est introuvable
-        except FileNotFoundError:
-            # Lève une exception de chargement
-            raise LoadingException(file_name, "Cannot load a file that does not exist!")
+    def invalidate(self):
+        """
+        Supprime les données précalculées du plateau, et indique que les cases sont à redessiner,
+        méthode appelée lorsque les cases du plateau sont modifiées.
+        """
+        super().invalidate()
+        self.version += 1
 
-        # S'il n'est pas possible de lire le fichier
-        except json.JSONDecodeError as error:
-            # Lève une exception de chargement
-            raise LoadingException(file_name, error.msg)
 
-        # Stocke la largeur et hauteur du plateau
-        width: int = data.get('width', 8)
-        height: int = data.get('height', 8)
+class Camera:
+    """
+    Une classe représentant la caméra du plateau : la partie du plateau visible dans une fenêtre d'affichage,
+    qui peut défiler et zoomer. Seules les cases visibles sont affichées, à l'aide de l'index de la spirale.
+    """
 
-        # Vérifie que la largeur du plateau est comprise dans ]0;8]
-        if not 0 < width <= 8:
-            # Lève une exception de chargement
-            raise LoadingException(file_name, f"The width of the board should be in ]0;8], got {width} instead!")
+    # Niveaux de zoom possibles
+    ZOOMS = (0.25, 0.5, 1, 2)
+    # Types d'évènements auxquels la caméra réagit (flèches du clavier et molette de la souris)
+    EVENTS = (pygame.KEYDOWN, pygame.MOUSEWHEEL)
 
-        # Vérifie que la largeur du plateau est comprise dans ]0;8]
-        if not 0 < height <= 8:
-            # Lève une exception de chargement
-            raise LoadingException(file_name, f"The height of the board should be in ]0;8], got {height} instead!")
+    def __init__(self, board_: 'Board', viewport: pygame.Rect):
+        """
+        Construit une nouvelle instance de la classe 'Camera' sur un plateau,
+        avec la fenêtre d'affichage (rectangle sur l'écran) donnée.
+        """
 
-        # Crée une cartographie du plateau (emplacement des cases selon leur position)
-        board = dict[int, 'Tile']()
+        # Le plateau
+        self.board = board_
 
-        # Stocke les cases à charger dans une liste
-        tiles: list[str] = data.get("tiles", [])
+        # La fenêtre d'affichage, et sa surface sur laquelle sont dessinées les cases (couche statique)
+        self.viewport = viewport
+        self.surface = pygame.Surface(self.viewport.size)
+        # État de la couche statique lors de son dernier dessin (None lorsqu'elle n'a jamais été dessinée)
+        self.state: tuple or None = None
 
-        # Stocke la taille attendue et la taille réelle du plateau
-        size, tiles_length = width * height, len(tiles)
+        # Le niveau de zoom et le décalage de la caméra (en pixels, au zoom actuel)
+        self.zoom_level = Camera.ZOOMS.index(1)
+        self.x = 0
+        self.y = 0
 
-        # Vérifie que le nombre de cases est inférieur ou égal à la taille du plateau
-        if len(tiles) > size:
-            # Lève une exception de chargement
-            raise LoadingException(file_name, f"{size} tiles were expected but {tiles_length} were given!")
+    def clamp(self):
+        """
+        Empêche la caméra de sortir du plateau.
+        """
+        self.x = max(0, min(self.x, self.board.width * self.tile_size - self.viewport.width))
+        self.y = max(0, min(self.y, self.board.height * self.tile_size - self.viewport.height))
 
-        # Itère pour chaque case à charger avec leur indice en tant que position
-        for position, tile in enumerate(tiles):
-            board[position] = Tile(tile, position, spiral(width, height, position))
+    def focus(self, rect: pygame.Rect):
+        """
+        Centre la caméra sur un rectangle du plateau (en pixels, sans zoom), s'il n'est pas entièrement visible.
+        """
 
-        # Crée et retourne un nouveau plateau de dimensions indiquées dans le fichier
-        return Board(width, height, board)
-    
-    def __init__(self, width: int, height: int, tiles: dict[int, 'Tile']):
+        # Rectangle visible par la caméra, en pixels sans zoom
+        visible = pygame.Rect(
+            self.x / self.zoom, self.y / self.zoom, self.viewport.width / self.zoom, self.viewport.height / self.zoom
+        )
+
+        # Si le rectangle n'est pas entièrement visible, centre la caméra dessus
+        if not visible.contains(rect):
+            self.x = int(rect.centerx * self.zoom - self.viewport.width / 2)
+            self.y = int(rect.centery * self.zoom - self.viewport.height / 2)
+            self.clamp()
+
+    def get_tile_at(self, point: (int, int)) -> 'Tile' or None:
         """
-        Construit une nouvelle instance de la classe Board avec les cases
-        et les dimensions du plateau en paramètre.
+        Retourne la case se trouvant sous un point de l'écran, ou None s'il n'y en a pas.
         """
 
-        # Dimensions du plateau
-        self.width = width
-        self.height = height
+        # Si le point est hors de la fenêtre d'affichage
+        if not self.viewport.collidepoint(point):
+            return None
 
-        # Surface et tuiles du plateau
-        self.surface = pygame.Surface((self.width * Tile.WIDTH, self.height * Tile.HEIGHT))
-        self.tiles = tiles
+        # Convertit le point en pixels du plateau, sans zoom
+        return self.board.get_tile_at((
+            int((point[0] - self.viewport.x + self.x) / self.zoom),
+            int((point[1] - self.viewport.y + self.y) / self.zoom)
+        ))
 
-    def __getstate__(self) -> dict: ...
+    def get_visible(self):
+        """
+        Génère les cases du plateau visibles par la caméra.
+        """
 
-    def __setstate__(self, state: dict): ...
+        # Colonnes et lignes visibles
+        size = self.tile_size
+        columns = range(self.x // size, min((self.x + self.viewport.width - 1) // size + 1, self.board.width))
+        rows = range(self.y // size, min((self.y + self.viewport.height - 1) // size + 1, self.board.height))
 
-    def display(self):
+        # Pour chaque coordonnée visible, récupère la case à l'aide de l'index de la spirale
+        for y in rows:
+            for x in columns:
+                tile = self.board.tiles.get(self.board.get_position(x, y))
+                if tile is not None:
+                    yield tile
+
+    def scroll(self, x: int, y: int):
         """
-        Affiche l'ensemble des cases du plateau sur la surface qui leur est destinée.
+        Fait défiler la caméra d'un certain nombre de cases horizontalement et verticalement.
         """
-        for tile in self.tiles.values():
-            self.surface.blit(tile.image, tile.rect)
+        self.x += x * self.tile_size
+        self.y += y * self.tile_size
+        self.clamp()
 
     @property
-    def size(self):
+    def tile_size(self) -> int:
+        """
+        Retourne la taille d'une case à l'écran (en pixels), selon le zoom de la caméra.
+        """
+        return int(Tile.WIDTH * self.zoom)
+
+    def to_screen(self, point: (int, int)) -> (int, int):
         """
-        Retourne la superficie du plateau de jeu (en nombre de cases).
-        Peut servir à calculer le nombre de cases totales que le plateau compte.
+        Convertit un point du plateau (en pixels, sans zoom) en point de la surface de la caméra.
         """
-        return self.width * self.height
-    
+        return int(point[0] * self.zoom) - self.x, int(point[1] * self.zoom) - self.y
+
     def update(self, event: pygame.event.Event):
         """
-        Met à jour l'ensemble des cases du plateau de jeu, à l'aide d'un événement.
+        Met à jour la caméra : les flèches du clavier font défiler le plateau,
+        et la molette de la souris zoome ou dézoome.
+        """
+
+        # Si une flèche du clavier est pressée
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LEFT:
+                self.scroll(-1, 0)
+            elif event.key == pygame.K_RIGHT:
+                self.scroll(1, 0)
+            elif event.key == pygame.K_UP:
+                self.scroll(0, -1)
+            elif event.key == pygame.K_DOWN:
+                self.scroll(0, 1)
+
+        # Si la molette de la souris est actionnée
+        elif event.type == pygame.MOUSEWHEEL:
+            self.zoom_to(self.zoom_level + (1 if event.y > 0 else -1))
+
+    @property
+    def zoom(self) -> float:
+        """
+        Retourne le facteur de zoom de la caméra.
+        """
+        return Camera.ZOOMS[self.zoom_level]
+
+    def zoom_to(self, level: int):
+        """
+        Change le niveau de zoom de la caméra, en gardant le centre de la fenêtre d'affichage au même endroit.
         """
-        for tile in self.tiles.values():
-            tile.update(event)
 
+        # Centre de la fenêtre d'affichage, en pixels du plateau sans zoom
+        center_x = (self.x + self.viewport.width / 2) / self.zoom
+        center_y = (self.y + self.viewport.height / 2) / self.zoom
 
-class Tile(pygame.sprite.Sprite, Savable):
+        # Change le niveau de zoom, dans les limites possibles
+        self.zoom_level = max(0, min(level, len(Camera.ZOOMS) - 1))
+
+        # Replace la caméra sur le même centre
+        self.x = int(center_x * self.zoom - self.viewport.width / 2)
+        self.y = int(center_y * self.zoom - self.viewport.height / 2)
+        self.clamp()
+
+
+class Tile(pygame.sprite.Sprite, rules.Tile, Savable):
     """
     Une classe qui représente une case du plateau.
 
@@ -194,59 +275,52 @@ class Tile(pygame.sprite.Sprite, Savable):
     WIDTH = 64
     HEIGHT = 64
 
-    def __init__(self, name: str, index: int, position: (int, int)):
+    def __init__(self, name: str, index: int, position: (int, int), action: type or None = None):
         """
         Construit une instance de la classe Tile.
-        Une case requiert un nom, une position (coordonnées) et optionnellement
+        Une case requiert un nom, une position (coordonnées), une action et optionnellement
         un indice à afficher en haut à gauche de la case.
         """
 
-        # Appel le constructeur de la superclasse
-        super().__init__()
-
-        # Le nom de la case
-        self.name = name
-        # L'indice de la case
-        self.index = index
-        # Ses coordonnées
-        self.x, self.y = position
-
-        # Ouvre le fichier des tuiles en mode lecture
-        with open("data/tiles.json", "r") as file:
+        # Appel les constructeurs des superclasses
+        pygame.sprite.Sprite.__init__(self)
+        rules.Tile.__init__(self, name, index, position, action)
 
-            # Charge dans un dictionnaire les informations du fichier
-            data = json.load(file)
-
-            # Récupère l'action associée à la case (None lorsque introuvable)
-            self.action = actions.DEFAULTS.get(data.get(self.name))
-            # Charge l'image correspondant à la case
-            self.image = pygame.image.load(f"assets/tiles/{self.name}.jpg").convert()
+        # Nom de la texture de la case dans l'atlas, et image correspondante (partagée entre les cases du même type)
+        self.texture = f"tiles/{self.name}"
+        self.image = get_atlas().get_image(self.texture)
 
+        # Étiquette affichant l'indice en haut à gauche de la case (None lorsque l'indice est nul)
+        self.label: pygame.Surface or None = None
         # Si un indice est passé en paramètres, c'est qu'il est à afficher
         if index != 0:
-            # L'afficher sur l'image de la case
-            self.image.blit(
-                tile_font.render(str(index), True, '#000000', '#c3c3c3'),
-                (4, 4)
-            )
+            # Crée l'étiquette de l'indice, affichée par-dessus l'image de la case
+            self.label = render_text(tile_font, str(index), True, '#000000', '#c3c3c3').convert()
+
+        # Étiquettes redimensionnées, selon le zoom
+        self.labels = dict[float, pygame.Surface]()
 
         # Le rectangle de la case
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x * Tile.WIDTH
-        self.rect.y = self.y * Tile.HEIGHT
+        self.rect = pygame.Rect(self.x * Tile.WIDTH, self.y * Tile.HEIGHT, Tile.WIDTH, Tile.HEIGHT)
 
     def __getstate__(self) -> dict: ...
 
     def __setstate__(self, state: dict): ...
 
-    def activate(self, distance: int, p: player.Player):
+    def get_label(self, zoom: float) -> pygame.Surface:
         """
-        Méthode appelée lorsqu'un joueur arrive sur cette case.
-        Ajoute une action à la liste des effets du joueur.
+        Retourne l'étiquette de l'indice de la case selon le zoom,
+        redimensionnée une seule fois par zoom puis gardée en mémoire.
         """
 
-        # Si l'action de la case n'est pas nulle (inexistante)
-        if self.action is not None:
-            # Ajouter une nouvelle action à la liste d'effets du joueur
-            action: 'actions.Action' = self.action(distance, self, p)
-            p.add_effect(self.name, action).activate()
+        # Si le zoom ne change pas la taille de l'étiquette
+        if zoom == 1:
+            return self.label
+
+        # Redimensionne l'étiquette si elle n'a pas encore été redimensionnée à ce zoom
+        if zoom not in self.labels:
+            width, height = self.label.get_size()
+            self.labels[zoom] = pygame.transform.smoothscale(self.label, (round(width * zoom), round(height * zoom)))
+
+        # Retourne l'étiquette redimensionnée
+        return self.labels[zoom]
@@ -3,43 +3,48 @@ Ce fichier regroupe tous les imports de bibliothèques
 et les déclarations utilisées partout dans le programme.
 
 Ce fichier est à inclure dans chaque nouveau fichier,
-mais ne doit inclure aucun fichier, sauf les imports de bibliothèques.
+mais ne doit inclure aucun fichier, sauf les imports de bibliothèques
+et 'archive.py' (qui n'inclut lui-même aucun fichier).
 
 À manipuler avec précaution.
 """
 
 # Imports des bibliothèques
 import abc
+import functools
 import json
 import os
 import pickle
 import pygame
+import queue
 import random
 import socket
 import sys
+import threading
 import time
 
+# Import de l'archive des ressources
+import archive
 
-# Initialisation des modules
-pygame.init()
-pygame.mixer.pre_init()
-pygame.display.init()
-pygame.font.init()
 
-
-# Création d'un premier écran, permettant l'utilisation
-# du package pygame.display par la suite.
+# Les modules de pygame, l'écran et les polices ne sont pas initialisés lors de l'import de ce fichier,
+# mais lors de leur première utilisation (voir 'get_screen' et 'LazyFont'), afin d'accélérer le démarrage
+# et de permettre l'utilisation des fichiers sans affichage.
 
 # Taille de l'écran
 screen_size = (850, 640)
-# Création de l'écran
-screen = pygame.display.set_mode(screen_size)
 
 # Constantes
-MAX_PLAYERS = 4
+MAX_PLAYERS = 64
+TEXT_CACHE_SIZE = 256
+BUTTON_CACHE_SIZE = 256
+ASSETS_PATH = "assets"
 SAVES_PATH = "data/saves"
+# Délai (en secondes) après la modification du dossier des sauvegardes, pendant lequel sa liste n'est pas gardée
+# en mémoire (certains systèmes de fichiers n'enregistrent la date de modification qu'à 2 secondes près)
+SAVES_SETTLE_DELAY = 2
 
-# Couleurs
+# Couleurs (les couleurs des oies au-delà de celles de la liste sont générées, voir 'get_goose_color')
 geese_colors = [
     (255, 255, 255),
     (128, 255, 128),
@@ -54,14 +59,6 @@ push_buttons_colors = {
     'press': '#4db8ff'
 }
 
-# Polices d'écriture
-debug_font = pygame.font.SysFont("consolas", 20)
-default_font = pygame.font.Font(None, 30)
-tile_font = pygame.font.SysFont("consolas", 12)
-sans_font = pygame.font.SysFont("Comic Sans MS", 60)
-win_font = pygame.font.Font(None, 60)
-
-
 # Définition des fonctions
 
 def access_directory(directory: str) -> str:
@@ -117,6 +114,154 @@ def center_width(width: int, container: int):
     return container // 2 - width // 2
 
 
+@functools.lru_cache(maxsize=None)
+def get_atlas() -> 'Atlas':
+    """
+    Retourne l'atlas des textures du jeu.
+    Les images sont chargées en arrière-plan par le chargeur des ressources (voir 'get_loader'),
+    en attendant la fin de leur chargement si besoin, puis l'atlas est partagé.
+    """
+    return get_loader().get("atlas")
+
+
+def get_goose_color(identifier: int) -> tuple[int, int, int]:
+    """
+    Retourne la couleur de l'oie d'un joueur selon son identifiant.
+    Les premiers joueurs ont les couleurs de 'geese_colors', les suivants ont des couleurs générées
+    en espaçant leurs teintes selon l'angle d'or, pour qu'elles restent distinctes quel que soit le nombre de joueurs.
+    """
+
+    # Si la couleur fait partie des couleurs prédéfinies
+    if identifier < len(geese_colors):
+        return geese_colors[identifier]
+
+    # Génère une couleur pastel, plus ou moins claire selon la parité de l'identifiant
+    color = pygame.Color(0)
+    color.hsva = ((identifier * 137.508) % 360, 50, 100 if identifier % 2 == 0 else 80, 100)
+    return color.r, color.g, color.b
+
+
+@functools.lru_cache(maxsize=None)
+def get_loader() -> 'Loader':
+    """
+    Retourne le chargeur des ressources du jeu, partagé par tout le programme.
+    Les images de l'atlas des textures sont ses premières ressources : elles sont chargées en arrière-plan,
+    puis l'atlas est construit sur le fil d'exécution principal (l'écran doit donc déjà exister).
+    """
+
+    # Crée le chargeur et y ajoute l'atlas des textures
+    loader = Loader()
+    loader.add("atlas", functools.partial(Atlas.load_images, ASSETS_PATH), Atlas)
+    return loader
+
+
+@functools.lru_cache(maxsize=None)
+def get_screen() -> pygame.Surface:
+    """
+    Retourne l'écran du jeu.
+    La fenêtre est créée lors du premier appel (ce qui initialise le module pygame.display), puis partagée.
+    """
+
+    # Initialise l'affichage et crée la fenêtre
+    pygame.display.init()
+    return pygame.display.set_mode(screen_size)
+
+
+@functools.lru_cache(maxsize=1)
+def list_saves(directory: str, modified: int) -> tuple[str, ...]:
+    """
+    Retourne les noms des fichiers de sauvegarde d'un dossier, triés par nom, à l'aide de 'os.scandir'
+    (le type de chaque élément est connu sans lire les informations de chaque fichier).
+    Le résultat est gardé en mémoire selon la date de modification du dossier (voir 'scan_saves') :
+    le dossier n'est parcouru de nouveau que lorsqu'un fichier y a été ajouté, supprimé ou renommé,
+    ou lorsque le jeu a écrit une sauvegarde (voir 'game.Game.save').
+    """
+    with os.scandir(directory) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.is_file()))
+
+
+@functools.lru_cache(maxsize=BUTTON_CACHE_SIZE)
+def render_button(label: str, size: (int, int), color: str) -> pygame.Surface:
+    """
+    Dessine l'image d'un bouton (voir 'Button') : son texte au centre, de la couleur indiquée, sur un fond noir.
+    Chaque état d'un bouton n'est dessiné qu'une seule fois, puis l'image est partagée entre les boutons identiques :
+    elle ne doit donc pas être modifiée.
+    """
+
+    # Crée l'image du bouton, et y affiche le texte au centre
+    image = pygame.Surface(size)
+    image.fill('#000000')
+    text = render_text(debug_font, label, True, color, '#000000')
+    image.blit(text, center_surface(text, image))
+
+    # Retourne l'image
+    return image
+
+
+@functools.lru_cache(maxsize=BUTTON_CACHE_SIZE)
+def render_push_button(
+        label: str, size: (int, int), elevation: int, border_radius: int, state: str
+) -> pygame.Surface:
+    """
+    Dessine l'image d'un bouton poussoir (voir 'PushButton') dans un état donné ('normal', 'hover' ou 'press',
+    voir 'push_buttons_colors') : la partie inférieure, puis la partie supérieure (abaissée lorsque le bouton
+    est pressé) et son texte. Chaque état d'un bouton n'est dessiné qu'une seule fois, puis l'image est partagée
+    entre les boutons identiques : elle ne doit donc pas être modifiée.
+    """
+
+    # Crée l'image du bouton, remplie de noir
+    image = pygame.Surface((size[0], size[1] + elevation))
+    image.fill('#000000')
+
+    # Dessine la partie inférieure du bouton
+    pygame.draw.rect(
+        image, push_buttons_colors['bottom'], pygame.Rect(0, elevation, *size), border_radius=border_radius
+    )
+
+    # Dessine la partie supérieure du bouton, abaissée lorsqu'il est pressé, puis son texte au centre
+    layer = pygame.Rect(0, elevation if state == 'press' else 0, *size)
+    pygame.draw.rect(image, push_buttons_colors[state], layer, border_radius=border_radius)
+    text = render_text(default_font, label, True, '#FFFFFF')
+    x, y = center_rect(text.get_rect(), layer)
+    image.blit(text, (x, y + layer.y))
+
+    # Retourne l'image
+    return image
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(
+        font: pygame.font.Font, text: str, antialias: bool, color: str or tuple, background: str or tuple = None
+) -> pygame.Surface:
+    """
+    Affiche un texte avec une police, comme la méthode 'render' des polices, en gardant en mémoire
+    les derniers textes affichés : un même texte n'est ainsi dessiné qu'une seule fois.
+    Le nombre de textes gardés en mémoire est limité (les moins récemment utilisés sont oubliés),
+    et les succès et échecs du cache sont comptés (voir 'render_text.cache_info()').
+    La surface retournée est partagée, elle ne doit donc pas être modifiée.
+    """
+    return font.render(text, antialias, color, background)
+
+
+def scan_saves() -> tuple[str, ...]:
+    """
+    Retourne les noms des fichiers du dossier des sauvegardes, créé s'il n'existe pas.
+    Seules les informations du dossier sont lues lorsqu'il n'a pas changé depuis le dernier appel (voir 'list_saves'),
+    sauf s'il vient d'être modifié : une sauvegarde écrite juste après pourrait ne pas changer sa date de modification,
+    la liste n'est donc gardée en mémoire qu'une fois cette date assez ancienne (voir 'SAVES_SETTLE_DELAY').
+    Cette fonction est appelée en arrière-plan (voir 'main.TitleScreen.save_select').
+    """
+
+    # Date de modification du dossier
+    directory = access_directory(SAVES_PATH)
+    modified = os.stat(directory).st_mtime_ns
+
+    # Si le dossier vient d'être modifié, le parcourt sans garder la liste en mémoire
+    if time.time_ns() - modified < SAVES_SETTLE_DELAY * 1_000_000_000:
+        return list_saves.__wrapped__(directory, modified)
+    return list_saves(directory, modified)
+
+
 # Définition des classes et interfaces
 
 class Application(abc.ABC):
@@ -160,12 +305,156 @@ class Application(abc.ABC):
         pass
 
 
+class Atlas:
+    """
+    Une classe représentant un atlas de textures : les images du jeu regroupées sur une surface par format
+    (une page opaque, une page transparente), avec l'emplacement (rectangle) de chaque image selon son nom.
+    Les images sont affichées depuis leur emplacement sur l'atlas, plutôt que depuis une surface chacune.
+    """
+
+    # Extensions des fichiers d'images
+    EXTENSIONS = ('.jpg', '.png')
+    # Largeur maximale de l'atlas (en pixels)
+    WIDTH = 1024
+
+    @classmethod
+    def from_directory(cls, directory: str) -> 'Atlas':
+        """
+        Construit un atlas à partir des images d'un dossier et de ses sous-dossiers (voir 'load_images').
+        """
+        return cls(Atlas.load_images(directory))
+
+    @staticmethod
+    def load_images(directory: str) -> dict[str, pygame.Surface]:
+        """
+        Charge les images d'un dossier et de ses sous-dossiers, sans les convertir au format de l'écran :
+        le chargement peut donc se faire en arrière-plan (voir 'Loader'), la conversion étant faite par l'atlas.
+        Les images sont lues depuis l'archive des ressources si elle les contient (voir 'archive.py').
+        Le nom d'une image est son chemin depuis le dossier, sans extension (par exemple "tiles/goose").
+        """
+
+        # Images de l'atlas, selon leur nom
+        images = dict[str, pygame.Surface]()
+
+        # Pour chaque fichier du dossier et de ses sous-dossiers
+        for path in archive.list_files(directory):
+            name, extension = os.path.splitext(path)
+
+            # Si le fichier est une image, la charge (l'extension permet à pygame de reconnaître son format)
+            if extension in Atlas.EXTENSIONS:
+                with archive.open_file(path) as file:
+                    images[os.path.relpath(name, directory).replace(os.sep, '/')] = pygame.image.load(file, path)
+
+        # Retourne les images
+        return images
+
+    def __init__(self, images: dict[str, pygame.Surface]):
+        """
+        Construit une nouvelle instance de la classe 'Atlas' à partir des images données.
+        Les images opaques et les images transparentes sont rangées sur deux pages séparées,
+        les images opaques pouvant ainsi être affichées sans calcul de transparence.
+        """
+
+        # Emplacement de chaque image sur l'atlas, et page de l'atlas sur laquelle elle se trouve
+        self.rects = dict[str, pygame.Rect]()
+        self.pages = dict[str, pygame.Surface]()
+        # Atlas redimensionnés, selon leur facteur
+        self.scaled = dict[float, 'Atlas']()
+
+        # Sépare les images entièrement opaques des images transparentes
+        opaque = {
+            name: image for name, image in images.items()
+            if pygame.mask.from_surface(image, 254).count() == image.get_width() * image.get_height()
+        }
+        transparent = {name: image for name, image in images.items() if name not in opaque}
+
+        # Range les images sur leur page
+        self.pack(opaque, False)
+        self.pack(transparent, True)
+
+    def blit(self, target: pygame.Surface, name: str, position: (int, int)):
+        """
+        Affiche une image de l'atlas sur une surface, à la position donnée.
+        """
+        target.blit(self.pages[name], position, self.rects[name])
+
+    def get_image(self, name: str) -> pygame.Surface:
+        """
+        Retourne une image de l'atlas, sous forme de sous-surface (les pixels sont partagés avec l'atlas).
+        L'image ne doit donc pas être modifiée, mais copiée avant d'y dessiner.
+        """
+        return self.pages[name].subsurface(self.rects[name])
+
+    def get_scaled(self, factor: float) -> 'Atlas':
+        """
+        Retourne l'atlas dont chaque image est redimensionnée selon un facteur.
+        Chaque image est redimensionnée séparément, pour ne pas déborder sur ses voisines,
+        et l'atlas redimensionné n'est construit qu'une seule fois par facteur.
+        """
+
+        # Si le facteur ne change pas la taille des images
+        if factor == 1:
+            return self
+
+        # Construit l'atlas redimensionné s'il n'a pas encore été construit
+        if factor not in self.scaled:
+            self.scaled[factor] = Atlas({
+                name: pygame.transform.smoothscale(
+                    self.get_image(name), (round(rect.width * factor), round(rect.height * factor))
+                )
+                for name, rect in self.rects.items()
+            })
+
+        # Retourne l'atlas redimensionné
+        return self.scaled[factor]
+
+    def pack(self, images: dict[str, pygame.Surface], alpha: bool):
+        """
+        Range des images sur une nouvelle page de l'atlas, par rangées de la plus haute à la plus basse,
+        puis les copie sur la page, convertie au format de l'écran (avec ou sans transparence).
+        """
+
+        # Position de la prochaine image et hauteur de la rangée en cours
+        x, y, row = 0, 0, 0
+
+        # Range les images de la plus haute à la plus basse
+        for name, image in sorted(images.items(), key=lambda item: (-item[1].get_height(), item[0])):
+
+            # Si l'image dépasse la largeur de l'atlas, passe à la rangée suivante
+            if x > 0 and x + image.get_width() > Atlas.WIDTH:
+                x, y, row = 0, y + row, 0
+
+            # Place l'image
+            self.rects[name] = pygame.Rect((x, y), image.get_size())
+            x += image.get_width()
+            row = max(row, image.get_height())
+
+        # Crée la surface transparente de la page
+        rects = [self.rects[name] for name in images]
+        size = (max((rect.right for rect in rects), default=1), max((rect.bottom for rect in rects), default=1))
+        page = pygame.Surface(size, pygame.SRCALPHA)
+
+        # Copie les images sur la page, transparence comprise (sans mélange avec le fond transparent)
+        for name, image in images.items():
+            page.blit(image, self.rects[name], special_flags=pygame.BLEND_RGBA_MAX)
+
+        # Convertit la page au format de l'écran
+        page = page.convert_alpha() if alpha else page.convert()
+        for name in images:
+            self.pages[name] = page
+
+
 class Button(pygame.sprite.Sprite):
     """
     Une classe représentant un bouton cliquable.
     Un bouton a un texte, une surface et un rectangle servant de boîte de collision.
     """
 
+    # Types d'évènements (de la souris) auxquels le bouton réagit
+    EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+    # Couleur du texte selon l'état du bouton
+    COLORS = {'normal': '#FFFFFF', 'hover': '#FFFF00'}
+
     def __init__(self, label: str, size: (int, int), position: (int, int), action: callable):
         """
         Initialise un nouveau bouton.
@@ -179,45 +468,48 @@ class Button(pygame.sprite.Sprite):
         self.label = label
         self.hovering = False
 
-        # Image du bouton (composant graphique).
-        self.image = pygame.Surface(size)
-        self.image.fill('#000000')
-        self.render('#FFFFFF')
+        # Image du bouton (composant graphique), partagée entre les boutons identiques.
+        self.size = tuple(size)
+        self.display('normal')
 
         # Rectangle du bouton (boîte de collision et d'affichage).
         self.rect = self.image.get_rect()
         self.rect.x, self.rect.y = position
 
-    def render(self, color: str):
+    def display(self, state: str):
         """
-        Affiche le texte du bouton sur son image, au centre et avec une couleur indiquée (code hexadecimal).
-        Cette action est gourmande en temps, il est donc conseillé de l'utiliser peut souvent.
+        Change l'image du bouton pour celle de l'état indiqué ('normal' ou 'hover', voir 'COLORS').
+        L'image n'est dessinée qu'une seule fois par état (voir 'render_button'), changer d'état est donc immédiat.
         """
-        # Créer une surface avec le texte de la couleur indiquée.
-        text = debug_font.render(self.label, True, color, '#000000')
-        # Affiche le texte sur l'image du bouton au centre.
-        self.image.blit(
-            text, center_surface(text, self.image)
-        )
+        self.image = render_button(self.label, self.size, Button.COLORS[state])
+
+    def set_label(self, label: str):
+        """
+        Change le texte du bouton, et le remet dans son état normal (permet de réutiliser un bouton existant).
+        """
+        self.label = label
+        self.hovering = False
+        self.display('normal')
     
     def update(self, event: pygame.event.Event, contained: (int, int) = None):
         """
         Met à jour le bouton, active son action lorsque la souris clique dessus
         et change sa couleur si la souris est placée au-dessus du bouton.
+        L'évènement doit être un évènement de la souris (voir 'EVENTS'), dont la position est utilisée.
         """
 
         rect = self.rect.copy()
         if contained is not None:
             rect.x += contained[0]
-            rect.Y += contained[1]
+            rect.y += contained[1]
 
         # Lorsque la pointe de la souris rentre en contact avec la boîte de collision.
-        if rect.collidepoint(*pygame.mouse.get_pos()):
+        if rect.collidepoint(event.pos):
 
             # Si ce n'était pas le cas au par-avant.
             if self.hovering is False:
                 # Change la couleur du texte du bouton.
-                self.render('#FFFF00')
+                self.display('hover')
                 # Indique qu'à présent la souris est au-dessus du bouton.
                 self.hovering = True
 
@@ -229,7 +521,7 @@ class Button(pygame.sprite.Sprite):
         # Si la souris n'est pas placée au-dessus du bouton, et que ce n'était pas le cas avant.
         elif self.hovering is True:
             # Change la couleur du texte du bouton.
-            self.render('#FFFFFF')
+            self.display('normal')
             # Indique qu'à présent la souris n'est au-dessus du bouton.
             self.hovering = False
 
@@ -266,14 +558,311 @@ class ErrorMessage(pygame.sprite.Sprite):
         )
 
         # Application du message
-        self.image.blit(debug_font.render("Une erreur est survenue, plus", True, '#FFFFFF'), (16, 24))
-        self.image.blit(debug_font.render("d'informations dans la console.", True, '#FFFFFF'), (16, 56))
-        self.image.blit(debug_font.render("Appuyez sur une touche ...", True, '#FFFFFF'), (16, 88))
+        self.image.blit(render_text(debug_font, "Une erreur est survenue, plus", True, '#FFFFFF'), (16, 24))
+        self.image.blit(render_text(debug_font, "d'informations dans la console.", True, '#FFFFFF'), (16, 56))
+        self.image.blit(render_text(debug_font, "Appuyez sur une touche ...", True, '#FFFFFF'), (16, 88))
 
         # Affichage du message dans la console
         print(self.error)
 
 
+class LazyFont:
+    """
+    Une classe représentant une police d'écriture chargée lors de sa première utilisation.
+    Rechercher une police système peut être long, les polices ne sont donc pas chargées au démarrage.
+    Les méthodes de la police (render, size...) sont utilisables directement sur cet objet.
+    """
+
+    def __init__(self, name: str or None, size: int, system: bool = False):
+        """
+        Construit une nouvelle instance de la classe 'LazyFont', à partir du nom de la police
+        (None pour la police par défaut de pygame), de sa taille, et indique s'il s'agit d'une police système.
+        """
+
+        # Description de la police
+        self.font_name = name
+        self.font_size = size
+        self.system = system
+        # La police chargée (None tant qu'elle n'est pas utilisée)
+        self.font: pygame.font.Font or None = None
+
+    def __getattr__(self, name: str):
+        """
+        Retourne un attribut de la police, en la chargeant si besoin.
+        N'est appelée que pour les attributs qui n'appartiennent pas à cet objet.
+        """
+        return getattr(self.get_font(), name)
+
+    def get_font(self) -> pygame.font.Font:
+        """
+        Retourne la police, en la chargeant lors du premier appel.
+        """
+
+        # Si la police n'a pas encore été chargée
+        if self.font is None:
+
+            # Initialise le module des polices si besoin
+            if not pygame.font.get_init():
+                pygame.font.init()
+
+            # Charge la police
+            if self.system:
+                self.font = pygame.font.SysFont(self.font_name, self.font_size)
+            else:
+                self.font = pygame.font.Font(self.font_name, self.font_size)
+
+        # Retourne la police
+        return self.font
+
+
+class ListView:
+    """
+    Une classe représentant une liste défilante d'éléments (des textes), chacun affiché par un bouton poussoir.
+    La liste est virtualisée : seuls les boutons des lignes visibles sont créés, mis à jour et affichés,
+    et ils sont réutilisés pour d'autres éléments lors du défilement, quel que soit le nombre d'éléments.
+    """
+
+    # Types d'évènements auxquels la liste réagit (ceux des boutons poussoirs, et la molette pour défiler)
+    EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL)
+
+    def __init__(
+            self, rect: pygame.Rect, row_size: (int, int), spacing: int, action: callable, elevation: int = 8
+    ):
+        """
+        Construit une nouvelle instance de la classe 'ListView', vide, affichée dans le rectangle donné de l'écran.
+        Les boutons ont la taille 'row_size' et l'élévation 'elevation' (voir 'PushButton'),
+        et sont espacés de 'spacing' pixels (d'une ligne à la suivante).
+        La fonction 'action' est appelée avec l'élément de la ligne cliquée.
+        """
+
+        # Rectangle de la liste sur l'écran, et surface sur laquelle sont dessinées les lignes visibles
+        self.rect = pygame.Rect(rect)
+        self.surface = pygame.Surface(self.rect.size)
+
+        # Taille et élévation des boutons, espacement des lignes, et marge au-dessus de chaque bouton
+        self.row_size = tuple(row_size)
+        self.elevation = elevation
+        self.spacing = spacing
+        self.margin = (spacing - row_size[1]) // 2
+        # Action des lignes
+        self.action = action
+
+        # Éléments de la liste, et défilement (en pixels)
+        self.items: tuple[str, ...] = ()
+        self.offset = 0
+
+        # Boutons réutilisables, selon leur emplacement (l'indice de la ligne modulo leur nombre maximum),
+        # et boutons des lignes visibles
+        self.rows = dict[int, PushButton]()
+        self.slots = (self.rect.height + row_size[1] + elevation) // spacing + 2
+        self.visible = list[PushButton]()
+
+    def display(self, surface: pygame.Surface):
+        """
+        Affiche les lignes visibles de la liste sur une surface (l'écran), dans le rectangle de la liste.
+        """
+        self.surface.fill('#000000')
+        for row in self.visible:
+            self.surface.blit(row.image, row.rect)
+        surface.blit(self.surface, self.rect)
+
+    def layout(self):
+        """
+        Place les boutons des lignes visibles selon le défilement : un bouton garde son élément tant que sa ligne
+        reste visible, et seuls les boutons des lignes qui apparaissent changent d'élément (ou sont créés).
+        """
+
+        # Lignes visibles : le bas du bouton (sous la marge et la hauteur du bouton) est sous le haut de la liste,
+        # et le haut du bouton (au-dessus de la marge, de l'élévation du bouton) est au-dessus du bas de la liste
+        first = max(0, (self.offset - self.margin - self.row_size[1]) // self.spacing + 1)
+        last = min(
+            len(self.items),
+            -(-(self.offset + self.rect.height - self.margin + self.elevation) // self.spacing)
+        )
+
+        # Pour chaque ligne visible
+        self.visible.clear()
+        for index in range(first, last):
+            item = self.items[index]
+            y = self.margin + index * self.spacing - self.offset
+
+            # Réutilise le bouton de l'emplacement de la ligne, ou le crée
+            row = self.rows.get(index % self.slots)
+            if row is None:
+                row = self.rows[index % self.slots] = PushButton(
+                    item, self.row_size, (0, y), None, self.elevation
+                )
+            elif row.label != item:
+                row.set_label(item)
+
+            # Place le bouton, et associe son action à l'élément de la ligne
+            row.rect.y = y - row.elevation
+            row.action = functools.partial(self.action, item)
+            self.visible.append(row)
+
+    def scroll(self, rows: int):
+        """
+        Fait défiler la liste d'un nombre de lignes donné (vers le bas lorsqu'il est positif),
+        sans dépasser le début et la fin de la liste.
+        """
+        bottom = max(0, len(self.items) * self.spacing - self.rect.height)
+        self.offset = max(0, min(self.offset + rows * self.spacing, bottom))
+        self.layout()
+
+    def set_items(self, items: tuple[str, ...] or list[str]):
+        """
+        Remplace les éléments de la liste, en gardant le défilement dans les limites de la nouvelle liste.
+        """
+        self.items = tuple(items)
+        self.scroll(0)
+
+    def update(self, event: pygame.event.Event):
+        """
+        Met à jour la liste : la molette de la souris la fait défiler,
+        et les autres évènements (voir 'EVENTS') mettent à jour les boutons des lignes visibles,
+        seulement lorsque la souris est dans la liste (les parties des boutons qui dépassent ne sont pas cliquables).
+        """
+
+        # Si la molette de la souris est actionnée, défile vers le haut ou vers le bas
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll(-1 if event.y > 0 else 1)
+
+        # Si la souris est dans la liste, met à jour les boutons visibles (relativement à la position de la liste)
+        elif self.rect.collidepoint(event.pos):
+            for row in tuple(self.visible):
+                row.update(event, self.rect.topleft)
+
+        # Sinon, remet dans leur état normal les boutons survolés ou pressés
+        else:
+            for row in self.visible:
+                if row.hovering or row.pressed:
+                    row.set_label(row.label)
+
+
+class Loader:
+    """
+    Une classe représentant un chargeur de ressources en arrière-plan.
+    Les ressources sont lues et décodées dans l'ordre de leur ajout par un fil d'exécution séparé,
+    pendant que le jeu continue de s'afficher, puis sont terminées sur le fil d'exécution principal
+    (conversion des images au format de l'écran par exemple), seul à pouvoir utiliser l'affichage.
+    """
+
+    def __init__(self):
+        """
+        Construit une nouvelle instance de la classe 'Loader', sans ressources.
+        Le chargement commence lors de l'appel à la méthode 'start', ou lors de la première ressource demandée.
+        """
+
+        # Ressources à charger (nom, fonction de chargement), et ressources chargées en attente d'être terminées
+        self.jobs = queue.Queue()
+        self.loaded = queue.Queue()
+        # Fonctions terminant les ressources sur le fil d'exécution principal, selon leur nom
+        self.finishers = dict[str, callable]()
+        # Ressources terminées, selon leur nom
+        self.assets = dict[str, object]()
+        # Fil d'exécution du chargement (None tant qu'il n'est pas démarré)
+        self.thread: threading.Thread or None = None
+
+    def add(self, name: str, load: callable, finish: callable = None):
+        """
+        Ajoute une ressource à charger : la fonction 'load' est appelée en arrière-plan et ne doit donc pas utiliser
+        l'affichage, puis la fonction 'finish' (si elle est donnée) est appelée sur le fil d'exécution principal
+        avec le résultat du chargement, et son résultat devient la ressource.
+        """
+        self.finishers[name] = finish
+        self.jobs.put((name, load))
+
+    def get(self, name: str):
+        """
+        Retourne une ressource, en attendant la fin de son chargement si elle n'est pas encore prête.
+        L'erreur levée lors du chargement de la ressource est levée à nouveau.
+        """
+
+        # Démarre le chargement si besoin, et termine les ressources chargées jusqu'à celle demandée
+        self.start()
+        while name not in self.assets:
+            self.receive(True)
+
+        # Lève l'erreur de chargement, ou retourne la ressource
+        if isinstance(self.assets[name], Exception):
+            raise self.assets[name]
+        return self.assets[name]
+
+    def forget(self, name: str):
+        """
+        Oublie une ressource terminée, qui peut alors être ajoutée de nouveau pour être rechargée.
+        """
+        self.assets.pop(name, None)
+
+    @property
+    def progress(self) -> float:
+        """
+        Retourne l'avancement du chargement, entre 0 (rien n'est chargé) et 1 (tout est chargé).
+        """
+        return len(self.assets) / max(len(self.finishers), 1)
+
+    @property
+    def ready(self) -> bool:
+        """
+        Indique si toutes les ressources ont été chargées.
+        """
+        return len(self.assets) == len(self.finishers)
+
+    def receive(self, block: bool) -> bool:
+        """
+        Termine une ressource chargée, en attendant la fin de son chargement si 'block' est vrai.
+        Indique si une ressource a été terminée.
+        """
+
+        # Récupère la prochaine ressource chargée
+        try:
+            name, result = self.loaded.get(block)
+        except queue.Empty:
+            return False
+
+        # Termine la ressource, sauf si son chargement a échoué
+        finish = self.finishers[name]
+        if finish is not None and not isinstance(result, Exception):
+            try:
+                result = finish(result)
+            except Exception as e:
+                result = e
+        self.assets[name] = result
+        return True
+
+    def run(self):
+        """
+        Boucle du fil d'exécution du chargement : charge les ressources une à une, dans l'ordre de leur ajout.
+        Une erreur de chargement est conservée à la place de la ressource.
+        """
+        while True:
+            name, load = self.jobs.get()
+            try:
+                result = load()
+            except Exception as e:
+                result = e
+            self.loaded.put((name, result))
+
+    def start(self):
+        """
+        Démarre le chargement en arrière-plan, s'il n'est pas déjà démarré.
+        """
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="Loader", daemon=True)
+            self.thread.start()
+
+    def update(self) -> bool:
+        """
+        Termine toutes les ressources déjà chargées, sans attendre les autres.
+        Cette méthode est à appeler régulièrement sur le fil d'exécution principal (à chaque image par exemple).
+        Indique si des ressources ont été terminées.
+        """
+        updated = False
+        while self.receive(False):
+            updated = True
+        return updated
+
+
 class LoadingException(Exception):
     """
     Une classe représentant une erreur de chargement, utilisé par le jeu et le plateau lors du chargement de fichiers.
@@ -315,6 +904,9 @@ class PushButton(Button):
     Il est possible en plus de choisir sa couleur, le rayon de l'arrondissement des angles ainsi que l'élévation.
     """
 
+    # Types d'évènements (de la souris) auxquels le bouton réagit, le bouton s'activant lorsqu'il est relâché
+    EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
     def __init__(
             self, label: str, size: (int, int), position: (int, int), action: callable,
             elevation: int = 8, border_radius: int = 16
@@ -327,55 +919,36 @@ class PushButton(Button):
         et est activé lorsqu'il est relâché.
         """
 
-        # Appel du constructeur de la superclasse 'Button'
-        super().__init__(label, size, position, action)
-
-        # Attributs primaires
+        # Attributs primaires (utilisés pour l'image du bouton, dès le constructeur de la superclasse)
         self.pressed = False
         self.elevation = elevation
         self.border_radius = border_radius
 
-        # Taille
-        self.size = list(size)
-        # Image
-        self.image = pygame.Surface((self.size[0], self.size[1] + self.elevation))
-        # Rectangle
-        self.rect = self.image.get_rect()
-        self.rect.x = position[0]
-        self.rect.y = position[1] - self.elevation
+        # Appel du constructeur de la superclasse 'Button', qui affiche le bouton
+        super().__init__(label, size, position, action)
 
-        # Boîte de collision
-        self.layer = self.image.get_rect()
-        self.layer.height -= self.elevation
-        # Texte
-        self.text = default_font.render(self.label, True, '#FFFFFF')
+        # Rectangle, la partie supérieure du bouton étant placée à la position donnée
+        self.rect.y = position[1] - self.elevation
 
-        # Affiche le bouton.
-        self.display(push_buttons_colors['normal'])
+    def display(self, state: str):
+        """
+        Change l'image du bouton pour celle de l'état indiqué ('normal', 'hover' ou 'press').
+        L'image n'est dessinée qu'une seule fois par état (voir 'render_push_button'), changer d'état est donc immédiat.
+        """
+        self.image = render_push_button(self.label, self.size, self.elevation, self.border_radius, state)
 
-    def display(self, color: str):
+    def set_label(self, label: str):
         """
-        Affiche le texte du bouton sur son image, au centre et avec une couleur indiquée (code hexadecimal).
-        Cette action est gourmande en temps, il est donc conseillé de l'utiliser peut souvent.
+        Change le texte du bouton, et le remet dans son état normal (relevé).
         """
-        # Filling with black.
-        self.image.fill('#000000')
-        # Drawing button's bottom part.
-        pygame.draw.rect(
-            self.image, push_buttons_colors['bottom'],
-            pygame.Rect(0, self.elevation, *self.size),
-            border_radius=self.border_radius
-        )
-        # Drawing button's top part and text.
-        pygame.draw.rect(self.image, color, self.layer, border_radius=self.border_radius)
-        x, y = center_rect(self.text.get_rect(), self.layer)
-        y += self.layer.y
-        self.image.blit(self.text, (x, y))
+        self.pressed = False
+        super().set_label(label)
 
     def update(self, event: pygame.event.Event, contained: (int, int) = None):
         """
         Met à jour le bouton, active son action lorsque la souris clique dessus
         et change sa couleur si la souris est placée au-dessus du bouton.
+        L'évènement doit être un évènement de la souris (voir 'EVENTS'), dont la position est utilisée.
         """
 
         rect = self.rect.copy()
@@ -384,12 +957,12 @@ class PushButton(Button):
             rect.y += contained[1]
 
         # Lorsque la pointe de la souris rentre en contact avec la boîte de collision.
-        if rect.collidepoint(*pygame.mouse.get_pos()):
+        if rect.collidepoint(event.pos):
 
             # Si ce n'était pas le cas au par-avant.
             if self.hovering is False:
                 # Change la couleur du bouton.
-                self.display(push_buttons_colors['hover'])
+                self.display('hover')
                 # Indique qu'à présent la souris est au-dessus du bouton.
                 self.hovering = True
 
@@ -398,36 +971,30 @@ class PushButton(Button):
 
                 # Si le bouton n'était pas en train d'être pressé.
                 if self.pressed is False:
-                    # Abaisse le bouton.
-                    self.layer.y = self.elevation
-                    # Change la couleur du bouton.
-                    self.display(push_buttons_colors['press'])
+                    # Abaisse le bouton, et change sa couleur.
+                    self.display('press')
                     # Indique que le bouton est à présent pressé.
                     self.pressed = True
 
                 # Si le bouton était en train d'être pressé.
                 else:
-                    # Relève le bouton.
-                    self.layer.y = 0
-                    # Change la couleur du bouton.
-                    self.display(push_buttons_colors['normal'])
+                    # Relève le bouton, et change sa couleur.
+                    self.display('normal')
                     # Indique que le bouton est relâché.
                     self.pressed = False
 
             elif self.pressed is True:
                 # Indique que le bouton est relâché.
                 self.pressed = False
-                # Relève le bouton.
-                self.layer.y = 0
-                # Change la couleur du bouton.
-                self.display(push_buttons_colors['normal'])
+                # Relève le bouton, et change sa couleur.
+                self.display('normal')
                 # Actionne la fonction.
                 self.action()
 
         # Si la souris n'est pas placée au-dessus du bouton, et que ce n'était pas le cas avant.
         elif self.hovering is True:
             # Change la couleur du bouton.
-            self.display(push_buttons_colors['normal'])
+            self.display('normal')
             # Indique qu'à présent la souris n'est au-dessus du bouton.
             self.hovering = False
 
@@ -467,14 +1034,41 @@ class Task(abc.ABC):
     Une classe implémentant cette interface, devra alors avoir une méthode display,
     qui se charge de l'affichage, ainsi que d'une méthode update, avec un argument 'event',
     qui se charge de l'actualisation de la tâche.
+
+    Seules les régions modifiées de l'écran (rectangles signalés avec la méthode invalidate) sont réaffichées.
+    Par défaut, tout l'écran est considéré comme modifié après chaque évènement, mais une tâche qui signale
+    elle-même les régions modifiées (TRACKED) n'est réaffichée que lorsque c'est nécessaire.
+
+    Les évènements sont distribués par type (voir 'dispatch') : la méthode update ne reçoit que les types déclarés
+    dans EVENTS, et d'autres fonctions peuvent s'abonner à d'autres types (voir 'subscribe').
+    Les types auxquels personne n'est abonné ne sont pas reçus par l'application (voir 'pygame.event.set_allowed').
     """
 
+    # Si la tâche signale elle-même les régions modifiées de l'écran
+    TRACKED = False
+    # Types d'évènements transmis à la méthode update de la tâche
+    EVENTS: tuple[int, ...] = ()
+
     def __init__(self, app: 'Application'):
         """
         Construit une nouvelle instance d'une tâche avec des attributs par défaut.
         Une tâche doit être associée avec une application.
         """
         self.app = app
+        # Régions de l'écran modifiées depuis le dernier affichage
+        self.dirty = list[pygame.Rect]()
+
+        # Fonctions abonnées à chaque type d'évènement (la méthode update est abonnée aux types déclarés)
+        self.handlers = dict[int, list[callable]]()
+        self.subscribe(self.update, *self.EVENTS)
+
+    def dispatch(self, event: pygame.event.Event):
+        """
+        Transmet un évènement aux seules fonctions abonnées à son type, dans l'ordre de leur abonnement.
+        Une fonction peut s'abonner ou se désabonner pendant la distribution, sans effet sur l'évènement en cours.
+        """
+        for handler in tuple(self.handlers.get(event.type, ())):
+            handler(event)
 
     @abc.abstractmethod
     def display(self):
@@ -485,11 +1079,75 @@ class Task(abc.ABC):
         """
         pass
 
+    @property
+    def event_types(self) -> frozenset[int]:
+        """
+        Retourne les types d'évènements auxquels au moins une fonction est abonnée.
+        """
+        return frozenset(self.handlers)
+
+    def get_timeout(self) -> int or None:
+        """
+        Retourne le délai (en millisecondes) avant le prochain changement de l'affichage qui ne dépend d'aucun
+        évènement (chronomètre...), 0 lorsque la tâche est animée (l'affichage est alors rafraîchi à fréquence fixe),
+        ou None lorsque l'affichage ne change qu'avec les évènements. Par défaut, la tâche n'est pas animée.
+        """
+        return None
+
+    def invalidate(self, rect: pygame.Rect = None):
+        """
+        Signale une région de l'écran modifiée, qui sera réaffichée lors du prochain affichage.
+        Sans rectangle, c'est l'écran entier qui est signalé.
+        """
+        self.dirty.append(self.app.screen.get_rect() if rect is None else pygame.Rect(rect))
+
+    def refresh(self):
+        """
+        Méthode appelée avant chaque affichage, permettant de signaler les régions de l'écran
+        modifiées sans évènement (animations, chronomètre...). Par défaut, ne signale rien.
+        """
+        pass
+
+    def step(self):
+        """
+        Méthode appelée à fréquence fixe (voir 'Application.TICKRATE'), indépendamment des évènements et de l'affichage,
+        pour faire avancer la logique de la tâche (déplacements, tours...). Par défaut, ne fait rien.
+        """
+        pass
+
+    def subscribe(self, handler: callable, *types: int):
+        """
+        Abonne une fonction aux évènements des types donnés : elle sera appelée avec chacun d'eux (voir 'dispatch').
+        """
+        for type_ in types:
+            self.handlers.setdefault(type_, []).append(handler)
+
+    def unsubscribe(self, handler: callable, *types: int):
+        """
+        Désabonne une fonction des évènements des types donnés (de tous les types si aucun n'est donné).
+        """
+        for type_ in types or tuple(self.handlers):
+            handlers = self.handlers.get(type_, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+            # Le type n'est plus reçu lorsque plus personne n'y est abonné
+            if len(handlers) == 0:
+                self.handlers.pop(type_, None)
+
     @abc.abstractmethod
     def update(self, event: pygame.event.Event):
         """
         Méthode appelée lors de l'actualisation de la tâche, avec en paramètre un évènement pygame
-        (click de souris, touche pressée/levée ...).
+        (click de souris, touche pressée/levée ...) dont le type fait partie de EVENTS.
         Cette méthode est abstraite et lèvera une exception si elle n'est pas recouverte.
         """
         pass
+
+
+# Polices d'écriture (chargées lors de leur première utilisation, voir 'LazyFont')
+debug_font = LazyFont("consolas", 20, True)
+default_font = LazyFont(None, 30)
+tile_font = LazyFont("consolas", 12, True)
+sans_font = LazyFont("Comic Sans MS", 60, True)
+win_font = LazyFont(None, 60)
@@ -9,76 +9,53 @@ from common import *
 
 # Import d'autres fichiers
 import board
+import goose
 import multiplayer
 import player
+import rules
 
 
 # Définition des classes
 
-class Dice(pygame.sprite.Sprite):
+class Dice(pygame.sprite.Sprite, rules.Dice):
     """
     Classe représentant les deux dés qui pourront être lancés
     par le joueur en appuyant sur la touche "espace". Les dés
     sont lancés de façon aléatoire et ont six faces.
     """
 
-    @staticmethod
-    def random() -> int:
-        """
-        Simule un lancé de dé en retournant un nombre aléatoire entre 1 et 6.
-        """
-        return random.randint(1, 6)
-
     def __init__(self, game: 'Game', position: (int, int)):
         """
         Construit une nouvelle instance de la classe 'Dice' représentant un dé
         et permettant de simuler des lancés de dés.
         """
 
-        # Appel le constructeur de la superclasse
-        super().__init__()
-
-        # La partie en cours
-        self.game = game
+        # Appel les constructeurs des superclasses
+        pygame.sprite.Sprite.__init__(self)
+        rules.Dice.__init__(self, game)
 
-        # Valeur du dé
-        self.value = 1
-        # Si le dé a changé entre temps
-        self.rolled = False
-
-        # Liste contenant tous les sprites de dés allant de 1 à 6
-        self.dices = [
-            pygame.image.load(f"assets/dice/{number + 1}.png").convert()
-            for number in range(6)
-        ]
-
-        # Image par défaut à 0 (1 point)
-        self.image = self.dices[self.value - 1]
+        # Image de la face du dé, depuis l'atlas des textures
+        self.image = get_atlas().get_image(self.texture)
         # Rectangle (position et taille)
         self.rect = self.image.get_rect()
         self.rect.x, self.rect.y = position
-    
-    def get_value(self):
-        """
-        Retourne la valeur du dé et réinitialise l'état du dé.
-        """
 
-        # Réinitialise l'état du dé
-        self.rolled = False
-        # Retourne la valeur du dé
-        return self.value
-    
     def roll(self):
         """
         Lance le dé, change son apparence et sa valeur.
         """
 
-        # Stocke le résultat du lancé de dé
-        self.value = Dice.random()
+        # Lance le dé
+        super().roll()
         # Change l'image du dé au nombre correspondant
-        self.image = self.dices[self.value - 1]
-        # Indique que le dé a été lancé
-        self.rolled = True
+        self.image = get_atlas().get_image(self.texture)
+
+    @property
+    def texture(self) -> str:
+        """
+        Retourne le nom de la texture de la face du dé dans l'atlas.
+        """
+        return f"dice/{self.value}"
 
     def update(self, event: pygame.event.Event):
         """
@@ -94,17 +71,20 @@ class Dice(pygame.sprite.Sprite):
             self.roll()
 
 
-class Game(Task, Savable):
+class Game(rules.Game, Task, Savable):
     """
     Une classe représentant le jeu, elle se différencie par son utilisation et ses attributs :
     La classe Application gère le jeu et les composants graphiques de base (fenêtre),
     ainsi que d'autres choses diverses qui n'ont pas de rapport avec la classe Game.
 
     Elle implémente la classe abstraite/interface ITask, et implémente donc les méthodes
-    display et update.
+    display et update. Les règles (tours, joueurs, vainqueur) sont héritées du moteur de règles.
     """
 
-    MINIMUM = 2
+    MAXIMUM = MAX_PLAYERS
+    TRACKED = True
+    # Types d'évènements reçus par la partie (le menu de pause reçoit aussi ceux des boutons, voir 'pause')
+    EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL)
 
     def __init__(self, app: 'Application'):
         """
@@ -113,17 +93,23 @@ class Game(Task, Savable):
         Il peut être mis en pause avec la méthode pause et être rétabli avec la méthode resume.
         """
 
-        # Appel du constructeur de la superclasse
-        super().__init__(app)
+        # Appel du constructeur de la tâche
+        Task.__init__(self, app)
         # Fichier dans lequel la partie est enregistrée
         self.file = None
         # Erreurs possiblement levées lors de l'exécution du jeu, permettant d'afficher un message
         self.error_message: 'ErrorMessage' or None = None
 
+        # Plateau de jeu et caméra (None lorsque le plateau n'a pas pu être chargé)
+        board_ = None
+        self.camera: 'board.Camera' or None = None
+
         # Tente de générer un plateau à partir des fichiers du jeu
         try:
             # Charge le fichier
-            self.board = board.Board.from_file("data/board.json")
+            board_ = board.Board.from_file("data/board.json")
+            # Crée la caméra, affichant le plateau dans une fenêtre de 8 cases sur 8
+            self.camera = board.Camera(board_, pygame.Rect(64, 64, 8 * board.Tile.WIDTH, 8 * board.Tile.HEIGHT))
         # Si une exception de chargement est levée (probablement de mauvaises valeurs fournies)
         except LoadingException as e:
             # Quitte la partie pour ne pas risquer d'erreurs
@@ -131,8 +117,6 @@ class Game(Task, Savable):
 
         # Mode de jeu (multijoueur)
         self.multiplayer = multiplayer.SAME_MACHINE
-        # Le gagnant de la partie
-        self.winner = None
 
         # Surface sur laquelle sera affiché le message de fin
         width, height = 384, 128
@@ -155,42 +139,40 @@ class Game(Task, Savable):
             Button("Quitter", buttons_size, (buttons_x, 320), self.quit)
         )
 
-        # Liste des joueurs
-        self.players: list['player.Player'] = []
-        self.player_cache: list['player.Player'] = []
-        # Tour de jeu
-        self.turn = 0
         # Si un joueur est en train de jouer
         self.is_playing = False
 
         # Un chronomètre de la partie
         self.timer = time.perf_counter()
 
-        self.add_player()
+        # État des composants (plateau, dés, affichage tête haute) lors du dernier affichage
+        self.displayed = list[tuple]()
+
+        # Appel du constructeur du moteur de règles (plateau, dés et premier joueur)
+        rules.Game.__init__(self, board_, 1)
+
+    def __getstate__(self) -> dict: ...
+
+    def __setstate__(self, state: dict): ...
+
+    def create_dices(self) -> tuple['Dice', ...]:
+        """
+        Construit les dés graphiques de la partie.
+        """
 
         # Définit leur emplacement en x qui est identique
         dices_x = center_width(64, 274) + 576
-        # Ajoute les dés
-        self.dices = (
+        # Retourne les dés
+        return (
             Dice(self, (dices_x, 128)),
             Dice(self, (dices_x, 448))
         )
 
-    def __getstate__(self) -> dict: ...
-
-    def __setstate__(self, state: dict): ...
-
-    def add_player(self):
+    def create_player(self, identifier: int) -> 'player.Player':
         """
-        Stocke un joueur dans la liste des joueurs et des oies.
-        Comme le joueur dans la liste des joueurs est identique
-        au joueur passé en paramètre, si l'on modifie l'oie du joueur,
-        elle sera aussi modifiée dans e groupe de sprite des oies.
+        Construit un joueur graphique, avec la couleur correspondant à son identifiant.
         """
-        identifier = len(self.players)
-        if identifier < MAX_PLAYERS:
-            p = player.Player(self, identifier, geese_colors[identifier])
-            self.players.append(p)
+        return player.Player(self, identifier, get_goose_color(identifier))
 
     def display(self):
         """
@@ -206,16 +188,26 @@ class Game(Task, Savable):
         # Si aucune erreur a été levée
         else:
 
-            # Affiche le plateau de jeu
-            self.board.display()
-            # Affiche les oies
-            for player_ in self.players:
-                self.board.surface.blit(player_.goose.image, player_.goose.rect)
-            # Affiche sur l'écran la surface du plateau
-            self.app.screen.blit(self.board.surface, (64, 64))
-            # Affiche les dés
+            # Si la fenêtre d'affichage du plateau est à réafficher
+            if self.app.screen.get_clip().colliderect(self.camera.viewport):
+
+                # Met à jour la couche statique des cases visibles, puis l'affiche sur l'écran
+                self.board.display(self.camera)
+                self.app.screen.blit(self.camera.surface, self.camera.viewport)
+
+                # Limite l'affichage des oies à la fenêtre d'affichage du plateau
+                clip = self.app.screen.get_clip()
+                self.app.screen.set_clip(clip.clip(self.camera.viewport))
+
+                # Affiche les oies par-dessus la couche statique, en une seule fois
+                self.app.screen.blits(self.get_geese_blits(), doreturn=False)
+
+                # Rétablit la zone d'affichage
+                self.app.screen.set_clip(clip)
+
+            # Affiche les dés depuis l'atlas des textures
             for dice in self.dices:
-                self.app.screen.blit(dice.image, dice.rect)
+                get_atlas().blit(self.app.screen, dice.texture, dice.rect)
             # Affiche l'affichage tête haute du joueur en train de jouer
             self.get_player().hud.display()
 
@@ -230,39 +222,85 @@ class Game(Task, Savable):
             # Afficher le menu de pause
             self.pause_menu.draw(self.app.screen)
 
-    def enough_players(self) -> bool:
+    def get_geese_blits(self) -> list[tuple[pygame.Surface, (int, int)]]:
         """
-        Indique si le nombre de joueurs nécessaire pour une partie est atteint.
+        Retourne la liste des images des oies visibles à afficher sur l'écran, avec leur position,
+        à la taille correspondant au zoom de la caméra.
+        Les oies d'une même case sont empilées, au plus 'goose.Goose.STACK' d'entre elles,
+        avec un badge indiquant leur nombre lorsqu'elles sont plus nombreuses.
         """
-        return len(self.players) >= Game.MINIMUM
 
-    def get_player(self) -> 'player.Player':
+        # Regroupe les oies par position affichée (interpolée entre les deux derniers pas de temps),
+        # dans l'ordre des joueurs
+        stacks = dict[(int, int), list['goose.Goose']]()
+        for player_ in self.players:
+            stacks.setdefault(player_.goose.get_position(self.app.interpolation), []).append(player_.goose)
+
+        # Taille des oies, et décalage entre les oies empilées
+        size = self.camera.tile_size
+        offset = max(size // 10, 1)
+
+        # Pour chaque case occupée
+        blits = []
+        for topleft, geese in stacks.items():
+            x, y = self.camera.to_screen(topleft)
+            x, y = x + self.camera.viewport.x, y + self.camera.viewport.y
+
+            # Si la case n'est pas visible, ses oies ne sont pas affichées
+            if not self.camera.viewport.colliderect(x, y, size, size):
+                continue
+
+            # Empile les dernières oies de la case
+            for index, goose_ in enumerate(geese[-goose.Goose.STACK:]):
+                blits.append((goose_.get_image(size), (x + index * offset, y - index * offset)))
+
+            # S'il y a trop d'oies pour les empiler, affiche leur nombre
+            if len(geese) > goose.Goose.STACK:
+                badge = goose.load_badge(len(geese))
+                blits.append((badge, (x + size - badge.get_width(), y)))
+
+        # Retourne les images à afficher
+        return blits
+
+    def get_roll(self) -> 'player.Player' or None:
         """
-        Retourne le joueur en train de jouer (à qui c'est le tour).
+        Retourne le joueur dont le tour doit être joué lors du prochain pas de temps (les dés ont été lancés),
+        ou None s'il n'y en a pas (pas de lancer, partie en pause, terminée, ou sans assez de joueurs).
         """
-        return self.players[self.turn]
 
-    def next_turn(self):
+        # Si la partie ne peut pas avancer
+        if self.paused or self.winner is not None or self.error_message is not None or not self.enough_players():
+            return None
+
+        # Retourne le joueur en cours si les dés ont été lancés
+        return self.get_player() if any(dice.rolled for dice in self.dices) else None
+
+    def get_timeout(self) -> int or None:
         """
-        Passe au tour de l'oie suivante, si la dernière oie à déjà jouée,
-        c'est donc au tour de la première oie.
+        Retourne le délai (en millisecondes) avant le prochain changement de l'affichage sans évènement :
+        0 tant que des oies glissent vers leur case ou qu'un tour doit être joué (voir 'step'),
+        sinon le délai avant la prochaine seconde du chronomètre, ou None lorsque la partie est terminée.
         """
 
-        # S'il reste des joueurs qui n'ont pas encore joué
-        if self.turn < len(self.players) - 1:
-            # Passer au joueur suivant
-            self.turn += 1
-        # Sinon
-        else:
-            # Reprendre depuis le début
-            self.turn = 0
+        # Si des oies glissent, ou si un tour doit être joué, l'affichage est animé
+        if any(player_.goose.sliding for player_ in self.players) or self.get_roll() is not None:
+            return 0
+
+        # Si la partie est terminée ou interrompue par une erreur, l'affichage ne change plus sans évènement
+        if self.winner is not None or self.error_message is not None:
+            return None
+
+        # Délai avant la prochaine seconde écoulée depuis le début de la partie
+        return int((1 - (time.perf_counter() - self.timer) % 1) * 1000) + 1
 
     def pause(self):
         """
         Met le jeu en pause, empêche les éléments tels que le plateau ou les dés d'être mis à jour,
-        mais continuera de les afficher.
+        mais continuera de les afficher. Le menu de pause s'abonne aux évènements de la souris.
         """
         self.paused = True
+        self.subscribe(self.update_pause_menu, *Button.EVENTS)
+        self.invalidate()
 
     def quit(self):
         """
@@ -270,11 +308,59 @@ class Game(Task, Savable):
         """
         self.app.task = self.app.default_task(self.app)
 
+    def refresh(self):
+        """
+        Signale les régions de l'écran modifiées depuis le dernier affichage, en comparant l'état affiché
+        de chaque composant (plateau, dés, affichage tête haute) à son état lors du dernier affichage.
+        """
+
+        # Si une erreur a été levée, l'écran ne change pas
+        if self.error_message is not None:
+            return
+
+        # Régions de l'écran occupées par chaque composant, et état affiché du composant
+        player_ = self.get_player()
+        states = (
+            (
+                (self.camera.viewport,),
+                (
+                    self.camera.x, self.camera.y, self.camera.zoom, self.board.version,
+                    tuple(p.goose.get_position(self.app.interpolation) for p in self.players)
+                )
+            ),
+            (
+                tuple(dice.rect for dice in self.dices),
+                tuple(dice.value for dice in self.dices)
+            ),
+            (
+                player_.hud.rects,
+                (player_.id,)
+            )
+        )
+
+        # Signale les régions des composants dont l'état a changé
+        for (rects, state), previous in zip(states, self.displayed):
+            if state != previous:
+                for rect in rects:
+                    self.invalidate(rect)
+
+        # Enregistre l'état affiché des composants
+        self.displayed = [state for _, state in states]
+
+        # Met à jour les champs modifiés de l'affichage tête haute, et signale leurs régions
+        player_.hud.refresh()
+        for rect in player_.hud.dirty:
+            self.invalidate(rect)
+        player_.hud.dirty.clear()
+
     def resume(self):
         """
         Rétablit le jeu là où il s'était arrêté et arrête la pause.
+        Le menu de pause se désabonne des évènements (les mouvements de la souris ne sont alors plus reçus).
         """
         self.paused = False
+        self.unsubscribe(self.update_pause_menu)
+        self.invalidate()
 
     def save(self):
         """
@@ -293,13 +379,39 @@ class Game(Task, Savable):
         with open(self.file, "wb") as file:
             pickle.dump(self, file)
 
+        # La liste des sauvegardes gardée en mémoire n'est plus à jour
+        list_saves.cache_clear()
+
+    def step(self):
+        """
+        Fait avancer la partie d'un pas de temps (voir 'Application.step'), indépendamment des évènements
+        et de l'affichage : les oies glissent vers leur case, puis, si les dés ont été lancés et qu'aucune oie
+        ne glisse, le tour du joueur en cours est joué et la caméra suit son oie.
+        """
+
+        # Si une erreur a été levée, ou que le jeu est en pause, la partie n'avance pas
+        if self.error_message is not None or self.paused:
+            return
+
+        # Fait glisser les oies vers leur case
+        for player_ in self.players:
+            player_.goose.step(goose.Goose.SPEED * self.app.timestep)
+
+        # Si un tour doit être joué et qu'aucune oie ne glisse
+        player_ = self.get_roll()
+        if player_ is not None and not any(other.goose.sliding for other in self.players):
+
+            # Joue le tour, et la caméra suit l'oie du joueur
+            player_.play()
+            self.camera.focus(player_.goose.get_target())
+
     def update(self, event: pygame.event.Event):
         """
         Met à jour le jeu.
-        Lorsque le jeu est en pause, les boutons du menu de pause sont mis à jour,
-        mais les autres éléments sont bloqués et ne sont pas mis à jour.
-        Lorsque le jeu n'est pas en pause, le menu de pause n'est pas mis à jour,
-        et le plateau du jeu, les oies et les dés le sont.
+        Lorsque le jeu est en pause, les autres éléments sont bloqués et ne sont pas mis à jour
+        (les boutons du menu de pause sont mis à jour séparément, voir 'update_pause_menu').
+        Lorsque le jeu n'est pas en pause, la caméra et le joueur en cours reçoivent les évènements
+        dont ils déclarent le type.
         """
 
         # Si une erreur a été levée lors de l'exécution du jeu
@@ -318,9 +430,6 @@ class Game(Task, Savable):
                 # Rétablir le jeu
                 self.resume()
 
-            # Met à jour les boutons de l'écran de pause
-            self.pause_menu.update(event)
-
         # Si le jeu a un vainqueur
         elif self.winner is not None:
 
@@ -359,17 +468,28 @@ class Game(Task, Savable):
                     # Si des joueurs sont sauvegardés dans le cache
                     if len(self.player_cache) > 0:
                         # Ramener le dernier joueur aillant quitté
-                        self.players.append(self.player_cache.pop(-1))
+                        self.restore_player()
                     # Sinon
                     else:
                         # Créer un joueur
                         self.add_player()
 
-            # Met à jour le plateau de jeu
-            self.board.update(event)
+            # Met à jour la caméra
+            if event.type in board.Camera.EVENTS:
+                self.camera.update(event)
 
             # Met à jour le joueur en train de jouer
-            self.get_player().update(event)
+            if event.type in player.Player.EVENTS:
+                self.get_player().update(event)
+
+    def update_pause_menu(self, event: pygame.event.Event):
+        """
+        Met à jour les boutons du menu de pause avec un évènement de la souris, et les réaffiche.
+        N'est abonnée aux évènements que pendant la pause (voir 'pause').
+        """
+        self.pause_menu.update(event)
+        for button in self.pause_menu:
+            self.invalidate(button.rect)
 
     def win(self, player_: 'player.Player'):
         """
@@ -377,11 +497,13 @@ class Game(Task, Savable):
         """
 
         # Qualifie le joueur
-        self.winner = player_
+        super().win(player_)
+        # Réaffiche l'écran entier, pour afficher le message de fin
+        self.invalidate()
 
         # Format le message
         self.end_game_message.blit(
-            debug_font.render(f"Victoire du joueur {self.winner.id + 1} !", True, '#FFFFFF'), (24, 32)
+            render_text(debug_font, f"Victoire du joueur {self.winner.id + 1} !", True, '#FFFFFF'), (24, 32)
         )
-        self.end_game_message.blit(debug_font.render("Appuyez sur 'Q' pour quitter.", True, '#FFFFFF'), (24, 80))
+        self.end_game_message.blit(render_text(debug_font, "Appuyez sur 'Q' pour quitter.", True, '#FFFFFF'), (24, 80))
 
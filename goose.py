@@ -8,16 +8,69 @@ from common import *
 
 # Import d'autres fichiers
 import board
-import player
+import rules
+
+
+# Définition des fonctions
+
+@functools.lru_cache(maxsize=None)
+def load_badge(count: int) -> pygame.Surface:
+    """
+    Retourne le badge affichant le nombre d'oies présentes sur une même case.
+    Chaque badge n'est construit qu'une seule fois par processus, puis partagé.
+    """
+
+    # Texte du badge
+    text = render_text(tile_font, str(count), True, '#FFFFFF')
+
+    # Dessine un disque rouge, puis le texte en son centre
+    diameter = max(text.get_size()) + 6
+    badge = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+    pygame.draw.circle(badge, '#D03030', (diameter // 2, diameter // 2), diameter // 2)
+    badge.blit(text, center_surface(text, badge))
+
+    # Retourne le badge
+    return badge
+
+
+@functools.lru_cache(maxsize=None)
+def load_goose(color: tuple, size: int = None) -> pygame.Surface:
+    """
+    Retourne l'image de l'oie dont le blanc est remplacé par une couleur, éventuellement redimensionnée.
+    Chaque couleur et taille n'est construite qu'une seule fois par processus, puis partagée entre toutes les oies
+    de cette couleur : l'image ne doit donc pas être modifiée, mais copiée avant d'y dessiner.
+    """
+
+    # Si une taille est donnée, redimensionne l'image de la couleur
+    if size is not None:
+        image = load_goose(color)
+        return image if size == image.get_width() else pygame.transform.smoothscale(image, (size, size))
+
+    # Copie l'image de l'oie depuis l'atlas des textures
+    image = get_atlas().get_image("goose").copy()
+
+    # Remplace le blanc par la couleur, en une seule opération sur tous les pixels
+    pixels = pygame.PixelArray(image)
+    pixels.replace((255, 255, 255), color)
+    pixels.close()
+
+    # Retourne l'image
+    return image
 
 
 # Définition des classes
 
-class Goose(pygame.sprite.Sprite, Savable):
+class Goose(pygame.sprite.Sprite, rules.Goose, Savable):
     """
     Classe représentant l'oie que contrôle le joueur.
+    L'oie graphique hérite de l'oie du moteur de règles, qui gère ses déplacements.
     """
 
+    # Nombre maximum d'oies affichées empilées sur une même case (au-delà, un badge affiche leur nombre)
+    STACK = 3
+    # Vitesse de l'oie lorsqu'elle glisse vers sa case (en pixels du plateau par seconde)
+    SPEED = 1200
+
     def __init__(self, player_: 'player.Player', color: str or list or tuple):
         """
         Construit une nouvelle instance de la classe Goose représentant une oie.
@@ -25,28 +78,24 @@ class Goose(pygame.sprite.Sprite, Savable):
         Elle est aussi un sprite (possède donc un rectangle et une image) ainsi que des booléens
         renseignant sur ses animations.
         """
-        # Appelle le constructeur de la superclasse
-        super().__init__()
-
-        # Le joueur associé à l'oie
-        self.player = player_
+        # Appelle les constructeurs des superclasses
+        pygame.sprite.Sprite.__init__(self)
+        rules.Goose.__init__(self, player_)
 
         # Définit la couleur de l'oie
         self.color = color
 
-        # Image de l'oie
-        self.image = pygame.image.load("assets/goose.png").convert_alpha()
-        self.change_color(self.color, (255, 255, 255))
+        # Images de l'oie redimensionnées, selon leur taille
+        self.images = dict[int, pygame.Surface]()
 
-        # Rectangle de l'oie
+        # Image de l'oie, partagée entre les oies de même couleur
+        self.image = load_goose(self.get_color_key())
+
+        # Rectangle de l'oie (sa position affichée lors du dernier pas de temps), et position lors du pas précédent
         self.rect = self.image.get_rect()
         self.rect.x = board.Tile.WIDTH
         self.rect.y = 0
-
-        # Attributs relatifs à la position de l'oie
-        self.position = 1
-        self.last_position = 0
-        self.finished = False
+        self.previous = self.rect.topleft
 
         # Attributs relatifs aux animations et à l'état de l'oie
         self.animating = False
@@ -67,7 +116,7 @@ class Goose(pygame.sprite.Sprite, Savable):
         conditions = (
             not self.animating,
             not self.moving,
-            0 < position < self.player.game.board.size
+            super().able_to_move(position)
         )
 
         # Vérifie que toutes les conditions sont vraies
@@ -80,90 +129,82 @@ class Goose(pygame.sprite.Sprite, Savable):
         Les couleurs doivent être de type RGB ou RGBA, avec des valeurs comprises entre 0 et 255.
         Au-delà, une erreur est levée par pygame.
         """
-        for x in range(self.image.get_width()):
-            for y in range(self.image.get_height()):
-                if self.image.get_at((x, y)) == old:
-                    self.image.set_at((x, y), new)
-
-    def go_to(self, position: int):
-        """
-        Déplace l'oie à une position donnée, si elle est atteignable.
-        """
 
-        # Permet de déterminer si le joueur a sauvé un autre joueur durant le calcul
-        has_rescued = False
-        # Permet de déterminer si le joueur a bougé
-        has_moved = False
+        # Copie l'image, qui peut être partagée avec d'autres oies
+        self.image = self.image.copy()
 
-        # Si l'oie est capable de se déplacer sur la case à la position donnée
-        if self.able_to_move(position):
+        # Remplace la couleur, en une seule opération sur tous les pixels
+        pixels = pygame.PixelArray(self.image)
+        pixels.replace(old, new)
+        pixels.close()
 
-            # Pour chaque joueur
-            for player_ in self.player.game.players:
+        # Les images redimensionnées ne correspondent plus à la nouvelle couleur
+        self.images.clear()
 
-                # Si la position est déjà prise par un autre joueur
-                if player_.goose.position == position:
-
-                    to_rescue: list[str] = []
-
-                    # Pour chaque action du joueur
-                    for name, action in player_.effects.items():
-
-                        # Si l'action peut être désactivée par in autre joueur
-                        if action.other_player_rescue:
-
-                            # Ajoute le nom de l'action aux actions à sauver
-                            to_rescue.append(name)
-
-                    # Itère parmi les actions à sauver
-                    for action in to_rescue:
-
-                        # Envoyer des secours
-                        player_.effects.get(action).rescue(self.player)
-                        # Indique que le joueur à sauvé un autre joueur
-                        has_rescued = True
-
-                    # Sauvegarde la dernière position du joueur
-                    current_last_position = self.last_position
-
-                    # Va à la dernière position du joueur
-                    self.last_position = self.position
-                    self.position = player_.goose.last_position
-
-                    # Indique que le joueur s'est déplacé
-                    has_moved = True
+    def get_color_key(self) -> tuple:
+        """
+        Retourne la couleur de l'oie sous forme de tuple RGBA, servant à retrouver ses images partagées.
+        """
+        return tuple(pygame.Color(self.color))
 
-                    # Si le joueur à sauvé un autre joueur
-                    if has_rescued:
+    def get_image(self, size: int) -> pygame.Surface:
+        """
+        Retourne l'image de l'oie à la taille donnée (en pixels),
+        redimensionnée une seule fois par taille puis gardée en mémoire.
+        """
 
-                        # Déplacer le joueur sauvé à la dernière position
-                        player_.goose.last_position = player_.goose.position
-                        player_.goose.position = current_last_position
+        # Si la taille est celle de l'image d'origine
+        if size == self.image.get_width():
+            return self.image
 
-                    # Stoppe la boucle, il est inutile de continuer, il ne peut y avoir plus d'un joueur par case
-                    break
+        # Si l'image est celle partagée par les oies de même couleur, l'image redimensionnée est aussi partagée
+        if self.image is load_goose(self.get_color_key()):
+            return load_goose(self.get_color_key(), size)
 
-            # Si le joueur ne s'est pas encore déplacé
-            if not has_moved:
+        # Redimensionne l'image si elle n'a pas encore été redimensionnée à cette taille
+        if size not in self.images:
+            self.images[size] = pygame.transform.smoothscale(self.image, (size, size))
 
-                # Sinon, va à la position de la case
-                self.last_position = self.position
-                self.position = position
+        # Retourne l'image redimensionnée
+        return self.images[size]
 
-            # Si le joueur n'a sauvé personne
-            if not has_rescued:
-                # Récupère la case et l'active
-                tile = self.player.game.board.tiles.get(self.position)
-                tile.activate(self.position - self.last_position, self.player)
+    def get_position(self, interpolation: float) -> (int, int):
+        """
+        Retourne la position affichée de l'oie (en pixels du plateau), interpolée entre sa position lors du pas
+        de temps précédent et lors du dernier pas de temps (voir 'Application.interpolation').
+        """
+        return (
+            round(self.previous[0] + (self.rect.x - self.previous[0]) * interpolation),
+            round(self.previous[1] + (self.rect.y - self.previous[1]) * interpolation)
+        )
 
-            # Indique que l'opération a fonctionné
-            return True
+    def get_target(self) -> pygame.Rect:
+        """
+        Retourne le rectangle de la case de l'oie (en pixels du plateau), vers lequel elle glisse.
+        """
+        tile = self.player.game.board.tiles.get(self.position)
+        return pygame.Rect(board.Tile.WIDTH * tile.x, board.Tile.HEIGHT * tile.y, board.Tile.WIDTH, board.Tile.HEIGHT)
 
-        # Indique que l'opération a échoué
-        return False
+    @property
+    def sliding(self) -> bool:
+        """
+        Indique si l'oie est en train de glisser vers sa case (ou vient de l'atteindre, lors du dernier pas de temps).
+        """
+        return self.previous != self.rect.topleft or self.rect.topleft != self.get_target().topleft
 
-    def move_of(self, tiles: int) -> bool:
+    def step(self, distance: float):
         """
-        Fait avancer l'oie d'un certain nombre de cases.
+        Fait avancer l'oie d'un pas de temps : elle glisse vers sa case en ligne droite, d'une distance maximale donnée
+        (en pixels du plateau). Sa position lors du pas précédent est gardée pour interpoler l'affichage.
         """
-        return self.go_to(self.position + tiles)
+
+        # Garde la position actuelle, et calcule le chemin restant jusqu'à la case
+        self.previous = self.rect.topleft
+        target = self.get_target().topleft
+        remaining = pygame.Vector2(target) - pygame.Vector2(self.rect.topleft)
+
+        # Avance vers la case, ou l'atteint si elle est assez proche
+        if remaining.length() <= distance:
+            self.rect.topleft = target
+        else:
+            self.rect.topleft = pygame.Vector2(self.rect.topleft) + remaining.normalize() * distance
@@ -3,11 +3,26 @@ Jeu de l'oie en Python 3 avec la bibliothèque Pygame 2.1.2.
 Ceci est un projet de NSI pour classe de Seconde Générale du lycée Ferdinand-Buisson (Voiron).
 """
 
+# Instant du lancement, et mode profil du démarrage (voir 'profile'), activé avant les imports pour les mesurer
+import sys
+import time
+
+STARTED = time.perf_counter()
+PROFILE = "--profile" in sys.argv
+
+if PROFILE:
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
 # Import de 'common.py'
 import pygame
 
 from common import *
 import game
+import rules
 
 
 # variables globales de signature (version, auteurs, license, droits...)
@@ -24,6 +39,23 @@ __version__ = "0.0.0"
 
 # Définition des fonctions
 
+def draw_progress(surface: pygame.Surface, rect: pygame.Rect, progress: float):
+    """
+    Dessine une barre de progression sur une surface : un cadre blanc, rempli selon l'avancement (entre 0 et 1).
+    """
+    pygame.draw.rect(surface, '#FFFFFF', rect, 1)
+    surface.fill('#FFFFFF', pygame.Rect(rect.x, rect.y, round(rect.width * progress), rect.height))
+
+
+def load_tutorial() -> list[str]:
+    """
+    Lit les lignes du fichier du tutoriel (sans les retours à la ligne).
+    Lève une exception si le fichier ne peut pas être lu.
+    """
+    with open("tutorial.txt", "r", encoding="UTF-8") as file:
+        return file.read().splitlines()
+
+
 def main():
     """
     La fonction 'main' est le point d'entrée du programme.
@@ -41,6 +73,36 @@ def main():
     application.start()
 
 
+def profile():
+    """
+    Mode profil du démarrage (python main.py --profile) : mesure le temps passé dans les imports,
+    dans la création de l'application (fenêtre, atlas, polices) et dans le premier affichage de l'écran titre,
+    puis affiche les fonctions les plus coûteuses.
+    Pour le détail du temps d'import de chaque module, utiliser plutôt 'python -X importtime main.py'.
+    """
+
+    # Fin des imports
+    imported = time.perf_counter()
+
+    # Crée l'application
+    application = Application()
+    created = time.perf_counter()
+
+    # Affiche la première image de l'écran titre
+    pygame.display.update(application.display())
+    displayed = time.perf_counter()
+    profiler.disable()
+
+    # Affiche la durée de chaque étape
+    print(f"Imports : {(imported - STARTED) * 1000:.1f} ms")
+    print(f"Création de l'application : {(created - imported) * 1000:.1f} ms")
+    print(f"Première image : {(displayed - created) * 1000:.1f} ms")
+    print(f"Total : {(displayed - STARTED) * 1000:.1f} ms")
+
+    # Affiche les fonctions les plus coûteuses
+    pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(25)
+
+
 # Définition des classes
 
 class Application(Application):
@@ -50,31 +112,174 @@ class Application(Application):
     appeler sa méthode `start` la lance.
     """
 
-    def __init__(self):
+    # Nombre maximum d'images par seconde, lorsque l'affichage est animé (ou en mode à fréquence fixe)
+    FRAMERATE = 144
+    # Nombre de pas de temps de la logique du jeu par seconde, quel que soit le nombre d'images par seconde
+    TICKRATE = 60
+    # Retard maximum (en secondes) rattrapé par la logique du jeu, après un ralentissement de l'affichage
+    MAX_LAG = 0.25
+    # Types d'évènements toujours reçus par l'application (fermeture de la fenêtre, fenêtre à réafficher)
+    EVENTS = (pygame.QUIT, pygame.WINDOWEXPOSED)
+    # Types d'évènements de la fenêtre et du système toujours autorisés, même si rien n'y est abonné
+    # (pygame et SDL peuvent en dépendre pour réafficher ou redimensionner la fenêtre)
+    SYSTEM_EVENTS = (
+        pygame.ACTIVEEVENT, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE,
+        pygame.WINDOWSHOWN, pygame.WINDOWHIDDEN, pygame.WINDOWEXPOSED, pygame.WINDOWMOVED, pygame.WINDOWRESIZED,
+        pygame.WINDOWSIZECHANGED, pygame.WINDOWMINIMIZED, pygame.WINDOWMAXIMIZED, pygame.WINDOWRESTORED,
+        pygame.WINDOWENTER, pygame.WINDOWLEAVE, pygame.WINDOWFOCUSGAINED, pygame.WINDOWFOCUSLOST,
+        pygame.WINDOWCLOSE, pygame.WINDOWTAKEFOCUS, pygame.WINDOWHITTEST
+    )
+
+    def __init__(self, event_driven: bool = True, tickrate: int = TICKRATE):
         """
         Initialise une nouvelle application.
-        Récupère l'écran global dans common, change le titre par le titre du programme
-        et change l'icône de la fenêtre.
+        Crée l'écran (voir 'get_screen' dans common), change le titre par le titre du programme,
+        et démarre le chargement des ressources en arrière-plan pendant l'affichage de l'écran titre
+        (l'icône de la fenêtre est changée une fois l'atlas des textures chargé).
+
+        En mode évènementiel (par défaut), la boucle du jeu attend les évènements lorsque rien ne bouge,
+        et ne tourne à fréquence fixe que pendant les animations (voir 'start').
+        La logique du jeu avance toujours à 'tickrate' pas de temps par seconde (voir 'step').
         """
 
+        # Mode de la boucle du jeu (évènementiel, ou à fréquence fixe)
+        self.event_driven = event_driven
+
+        # Chargeur des ressources : l'atlas des textures, puis le plateau compilé et le tutoriel
+        self.loader = get_loader()
+        self.loader.add("board", rules.load_compiled)
+        self.loader.add("tutorial", load_tutorial)
+        self.loader.start()
+        # Si l'icône de l'application a été changée
+        self.icon = False
+        # Chargeur de la liste des sauvegardes, séparé pour ne pas attendre les ressources (voir 'scan_saves')
+        self.scanner = Loader()
+
         # Appelle le constructeur de la super classe
-        super().__init__(screen, TitleScreen)
+        super().__init__(get_screen(), TitleScreen)
         # Stoppe le jeu
         self.running = False
 
         # Change le titre de l'application
         pygame.display.set_caption(__title__)
-        # Change l'icône de l'application
-        pygame.display.set_icon(pygame.image.load("assets/goose.png").convert_alpha())
 
         self.clock = pygame.time.Clock()
+        # La dernière tâche affichée
+        self.displayed: Task or None = None
 
-    def display(self):
+        # Durée d'un pas de temps (en secondes), temps écoulé pas encore simulé, et instant du dernier calcul
+        self.timestep = 1 / tickrate
+        self.accumulator = 0.0
+        self.last_step = time.perf_counter()
+        # Avancement entre le dernier pas de temps et le suivant (entre 0 et 1), pour interpoler l'affichage
+        self.interpolation = 0.0
+
+        # Types d'évènements autorisés dans la file d'évènements (voir 'filter_events')
+        self.allowed = frozenset[int]()
+
+    def display(self) -> list[pygame.Rect]:
         """
-        Met à jour l'affichage (affiche sur l'écran tous les groupes de sprites et sprites).
+        Met à jour l'affichage : réaffiche les régions modifiées de la tâche en cours,
+        et retourne la liste des rectangles de l'écran réaffichés (vide si rien n'a changé).
+        Les ressources chargées en arrière-plan depuis le dernier affichage sont d'abord terminées.
         """
-        self.screen.fill((0, 0, 0))
-        self.task.display()
+
+        # Termine les ressources chargées, et change l'icône de l'application lorsque l'atlas est prêt
+        self.loader.update()
+        if not self.icon and "atlas" in self.loader.assets:
+            pygame.display.set_icon(get_atlas().get_image("goose"))
+            self.icon = True
+
+        # Signale les régions modifiées sans évènement
+        self.task.refresh()
+
+        # Si la tâche en cours n'a pas encore été affichée, elle est entièrement réaffichée
+        # (une tâche peut en ouvrir une autre lors de son rafraîchissement, comme l'écran de chargement)
+        while self.task is not self.displayed:
+            self.displayed = self.task
+            self.task.invalidate()
+            self.task.refresh()
+
+        # Récupère les régions modifiées de la tâche
+        rects, self.task.dirty = self.task.dirty, []
+
+        # Si des régions ont été modifiées
+        if len(rects) > 0:
+
+            # Limite l'affichage au rectangle englobant les régions modifiées, puis les réaffiche
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+            self.screen.fill((0, 0, 0))
+            self.task.display()
+            self.screen.set_clip(None)
+
+        # Retourne les régions réaffichées
+        return rects
+
+    def filter_events(self):
+        """
+        Limite les évènements reçus aux types auxquels la tâche en cours est abonnée (voir 'Task.subscribe'),
+        en plus de ceux de l'application et de ceux de la fenêtre et du système (voir 'SYSTEM_EVENTS') :
+        les autres (comme les mouvements de la souris) ne sont plus ajoutés à la file d'évènements,
+        et ne réveillent plus la boucle du jeu.
+        Les types autorisés ne sont changés que lorsque la tâche, ou ses abonnements, changent.
+        """
+
+        # Types d'évènements attendus par la tâche en cours et par l'application,
+        # et ceux de la fenêtre et du système
+        allowed = self.task.event_types | frozenset(Application.EVENTS + Application.SYSTEM_EVENTS)
+
+        # Si les types ont changé, bloque tous les évènements puis autorise les types attendus
+        if allowed != self.allowed:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(allowed))
+            self.allowed = allowed
+
+    def get_events(self) -> list[pygame.event.Event]:
+        """
+        Retourne les évènements de la frame actuelle.
+        À fréquence fixe (ou pendant une animation), la frame est d'abord régulée, puis les évènements en attente
+        sont récupérés. En mode évènementiel, la boucle attend le prochain évènement, ou la fin du délai avant le
+        prochain changement de l'affichage (voir 'get_timeout'), sans consommer de temps processeur.
+        """
+
+        # Délai avant le prochain changement de l'affichage sans évènement
+        timeout = self.get_timeout() if self.event_driven else 0
+
+        # Si l'affichage est animé, régule la frame puis récupère les évènements en attente
+        if timeout == 0:
+            self.clock.tick(Application.FRAMERATE)
+            return pygame.event.get()
+
+        # Sinon, attend le prochain évènement (indéfiniment lorsque l'affichage ne change qu'avec les évènements)
+        event = pygame.event.wait() if timeout is None else pygame.event.wait(timeout)
+        self.clock.tick()
+        # Rien ne bougeait pendant l'attente : elle n'est pas simulée par la logique du jeu
+        self.last_step = time.perf_counter()
+
+        # Retourne l'évènement reçu et ceux arrivés entre temps (aucun si le délai est écoulé)
+        return pygame.event.get() if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+
+    def get_timeout(self) -> int or None:
+        """
+        Retourne le délai (en millisecondes) avant le prochain changement de l'affichage sans évènement :
+        0 tant que des ressources sont en cours de chargement (la barre de progression avance),
+        sinon celui de la tâche en cours (voir 'Task.get_timeout').
+        """
+
+        # Si des ressources sont en cours de chargement
+        if not self.loader.ready:
+            return 0
+
+        # Retourne le délai de la tâche
+        return self.task.get_timeout()
+
+    def open(self, task: type):
+        """
+        Remplace la tâche en cours par une nouvelle tâche.
+        Si des ressources sont encore en cours de chargement, un écran de chargement est affiché,
+        et la tâche n'est construite qu'une fois le chargement terminé.
+        """
+        self.task = task(self) if self.loader.ready else LoadingScreen(self, task)
 
     def quit(self):
         """
@@ -88,19 +293,19 @@ class Application(Application):
     def start(self):
         """
         Lance la boucle du jeu.
-        Le jeu tourne à 60 fps (frame per second), et chaque tour de boucle correspond à une frame.
-        Donc pendant execution du jeu, il y aura 60 tours de boucle en moyenne chaque seconde.
-        
+        Chaque tour de boucle correspond à une frame.
+
         L'attribut 'running' n'est pas une variable locale donc le programme peut être arrêté
         à n'importe quel moment, mais il est recommandé d'utiliser la méthode 'self.quit'.
 
-        À chaque tour de boucle, tous les éléments graphiques (sprites, groupes de sprites)
-        sont affichés à l'écran, puis l'écran est rafraîchi pour faire apparaitre les changements,
-        et enfin on met à jour tous les composants pour chaque évènement récupéré.
+        À chaque tour de boucle, la logique du jeu avance à fréquence fixe (voir 'step'), les régions modifiées
+        de l'écran sont réaffichées puis rafraîchies pour faire apparaitre les changements, et enfin on met à jour
+        la tâche en cours pour chaque évènement récupéré.
 
-        L'appel à la méthode `self.clock.tick(60)` permet de régler le jeu sur 60 fps,
-        sans cet appel, le jeu dépasserait les 60 fps, donc la boucle s'exécuterait plus de 60
-        fois par secondes. Cela peut causer des ralentissements, épuiser les ressources de la machine,
+        En mode évènementiel, lorsque rien ne bouge, la boucle attend le prochain évènement (ou le prochain
+        changement de l'affichage, comme le chronomètre de la partie), ce qui laisse le processeur au repos.
+        Pendant les animations, et en mode à fréquence fixe, le jeu est réglé sur 'FRAMERATE' images par seconde :
+        sans cela, la boucle s'exécuterait bien plus souvent, ce qui peut épuiser les ressources de la machine,
         ainsi que créer des décalages entre différentes machines.
         """
 
@@ -110,24 +315,107 @@ class Application(Application):
         # Tant que le jeu est lancé (un tour de boucle par frame).
         while self.running:
 
-            # Met à jour l'affichage.
-            self.display()
-            # Met à jour tous les écrans de pygame.
-            pygame.display.flip()
-            
-            # Capture tous les évènements (click, appui sur une touche...) de la frame actuelle.
-            for event in pygame.event.get():
-
-                # Met à jour la tâche en cours.
-                self.task.update(event)
-                
+            # Fait avancer la logique du jeu, puis met à jour l'affichage.
+            self.step()
+            rects = self.display()
+            # Met à jour uniquement les régions modifiées de l'écran.
+            if len(rects) > 0:
+                pygame.display.update(rects)
+
+            # Capture tous les évènements attendus (click, appui sur une touche...) de la frame actuelle,
+            # en les attendant si rien ne bouge.
+            self.filter_events()
+            for event in self.get_events():
+
+                # Transmet l'évènement aux composants de la tâche en cours abonnés à son type.
+                self.task.dispatch(event)
+                # Si la tâche ne signale pas elle-même les régions modifiées,
+                # ou si la fenêtre doit être réaffichée, tout l'écran est réaffiché.
+                if not self.task.TRACKED or event.type == pygame.WINDOWEXPOSED:
+                    self.task.invalidate()
+
                 # Si l'évènement est celui de fermer la fenêtre.
                 if event.type == pygame.QUIT:
                     # Fermer le jeu.
                     self.quit()
-            
-            # Régule le jeu à 60 fps.
-            self.clock.tick(144)
+
+    def step(self):
+        """
+        Fait avancer la logique de la tâche en cours d'autant de pas de temps fixes (voir 'Task.step')
+        que le temps écoulé depuis le dernier appel en contient, indépendamment du nombre d'images par seconde :
+        le déroulement de la partie est ainsi le même sur toutes les machines.
+        Le temps restant (moins d'un pas) est gardé pour le prochain appel, et sert à interpoler l'affichage.
+        """
+
+        # Ajoute le temps écoulé, limité pour ne pas enchaîner les pas de temps après un ralentissement
+        now = time.perf_counter()
+        self.accumulator += min(now - self.last_step, Application.MAX_LAG)
+        self.last_step = now
+
+        # Fait avancer la tâche d'autant de pas de temps que possible
+        while self.accumulator >= self.timestep:
+            self.task.step()
+            self.accumulator -= self.timestep
+
+        # Avancement vers le prochain pas de temps
+        self.interpolation = self.accumulator / self.timestep
+
+
+class LoadingScreen(Task):
+    """
+    Classe représentant un écran de chargement, affiché en attendant la fin du chargement des ressources
+    avant d'ouvrir une tâche (voir 'Application.open').
+    """
+
+    # L'écran de chargement signale lui-même les régions modifiées (la barre de progression)
+    TRACKED = True
+    # Rectangle de la barre de progression
+    PROGRESS = pygame.Rect(225, 320, 400, 16)
+
+    def __init__(self, app: 'Application', task: type):
+        """
+        Construit une nouvelle instance de la classe 'LoadingScreen', ouvrant la tâche donnée
+        une fois toutes les ressources chargées.
+        """
+
+        # Appel du constructeur de la superclasse
+        super().__init__(app)
+
+        # Tâche à ouvrir, et avancement du chargement lors du dernier affichage
+        self.task = task
+        self.progress = 0.0
+        # Texte affiché au-dessus de la barre de progression
+        self.text = render_text(default_font, "Chargement...", True, '#FFFFFF')
+
+    def display(self):
+        """
+        Affiche le texte de chargement et la barre de progression.
+        """
+        self.app.screen.blit(
+            self.text, (center_width(self.text.get_width(), self.app.screen.get_width()), LoadingScreen.PROGRESS.y - 40)
+        )
+        draw_progress(self.app.screen, LoadingScreen.PROGRESS, self.progress)
+
+    def refresh(self):
+        """
+        Ouvre la tâche lorsque toutes les ressources sont chargées,
+        sinon, réaffiche la barre de progression lorsque l'avancement change.
+        """
+
+        # Si toutes les ressources sont chargées, ouvre la tâche
+        if self.app.loader.ready:
+            self.app.task = self.task(self.app)
+
+        # Sinon, si l'avancement a changé
+        elif self.app.loader.progress != self.progress:
+            self.progress = self.app.loader.progress
+            self.invalidate(LoadingScreen.PROGRESS)
+
+    def update(self, event: pygame.event.Event):
+        """
+        L'écran de chargement ne réagit à aucun évènement.
+        """
+        pass
 
 
 class TitleScreen(Task):
@@ -135,6 +423,11 @@ class TitleScreen(Task):
     Classe représentant l'écran de démarrage du jeu.
     """
 
+    # Rectangle de la barre de progression du chargement des ressources
+    PROGRESS = pygame.Rect(225, 608, 400, 8)
+    # Types d'évènements reçus par l'écran titre (ceux des boutons, et la molette de la souris)
+    EVENTS = ListView.EVENTS
+
     def __init__(self, app: 'Application'):
         """
         Construit une nouvelle instance de la classe TitleScreen.
@@ -146,20 +439,22 @@ class TitleScreen(Task):
         super().__init__(app)
 
         # Images et surfaces de base.
-        text = sans_font.render("Le Jeu De L'Oie", True, (255, 255, 255))
-        goose = pygame.image.load("assets/goose.png").convert_alpha()
+        text = render_text(sans_font, "Le Jeu De L'Oie", True, (255, 255, 255))
 
         # Crée l'image du titre et le centre sur l'écran
+        # (les oies y sont ajoutées une fois l'atlas des textures chargé, voir 'refresh')
         title_size = (576, 64)
         self.title = pygame.Surface(title_size)
-        self.title.blit(goose, (0, 0))
         self.title.blit(text, (64, -16))
-        self.title.blit(goose, (title_size[0] - 64, 0))
+        self.decorated = False
         self.title_position = (
             center_width(title_size[0], self.app.screen.get_width()),
             title_size[1]
         )
 
+        # Avancement du chargement des ressources lors du dernier affichage
+        self.progress = 0.0
+
         # Menu principal et boutons
         button_size = (256, 64)
         screen_width_center = center_width(button_size[0], self.app.screen.get_width())
@@ -171,13 +466,17 @@ class TitleScreen(Task):
             PushButton("Charger", button_size, (screen_width_center, 480), self.save_select)
         )
 
-        # Menu des sauvegardes
+        # Menu des sauvegardes : une liste virtualisée (seules les sauvegardes visibles sont affichées),
+        # remplie en arrière-plan (voir 'save_select')
         self.select = False
-        self.saves = pygame.sprite.Group()
+        self.scanning = False
         save_selector_size = (256, 384)
         self.save_selector_position = (center_width(save_selector_size[0], self.app.screen.get_width()), 192)
-        self.save_selector = pygame.Surface(save_selector_size)
         self.save_selector_rect = pygame.Rect(*self.save_selector_position, *save_selector_size)
+        self.saves = ListView(
+            self.save_selector_rect, (256, 64), 96,
+            lambda name: print("Impossible de charger des parties dans cette version du jeu.")
+        )
 
         def back():
             """
@@ -206,20 +505,23 @@ class TitleScreen(Task):
         """
 
         # Affiche le titre
-        screen.blit(self.title, self.title_position)
+        self.app.screen.blit(self.title, self.title_position)
 
         # Si le menu de sélection des sauvegardes est ouvert
         if self.select:
 
             # Dessine un fond blanc pour les sauvegardes (bordure)
             pygame.draw.rect(self.app.screen, '#FFFFFF', self.border_rect)
-            # Rempli le menu de sélection des sauvegardes de noir
-            self.save_selector.fill('#000000')
-            # Dessine les boutons de sauvegardes
-            self.saves.draw(self.save_selector)
+            # Affiche les sauvegardes visibles
+            self.saves.display(self.app.screen)
+
+            # Si la liste est vide, indique si les sauvegardes sont en cours de recherche, ou s'il n'y en a pas
+            if len(self.saves.items) == 0:
+                text = render_text(
+                    debug_font, "Recherche..." if self.scanning else "Aucune sauvegarde", True, '#FFFFFF'
+                )
+                self.app.screen.blit(text, text.get_rect(center=self.save_selector_rect.center))
 
-            # Affiche le menu sur l'écran
-            self.app.screen.blit(self.save_selector, self.save_selector_rect)
             # Affiche le bouton de retour
             self.app.screen.blit(self.back_button.image, self.back_button.rect)
 
@@ -228,6 +530,17 @@ class TitleScreen(Task):
             # Afficher le menu principal
             self.menu.draw(self.app.screen)
 
+        # Affiche l'avancement du chargement des ressources, tant qu'il n'est pas terminé
+        if self.progress < 1:
+            draw_progress(self.app.screen, TitleScreen.PROGRESS, self.progress)
+
+    def get_timeout(self) -> int or None:
+        """
+        Retourne 0 tant que les sauvegardes sont en cours de recherche (la liste est remplie dès la fin de la
+        recherche, voir 'refresh'), sinon None : l'écran titre ne change alors qu'avec les évènements.
+        """
+        return 0 if self.scanning else None
+
     def load(self, name: str):
         """
         Charge un fichier de sauvegarde et en fait la tâche de l'application en cours.
@@ -240,83 +553,88 @@ class TitleScreen(Task):
 
     def play(self):
         """
-        Crée une tâche jeu remplaçant la tâche de l'écran titre.
+        Crée une tâche jeu remplaçant la tâche de l'écran titre (voir 'Application.open').
         """
-        self.app.task = game.Game(self.app)
+        self.app.open(game.Game)
 
-    def save_select(self):
+    def refresh(self):
         """
-        Ouvre le menu de sélection de sauvegardes et crée dans le groupe de boutons de sauvegardes,
-        un bouton par fichier contenu dans le répertoire des sauvegardes.
+        Ajoute les oies au titre une fois l'atlas des textures chargé,
+        réaffiche la barre de progression lorsque l'avancement du chargement change,
+        et remplit la liste des sauvegardes une fois leur recherche terminée.
         """
 
-        # Vide le groupe de boutons de sauvegardes
-        self.saves.empty()
-
-        # Hauteur par défaut
-        height = 16
+        # Si l'atlas est chargé et que les oies n'ont pas encore été ajoutées au titre
+        if not self.decorated and "atlas" in self.app.loader.assets:
+            goose = get_atlas().get_image("goose")
+            self.title.blit(goose, (0, 0))
+            self.title.blit(goose, (self.title.get_width() - 64, 0))
+            self.decorated = True
+            self.invalidate(pygame.Rect(self.title_position, self.title.get_size()))
+
+        # Si l'avancement du chargement a changé
+        if self.app.loader.progress != self.progress:
+            self.progress = self.app.loader.progress
+            self.invalidate(TitleScreen.PROGRESS)
+
+        # Si la recherche des sauvegardes est terminée
+        if self.scanning and self.app.scanner.update():
+            self.scanning = False
+
+            # Remplit la liste avec les sauvegardes trouvées (aucune si le dossier n'a pas pu être lu)
+            try:
+                self.saves.set_items(self.app.scanner.get("saves"))
+            except OSError as e:
+                print(e)
+                self.saves.set_items(())
+            self.invalidate(self.border_rect)
 
-        # Pour chaque fichier ou dossier contenu dans 'data/saves'
-        for file in os.listdir(access_directory(SAVES_PATH)):
-            path = f"{SAVES_PATH}/{file}"
-
-            # Si l'élément est un fichier
-            if os.path.isfile(path):
-                # Création et ajout d'un bouton chargeant le fichier
-                self.saves.add(
-                    PushButton(
-                        file, (256, 64), (0, height),
-                        lambda: print("Impossible de charger des parties dans cette version du jeu.")
-                    )
-                )
+    def save_select(self):
+        """
+        Ouvre le menu de sélection de sauvegardes, et lance la recherche des fichiers du répertoire des sauvegardes
+        en arrière-plan (voir 'scan_saves') : le menu reste fluide quel que soit le nombre de sauvegardes,
+        et affiche les sauvegardes de la dernière recherche en attendant la fin de la nouvelle.
+        """
 
-            # Incrémente la hauteur
-            height += 96
+        # Lance une nouvelle recherche des sauvegardes, si aucune n'est en cours
+        # (après avoir reçu le résultat d'une recherche lancée par un écran titre précédent)
+        if not self.scanning:
+            self.app.scanner.update()
+            self.app.scanner.forget("saves")
+            self.app.scanner.add("saves", scan_saves)
+            self.app.scanner.start()
+            self.scanning = True
 
         # Indique que le menu de sélection des sauvegardes est ouvert
         self.select = True
 
     def tuto(self):
         """
-        Lance le tutoriel
+        Lance le tutoriel (voir 'Application.open').
         """
-        self.app.task = TutorialScreen(self.app)
+        self.app.open(TutorialScreen)
 
     def update(self, event: pygame.event.Event):
         """
         Met à jour l'écran titre.
         Lorsque l'écran titre est sur le menu principal, seul les boutons principaux sont mis à jour.
         Lorsque l'écran titre est sur le menu de sélection des sauvegardes, chaque bouton de sauvegarde est
-        mis à jour, et il est possible de scroller dans ce menu pour faire défiler les sauvegardes.
+        mis à jour, et il est possible de scroller dans ce menu pour faire défiler les sauvegardes
+        (seuls les boutons des sauvegardes visibles sont mis à jour, voir 'ListView').
         """
 
         # Si le menu de sélection des sauvegardes est ouvert
         if self.select:
 
-            # Si la molette de la souris est actionnée
-            if event.type == pygame.MOUSEWHEEL:
-
-                # Lorsque la molette est actionnée vers le bas
-                if event.y < 0:
-                    # Pour chaque bouton de sauvegarde
-                    for sprite in self.saves:
-                        # Défiler vers le bas
-                        sprite.rect.y -= 96
-
-                # Lorsque la molette est actionnée vers le haut
-                if event.y > 0:
-                    # Pour chaque bouton de sauvegarde
-                    for sprite in self.saves:
-                        # Défiler vers le haut
-                        sprite.rect.y += 96
-
-            # Met à jour les boutons des sauvegardes
-            self.saves.update(event, self.save_selector_position)
+            # Met à jour la liste des sauvegardes (défilement avec la molette, et boutons des lignes visibles)
+            self.saves.update(event)
+
             # Met à jour le bouton de retour
-            self.back_button.update(event)
+            if event.type in PushButton.EVENTS:
+                self.back_button.update(event)
 
-        # Si le menu de sélection des sauvegardes n'est pas ouvert (menu principal)
-        else:
+        # Si le menu de sélection des sauvegardes n'est pas ouvert (menu principal), et que ce n'est pas la molette
+        elif event.type in PushButton.EVENTS:
 
             # Met à jour les boutons principaux
             self.menu.update(event)
@@ -327,6 +645,9 @@ class TutorialScreen(Task):
     Classe représentant un tutoriel.
     """
 
+    # Types d'évènements reçus par le tutoriel (toute touche ou tout click le ferme)
+    EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
     def __init__(self, app: 'Application'):
         """
         Construit une nouvelle instance de 'TutorialScreen' représentant un écran de tutoriel.
@@ -338,28 +659,29 @@ class TutorialScreen(Task):
         # Les lignes du tutoriel
         self.lines = list[pygame.Surface]()
 
-        # Tente de charger le fichier du tutoriel
+        # Tente de récupérer le fichier du tutoriel, lu en arrière-plan par le chargeur des ressources
         try:
-            with open("tutorial.txt", "r", encoding="UTF-8") as file:
-                tutorial = file.readlines()
+            tutorial = get_loader().get("tutorial")
 
-        # Si une erreur survient
-        except FileNotFoundError or OSError:
+        # Si une erreur survient lors du chargement (fichier illisible, encodage invalide...)
+        except Exception:
 
             # Afficher un message d'erreur
             self.lines.append(
-                default_font.render("Le fichier du tutoriel n'a pas pu être chargé", True, '#FFFFFF', '#000000')
+                render_text(default_font, "Le fichier du tutoriel n'a pas pu être chargé", True, '#FFFFFF', '#000000')
             )
 
-        # Sinon, sauvegarder le message d'erreur
+        # Sinon, afficher les lignes du tutoriel
         else:
             for line in tutorial:
                 self.lines.append(
-                    default_font.render(line.replace("\n", ""), True, '#FFFFFF', '#000000')
+                    render_text(default_font, line, True, '#FFFFFF', '#000000')
                 )
 
         # Ajouter un message pour quitter
-        self.lines.append(default_font.render("Appuyez sur une touche pour quitter...", True, '#FFFFFF', '#000000'))
+        self.lines.append(
+            render_text(default_font, "Appuyez sur une touche pour quitter...", True, '#FFFFFF', '#000000')
+        )
 
         # La surface à afficher pour éviter un calcul répétitif à chaque frame
         self.surface = pygame.Surface(self.app.screen.get_size())
@@ -388,16 +710,16 @@ class TutorialScreen(Task):
         Met à jour le tutoriel.
         """
 
-        # Si une touche a été pressée
-        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-
-            # Remettre la tâche par défaut
-            self.app.task = self.app.default_task(self.app)
+        # Une touche a été pressée (voir 'EVENTS'), remettre la tâche par défaut
+        self.app.task = self.app.default_task(self.app)
 
 
 # Vérifie si ce fichier que ce fichier est exécuté et non importé.
 if __name__ == '__main__':
-    # Lance le programme.
-    main()
+    # Lance le programme, ou mesure son démarrage en mode profil.
+    if PROFILE:
+        profile()
+    else:
+        main()
     # Quitte le programme.
     sys.exit()
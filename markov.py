@@ -0,0 +1,212 @@
+"""
+Ce fichier contient l'analyse exacte d'un plateau sous forme de chaîne de Markov absorbante,
+à l'aide de matrices creuses SciPy, sans affichage.
+
+Un état de la chaîne correspond au couple (position, état de l'oie) d'une oie jouant seule,
+observé au début de chacun de ses tours. Les déplacements sont lus dans la table des déplacements
+précalculés du plateau (voir 'simulation.compile_board'), qui réutilise les actions des cases
+et le rebond en fin de plateau.
+
+Une oie prisonnière (puits, prison) ne peut être délivrée que par un autre joueur :
+la probabilité d'être délivré à chaque tour est donc un paramètre de l'analyse.
+Lorsqu'elle est nulle, les états prisonniers sont absorbants, au même titre que la victoire.
+"""
+
+# Imports des bibliothèques
+import argparse
+import numpy
+import scipy.sparse
+import scipy.sparse.linalg
+
+# Import d'autres fichiers
+import rules
+import simulation
+
+
+# Définition des constantes
+
+# Nombre d'états de l'oie par position
+STATES = 3
+
+# Probabilité de chaque distance avec deux dés à six faces
+PROBABILITIES = {distance: (6 - abs(distance - 7)) / 36 for distance in rules.DISTANCES}
+
+
+# Définition des fonctions
+
+def analyze(board_: 'rules.Board', release: float = 0.0) -> 'Analysis':
+    """
+    Construit la chaîne de Markov absorbante d'un plateau et retourne son analyse.
+    'release' correspond à la probabilité, pour une oie prisonnière, d'être délivrée à chaque tour.
+    """
+
+    # Déplacements précalculés
+    destinations, outcomes = simulation.compile_board(board_)
+    size = board_.size
+
+    # Distribution d'arrivée directe de chaque position, sur les couples (position, état) puis les cases de victoire,
+    # et distribution des relances de dés (les relances se comportent comme un déplacement depuis la case atteinte)
+    direct = scipy.sparse.dok_matrix((size, size * STATES + size))
+    rerolls = scipy.sparse.dok_matrix((size, size))
+
+    # Pour chaque position que peut occuper une oie, et chaque distance
+    for position in range(1, size):
+        for distance, probability in PROBABILITIES.items():
+            target, outcome = destinations[position, distance], outcomes[position, distance]
+
+            # Répartit la probabilité selon le résultat du déplacement
+            if outcome == simulation.END:
+                direct[position, size * STATES + target] += probability
+            elif outcome == simulation.REROLL:
+                rerolls[position, target] += probability
+            elif outcome == simulation.STOP:
+                direct[position, target * STATES + simulation.SKIP] += probability
+            elif outcome in (simulation.JAIL, simulation.WELL):
+                direct[position, target * STATES + simulation.CAPTIVE] += probability
+            else:
+                direct[position, target * STATES + simulation.FREE] += probability
+
+    # Distribution d'arrivée de chaque position, relances comprises : L = (I - B)^-1 D
+    landing = scipy.sparse.linalg.spsolve(
+        (scipy.sparse.identity(size) - rerolls.tocsc()).tocsc(), direct.tocsc()
+    )
+    landing = scipy.sparse.csr_matrix(landing)
+
+    # Matrice de transition sur les couples (position, état), et probabilités de victoire en un tour
+    transitions = scipy.sparse.lil_matrix((size * STATES, size * STATES))
+    victories = numpy.zeros(size * STATES)
+    for position in range(1, size):
+
+        # Une oie libre se déplace, ou gagne
+        transitions[position * STATES + simulation.FREE] = landing[position, :size * STATES]
+        victories[position * STATES + simulation.FREE] = landing[position, size * STATES:].sum()
+        # Une oie passant son tour est libérée
+        transitions[position * STATES + simulation.SKIP, position * STATES + simulation.FREE] = 1
+        # Une oie prisonnière est délivrée, ou reste prisonnière
+        transitions[position * STATES + simulation.CAPTIVE, position * STATES + simulation.FREE] = release
+        transitions[position * STATES + simulation.CAPTIVE, position * STATES + simulation.CAPTIVE] = 1 - release
+
+    # Retourne l'analyse
+    return Analysis(size, transitions.tocsr(), victories, landing, release)
+
+
+# Définition des classes
+
+class Analysis:
+    """
+    Une classe représentant l'analyse d'un plateau sous forme de chaîne de Markov absorbante.
+    """
+
+    def __init__(
+            self, size: int, transitions: 'scipy.sparse.csr_matrix', victories: 'numpy.ndarray',
+            landing: 'scipy.sparse.csr_matrix', release: float
+    ):
+        """
+        Construit une nouvelle instance de la classe 'Analysis' à partir de la matrice de transition,
+        des probabilités de victoire en un tour, et des distributions d'arrivée de chaque position.
+        """
+
+        # Taille du plateau et probabilité d'être délivré
+        self.size = size
+        self.release = release
+        # Distributions d'arrivée de chaque position
+        self.landing = landing
+
+        # Indices des états transitoires : positions jouables, et états prisonniers seulement s'ils sont délivrables
+        self.transient = numpy.array([
+            position * STATES + state
+            for position in range(1, size) for state in range(STATES)
+            if state != simulation.CAPTIVE or release > 0
+        ])
+        # Indice de l'état de départ (l'oie commence libre sur la case 1)
+        self.start = int(numpy.searchsorted(self.transient, STATES + simulation.FREE))
+
+        # Matrice des transitions entre états transitoires (Q), et probabilités de victoire en un tour (R)
+        self.q = transitions[self.transient][:, self.transient].tocsc()
+        self.r = victories[self.transient]
+
+        # Matrice I - Q, dont l'inverse est la matrice fondamentale de la chaîne
+        self.fundamental = (scipy.sparse.identity(len(self.transient)) - self.q).tocsc()
+
+        # Probabilités de finir la partie depuis chaque état (b = N R),
+        # et nombre de tours pondéré par la victoire (N b)
+        self.absorption = scipy.sparse.linalg.spsolve(self.fundamental, self.r)
+        self.weighted_turns = scipy.sparse.linalg.spsolve(self.fundamental, self.absorption)
+
+        # Nombre moyen de tours passés dans chaque état depuis le départ (ligne de départ de N)
+        start = numpy.zeros(len(self.transient))
+        start[self.start] = 1
+        self.occupancy = scipy.sparse.linalg.spsolve(self.fundamental.T.tocsc(), start)
+
+    @property
+    def expected_turns(self) -> float:
+        """
+        Retourne le nombre moyen de tours pour finir la partie depuis le départ,
+        parmi les parties qui se terminent.
+        """
+        return self.weighted_turns[self.start] / self.absorption[self.start]
+
+    @property
+    def finish_probability(self) -> float:
+        """
+        Retourne la probabilité de finir la partie depuis le départ (sans rester prisonnier pour toujours).
+        """
+        return self.absorption[self.start]
+
+    def finish_distribution(self, horizon: int = 500) -> 'numpy.ndarray':
+        """
+        Retourne la distribution de la durée de la partie jusqu'à un nombre de tours donné :
+        l'élément d'indice t correspond à la probabilité de finir la partie en exactement t tours.
+        """
+
+        # Distribution des états au début du premier tour
+        distribution = numpy.zeros(len(self.transient))
+        distribution[self.start] = 1
+
+        # Probabilités de finir en t tours
+        result = numpy.zeros(horizon + 1)
+        transposed = self.q.T.tocsr()
+        for turn in range(1, horizon + 1):
+            result[turn] = distribution @ self.r
+            distribution = transposed @ distribution
+
+        # Retourne la distribution
+        return result
+
+    @property
+    def visit_probabilities(self) -> 'numpy.ndarray':
+        """
+        Retourne la proportion des arrivées sur chaque case au cours d'une partie,
+        comparable aux passages comptés par le simulateur.
+        """
+
+        # Nombre moyen de tours passés libre sur chaque position
+        free = numpy.zeros(self.size)
+        for index, state in enumerate(self.transient):
+            if state % STATES == simulation.FREE:
+                free[state // STATES] += self.occupancy[index]
+
+        # Nombre moyen d'arrivées sur chaque couple (position, état) et case de victoire, puis sur chaque case
+        arrivals = self.landing.T @ free
+        visits = arrivals[:self.size * STATES].reshape(self.size, STATES).sum(axis=1) + arrivals[self.size * STATES:]
+
+        # Retourne les proportions
+        return visits / visits.sum()
+
+
+# Vérifie si ce fichier que ce fichier est exécuté et non importé.
+if __name__ == '__main__':
+
+    # Lit les arguments de la ligne de commande
+    parser = argparse.ArgumentParser(description="Analyse un plateau sous forme de chaîne de Markov.")
+    parser.add_argument("board", nargs="?", default=rules.BOARD_PATH, help="Le fichier du plateau.")
+    parser.add_argument("--release", type=float, default=0.0, help="La probabilité d'être délivré à chaque tour.")
+    arguments = parser.parse_args()
+
+    # Analyse le plateau
+    result = analyze(rules.Board.from_file(arguments.board), arguments.release)
+
+    # Affiche les résultats
+    print(f"Probabilité de finir : {result.finish_probability:.2%}")
+    print(f"Durée moyenne : {result.expected_turns:.2f} tours")
+    print("Arrivées par case :", ", ".join(f"{rate:.3f}" for rate in result.visit_probabilities))
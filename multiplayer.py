@@ -40,8 +40,8 @@ class Socket(socket.socket):
     SERVER = 1
     CLIENT = 2
 
-    # Récupère l'IPv4 de la machine locale (valeur par défaut)
-    ADDRESS = socket.gethostbyname(socket.gethostname())
+    # L'IPv4 de la machine locale (valeur par défaut), résolue lors de la première utilisation (voir 'get_address')
+    ADDRESS: str or None = None
     # Le port sur lequel vont se créer les connexions (valeur par défaut)
     PORT = 50600
 
@@ -62,7 +62,7 @@ class Socket(socket.socket):
         
         # Valeur par défaut du nom de l'hôte
         if address is None:
-            address = Socket.ADDRESS
+            address = Socket.get_address()
         self.address = address
 
         # Valeur par défaut du port
@@ -72,7 +72,19 @@ class Socket(socket.socket):
 
         # Définit le socket comme inutilisé (non-serveur et non-client)
         self.connection = Socket.UNUSED
-    
+
+    @staticmethod
+    def get_address() -> str:
+        """
+        Retourne l'IPv4 de la machine locale.
+        La résolution du nom de la machine peut être lente, elle n'est donc faite qu'au premier appel.
+        """
+
+        # Résout l'adresse lors du premier appel
+        if Socket.ADDRESS is None:
+            Socket.ADDRESS = socket.gethostbyname(socket.gethostname())
+        return Socket.ADDRESS
+
     def get_host(self):
         """
         Retourne un tuple (<adresse_de_l_hôte>, <port>) pour créer un serveur.
@@ -7,10 +7,9 @@ représentant un joueur.
 from common import *
 
 # Imports d'autres fichiers
-import actions
 import board
-import game
 import goose
+import rules
 
 
 # Définition des classes
@@ -20,8 +19,18 @@ class HeadUpDisplay:
     Une classe représentant un affichage tête haute,
     permettant de récupérer et d'afficher des informations pour le joueur.
     Les affichages tête haute sont différents pour chaque joueur.
+
+    L'affichage est incrémental : chaque champ (chronomètre, tour, couleur, effets) n'est redessiné
+    que lorsque sa valeur change, et les régions de l'écran modifiées sont signalées au jeu.
     """
 
+    # Régions des champs de la barre du haut (tour du joueur, couleur, effets en cours)
+    TURN = pygame.Rect(0, 0, 340, 48)
+    COLOR = pygame.Rect(452, 8, 32, 32)
+    EFFECTS = pygame.Rect(740, 0, 110, 48)
+    # Taille des icônes des effets en cours
+    ICON = 32
+
     def __init__(self, player: 'Player'):
         """
         Construit une nouvelle instance de la classe 'HeadUpDisplay' représentant
@@ -33,182 +42,134 @@ class HeadUpDisplay:
         # Raccourci à l'application
         self.app = self.player.game.app
 
-        # Surface d'affichage des statistiques
+        # Surfaces de la barre du haut et d'affichage des statistiques
+        self.bar = pygame.Surface((screen_size[0], 48))
         self.time = pygame.Surface((screen_size[0], 32))
 
-    def display(self):
-        """
-        Affiche les informations à l'écran.
-        """
-
-        # Récupère le temps écoulé depuis le début de la partie et en fait une structure de temps
-        current_time = time.gmtime(time.perf_counter() - self.player.game.timer)
-        # Formate le temps de la manière %H:%M:%S
-        statistic_text = default_font.render(
-            time.strftime("Vous jouez depuis : %H:%M:%S", current_time),
-            True, (255, 255, 255), (0, 0, 0)
-        )
-        # Affiche l'heure sur la surface des statistiques
-        self.time.blit(statistic_text, center_surface(statistic_text, self.time))
-        # Affiche sur l'écran le temps écoulé
-        self.app.screen.blit(self.time, (0, 600))
-
-        # Si le joueur n'est pas seul
-        if self.player.game.enough_players():
-            # Affiche à l'écran le tour du joueur
-            self.app.screen.blit(
-                default_font.render(f"Au tour du Joueur {self.player.id + 1}", True, '#FFFFFF', '#000000'),
-                (16, 16)
-            )
-        # Sinon
-        else:
-            # Affiche à l'écran le tour du joueur
-            self.app.screen.blit(
-                default_font.render(f"En attente d'autres joueurs...", True, '#FFFFFF', '#000000'),
-                (16, 16)
-            )
-
-        # Affiche à l'écran la couleur du joueur
-        self.app.screen.blit(default_font.render("Couleur :", True, '#FFFFFF', '#000000'), (356, 16))
-        pygame.draw.rect(self.app.screen, self.player.goose.color, pygame.Rect(452, 8, 32, 32))
-
-        # Affiche à l'écran la liste des effets en cours
-        self.app.screen.blit(default_font.render("Effets en cours :", True, '#FFFFFF', '#000000'), (560, 16))
-        # Affiche à l'écran la liste des effets en cours
-        for index, effect in enumerate(self.player.effects):
-            self.app.screen.blit(
-                pygame.transform.scale(self.player.effects[effect].tile.image, (32, 32)),
-                (740 + 40 * index, 8)
-            )
+        # Régions de l'écran occupées par l'affichage tête haute (barre du haut et statistiques)
+        self.rects = (pygame.Rect(0, 0, screen_size[0], 48), pygame.Rect(0, 600, screen_size[0], 32))
 
+        # Valeur affichée de chaque champ, et régions de l'écran modifiées depuis le dernier affichage
+        self.values = dict[str, object]()
+        self.dirty = list[pygame.Rect]()
 
-class Player(Savable):
-    """
-    Une classe représentant un joueur. Un joueur est en général plus qu'une simple oie,
-    et contiendra des informations plus diverses, comme des statistiques ou l'adresse IPv4.
-    """
+        # Affiche les textes fixes de la barre du haut
+        self.bar.blit(render_text(default_font, "Couleur :", True, '#FFFFFF', '#000000'), (356, 16))
+        self.bar.blit(render_text(default_font, "Effets en cours :", True, '#FFFFFF', '#000000'), (560, 16))
 
-    def __init__(self, game_: 'game.Game', identifier: int, color: list[int] or tuple[int]):
+    def change(self, field: str, value, rect: pygame.Rect) -> bool:
         """
-        Construit une nouvelle instance de la classe 'Player' représentant un joueur.
-        Un joueur est associé à un jeu, possède un identifiant correspondant à son indice dans le dictionnaire
-        des joueurs du jeu, ainsi qu'une oie et des effets.
+        Enregistre la nouvelle valeur d'un champ, et retourne un booléen indiquant si elle a changé.
+        Lorsque c'est le cas, la région de l'écran du champ est signalée comme modifiée.
         """
 
-        # Le jeu
-        self.game = game_
-
-        # L'identifiant
-        self.id = identifier
-
-        # Les effets du joueur
-        self.effects: dict[str, 'actions.Action'] = {}
-
-        # L'état du joueur (False lui permet de se mouvoir, et True non)
-        self.stopped = False
+        # Si la valeur n'a pas changé depuis le dernier affichage
+        if field in self.values and self.values[field] == value:
+            return False
 
-        # L'oie du joueur
-        self.goose = goose.Goose(self, color)
+        # Enregistre la valeur et signale la région du champ
+        self.values[field] = value
+        self.dirty.append(rect)
+        return True
 
-        # L'affichage tête haute
-        self.hud = HeadUpDisplay(self)
-
-    def __getstate__(self) -> dict: ...
-
-    def __setstate__(self, state: dict): ...
+    def display(self):
+        """
+        Affiche les informations à l'écran, telles qu'elles ont été dessinées lors de la dernière mise à jour.
+        """
+        self.app.screen.blit(self.bar, self.rects[0])
+        self.app.screen.blit(self.time, self.rects[1])
 
-    def add_effect(self, name: str, action: 'actions.Action') -> 'actions.Action':
+    def refresh(self):
         """
-        Ajoute l'action donnée dans le dictionnaire des effets ainsi que dans son HUD,
-        puis retourne l'action.
+        Met à jour les champs de l'affichage tête haute, en ne redessinant que ceux dont la valeur a changé :
+        le chronomètre n'est ainsi redessiné qu'une fois par seconde.
         """
 
-        # Ajout dans le dictionnaire
-        self.effects[name] = action
+        # Si le nombre de secondes écoulées depuis le début de la partie a changé
+        if self.change('time', int(time.perf_counter() - self.player.game.timer), self.rects[1]):
 
-        # Retourne l'action
-        return action
+            # Formate le temps de la manière %H:%M:%S
+            statistic_text = render_text(
+                default_font, time.strftime("Vous jouez depuis : %H:%M:%S", time.gmtime(self.values['time'])),
+                True, (255, 255, 255), (0, 0, 0)
+            )
+            # Affiche l'heure sur la surface des statistiques
+            self.time.fill('#000000')
+            self.time.blit(statistic_text, center_surface(statistic_text, self.time))
 
-    def dice_move(self) -> int:
-        """
-        Fait avancer le joueur en fonction des dés.
-        """
+        # Si le tour a changé (le joueur n'est pas seul, ou est en attente d'autres joueurs)
+        if self.change('turn', self.player.game.enough_players(), HeadUpDisplay.TURN):
+            self.bar.fill('#000000', HeadUpDisplay.TURN)
 
-        # Marque la distance à parcourir
-        distance = 0
+            # Si le joueur n'est pas seul
+            if self.values['turn']:
+                # Affiche le tour du joueur
+                text = render_text(default_font, f"Au tour du Joueur {self.player.id + 1}", True, '#FFFFFF', '#000000')
+            # Sinon
+            else:
+                # Affiche l'attente d'autres joueurs
+                text = render_text(default_font, f"En attente d'autres joueurs...", True, '#FFFFFF', '#000000')
+            self.bar.blit(text, (16, 16))
 
-        # Parcours tous les dés du jeu
-        for dice in self.game.dices:
+        # Si la couleur du joueur a changé
+        if self.change('color', self.player.goose.color, HeadUpDisplay.COLOR):
+            pygame.draw.rect(self.bar, self.player.goose.color, HeadUpDisplay.COLOR)
 
-            # Si le dé a été lancé durant le tour
-            if dice.rolled:
+        # Si la liste des effets en cours a changé
+        if self.change('effects', tuple(self.player.effects), HeadUpDisplay.EFFECTS):
+            self.bar.fill('#000000', HeadUpDisplay.EFFECTS)
 
-                # Ajoute la valeur du dé la distance et réinitialise l'état du dé
-                distance += dice.get_value()
+            # Atlas des textures à la taille des icônes, dont les miniatures sont partagées entre toutes les cases
+            atlas = get_atlas().get_scaled(HeadUpDisplay.ICON / board.Tile.WIDTH)
 
-        # Fait avancer le joueur
-        self.move_of(distance)
+            # Affiche la liste des effets en cours, avec la miniature de leur case
+            for index, effect in enumerate(self.player.effects):
+                atlas.blit(self.bar, self.player.effects[effect].tile.texture, (740 + 40 * index, 8))
 
-        # Retourne la distance parcourue
-        return distance
 
-    def discard_effect(self, name: str) -> 'actions.Action':
-        """
-        Supprime l'effet du dictionnaire des effets du joueur, ainsi que de son HUD.
-        """
+class Player(rules.Player, Savable):
+    """
+    Une classe représentant un joueur. Un joueur est en général plus qu'une simple oie,
+    et contiendra des informations plus diverses, comme des statistiques ou l'adresse IPv4.
+    Le joueur graphique hérite du joueur du moteur de règles, et y ajoute une oie graphique et un HUD.
+    """
 
-        # Retire l'action du dictionnaire des effets
-        return self.effects.pop(name, self)
+    # Types d'évènements auxquels le joueur réagit (lancer des dés)
+    EVENTS = (pygame.KEYDOWN,)
 
-    def move_of(self, distance: int):
+    def __init__(self, game_: 'game.Game', identifier: int, color: list[int] or tuple[int]):
         """
-        Semblable à self.goose.move_of() mais fait reculer l'oie lorsqu'elle va trop loin.
+        Construit une nouvelle instance de la classe 'Player' représentant un joueur.
+        Un joueur est associé à un jeu, possède un identifiant correspondant à son indice dans le dictionnaire
+        des joueurs du jeu, ainsi qu'une oie et des effets.
         """
 
-        # Si le joueur n'est pas stoppé et que la distance à parcourir n'est pas nulle
-        if not self.stopped and distance != 0:
-            
-            # Avancer
-            if not self.goose.move_of(distance) and not self.stopped:
-                
-                # S'il est impossible d'avancer, reculer
-                self.goose.move_of(-distance)
+        # La couleur de l'oie du joueur
+        self.color = color
 
-    def play(self):
-        """
-        Lance le tour du joueur.
-        """
+        # Appel du constructeur de la superclasse
+        super().__init__(game_, identifier)
 
-        # Fait avancer de la valeur des dés et vérifie si la distance parcourue n'est pas nulle
-        if self.dice_move() > 0:
+        # L'affichage tête haute
+        self.hud = HeadUpDisplay(self)
 
-            # Passe au tour suivant
-            self.game.next_turn()
+    def __getstate__(self) -> dict: ...
 
-    def quit(self):
+    def __setstate__(self, state: dict): ...
+
+    def create_goose(self) -> 'goose.Goose':
         """
-        Fait quitter le joueur du jeu. Sauvegarde sa progression.
+        Construit l'oie graphique du joueur, de la couleur du joueur.
         """
-
-        # Ajoute le joueur au cache des joueurs en le supprimant des joueurs actifs
-        self.game.player_cache.append(self.game.players.pop(self.id))
+        return goose.Goose(self, self.color)
 
     def update(self, event: pygame.event.Event):
         """
-        Met à jour l'oie (placement).
+        Met à jour les dés du joueur (lancer avec la barre espace).
+        Le tour n'est pas joué ici, mais lors du prochain pas de temps de la partie (voir 'game.Game.step').
         """
 
-        # S'il y a assez de joueurs
+        # S'il y a assez de joueurs, met à jour les dés
         if self.game.enough_players():
-
-            # Met à jour les dés
             for dice in self.game.dices:
                 dice.update(event)
-
-            # Fait jouer le joueur
-            self.play()
-
-        # Met à jour la position de l'oie
-        tile = self.game.board.tiles.get(self.goose.position)
-        self.goose.rect.x = board.Tile.WIDTH * tile.x
-        self.goose.rect.y = board.Tile.HEIGHT * tile.y
@@ -0,0 +1,1463 @@
+"""
+Ce fichier contient le moteur de règles du jeu, indépendant de pygame :
+le plateau (disposition et cases), les oies et leurs positions, les joueurs et leurs effets,
+l'ordre des tours et la détection du vainqueur.
+
+Ce fichier n'inclut pas 'common.py' et ne doit inclure aucun fichier graphique,
+il permet ainsi de jouer des parties sans fenêtre (serveurs, simulations...).
+Les classes graphiques des fichiers 'board.py', 'goose.py', 'player.py' et 'game.py'
+héritent des classes de ce fichier et y ajoutent l'affichage.
+"""
+
+# Imports des bibliothèques
+import bisect
+import functools
+import hashlib
+import json
+import math
+import os
+import random
+import struct
+import types
+
+# Import d'autres fichiers
+import actions
+import archive
+
+
+# Définition des constantes
+
+BOARD_PATH = "data/board.json"
+TILES_PATH = "data/tiles.json"
+# Dossier des plateaux compilés (voir 'load_compiled')
+CACHE_PATH = "data/cache"
+
+# Distances possibles avec deux dés à six faces
+DISTANCES = range(2, 13)
+
+
+# Définition des fonctions
+
+@functools.lru_cache(maxsize=None)
+def load_board(file_name: str = BOARD_PATH) -> types.MappingProxyType:
+    """
+    Charge les informations d'un plateau (dimensions et noms des cases) depuis un fichier JSON.
+    Comme pour les définitions des cases, le fichier n'est lu qu'une seule fois par processus,
+    les informations sont ensuite partagées et ne peuvent donc pas être modifiées.
+    """
+    return types.MappingProxyType(load_json(file_name))
+
+
+def load_bytes(file_name: str) -> bytes:
+    """
+    Lit le contenu d'un fichier, depuis l'archive des ressources si elle le contient (voir 'archive.py').
+    Lève une exception de disposition si le fichier est introuvable.
+    """
+
+    # Tente d'ouvrir et de lire le fichier
+    try:
+        with archive.open_file(file_name) as file:
+            return file.read()
+
+    # Si le fichier est introuvable
+    except FileNotFoundError:
+        # Lève une exception de disposition
+        raise LayoutException(file_name, "Cannot load a file that does not exist!")
+
+
+@functools.lru_cache(maxsize=None)
+def load_compiled(
+        file_name: str = BOARD_PATH, tiles_file: str = TILES_PATH, cache: str = CACHE_PATH
+) -> 'CompiledBoard':
+    """
+    Retourne le plateau compilé à partir des fichiers du plateau et des cases (voir 'CompiledBoard').
+    Le plateau compilé est enregistré dans le dossier 'cache', sous le nom de l'empreinte des fichiers
+    (et du code des règles et des actions, dont dépendent les déplacements) : il n'est recompilé que lorsque
+    l'un d'eux change, puis il n'est lu qu'une seule fois par processus.
+    Lève une exception de disposition si un fichier est invalide.
+    """
+
+    # Calcule l'empreinte des fichiers du plateau et des cases, du code des règles et des actions
+    digest = hashlib.sha256(CompiledBoard.MAGIC + bytes([CompiledBoard.VERSION]))
+    sources = (load_bytes(file_name), load_bytes(tiles_file), read_source(__file__), read_source(actions.__file__))
+    for content in sources:
+        digest.update(len(content).to_bytes(8, 'little') + content)
+    path = os.path.join(cache, f"{digest.hexdigest()[:32]}.board")
+
+    # Tente de lire le plateau compilé
+    try:
+        with open(path, "rb") as file:
+            return CompiledBoard.from_bytes(file.read())
+
+    # Si le plateau n'a pas encore été compilé, ou que le fichier est invalide
+    except (OSError, ValueError, struct.error):
+        pass
+
+    # Compile le plateau, puis tente de l'enregistrer (le dossier peut ne pas être accessible en écriture)
+    compiled = CompiledBoard.from_board(Board.from_json(file_name, tiles_file))
+    try:
+        os.makedirs(cache, exist_ok=True)
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(compiled.to_bytes())
+        os.replace(f"{path}.tmp", path)
+    except OSError:
+        pass
+
+    # Retourne le plateau compilé
+    return compiled
+
+
+def load_json(file_name: str) -> dict:
+    """
+    Charge le contenu d'un fichier JSON, depuis l'archive des ressources si elle le contient (voir 'archive.py').
+    Lève une exception de disposition si le fichier est introuvable ou illisible.
+    """
+
+    # Tente de charger le contenu du fichier
+    try:
+        return json.loads(load_bytes(file_name))
+
+    # S'il n'est pas possible de lire le fichier
+    except json.JSONDecodeError as error:
+        # Lève une exception de disposition
+        raise LayoutException(file_name, error.msg)
+
+
+@functools.lru_cache(maxsize=None)
+def load_tiles(file_name: str = TILES_PATH) -> types.MappingProxyType:
+    """
+    Charge les définitions des cases (nom de la case et nom de son action) depuis un fichier JSON.
+    Le fichier n'est lu qu'une seule fois par processus, les définitions sont ensuite partagées
+    entre tous les plateaux chargés, et ne peuvent donc pas être modifiées.
+    """
+    return types.MappingProxyType(load_json(file_name))
+
+
+@functools.lru_cache(maxsize=None)
+def layout(width: int, height: int) -> 'Layout':
+    """
+    Retourne la disposition en spirale d'un plateau de dimensions données.
+    Les dispositions sont calculées une seule fois par couple de dimensions, puis gardées en mémoire.
+    """
+    return Layout(width, height)
+
+
+def read_source(file_name: str) -> bytes:
+    """
+    Lit le code source d'un fichier du programme, ou retourne une chaîne vide s'il n'est pas disponible
+    (lorsque le programme est distribué sans ses sources par exemple).
+    """
+    try:
+        with open(file_name, "rb") as file:
+            return file.read()
+    except OSError:
+        return b""
+
+
+def ring_start(width: int, height: int, ring: int) -> int:
+    """
+    Retourne la position de la première case d'un contour de la spirale,
+    qui correspond au nombre de cases des contours extérieurs.
+    """
+    return width * height - max(width - 2 * ring, 0) * max(height - 2 * ring, 0)
+
+
+def spiral(width: int, height: int, position: int) -> (int, int):
+    """
+    Un algorithme permettant de déterminer les coordonnées d'une case dans une spirale carrée,
+    dans le sens des aiguilles d'une montre, à partir de sa position, dans un repère en deux dimensions.
+    Les coordonnées sont calculées directement (en temps constant) : le contour de la spirale sur lequel se trouve
+    la case est d'abord déterminé, puis la case est placée sur ce contour.
+
+    :param width : La largeur de la spirale.
+    :param height : La hauteur de la spirale.
+    :param position : La position de la case dans la spirale (en partant de 0, en haut à gauche).
+
+    :returns : Un tuple à deux valeurs entières, représentant les coordonnées d'un point.
+    """
+
+    # Le contour k commence après les cases des contours extérieurs, au nombre de wh - (w - 2k)(h - 2k) :
+    # le contour est donc la plus petite racine de 4k² - 2k(w + h) + position = 0, arrondie à l'inférieur.
+    ring = int(((width + height) - math.sqrt((width + height) ** 2 - 4 * position)) / 4)
+
+    # Corrige les erreurs d'arrondi des nombres à virgule
+    while ring > 0 and position < ring_start(width, height, ring):
+        ring -= 1
+    while position >= ring_start(width, height, ring + 1):
+        ring += 1
+
+    # Bords du contour et position de la case sur ce contour
+    right, bottom = width - ring - 1, height - ring - 1
+    offset = position - ring_start(width, height, ring)
+
+    # Ligne horizontale du haut (de gauche à droite)
+    if offset <= right - ring:
+        return ring + offset, ring
+    offset -= right - ring
+
+    # Ligne verticale de droite (de haut en bas)
+    if offset <= bottom - ring:
+        return right, ring + offset
+    offset -= bottom - ring
+
+    # Ligne horizontale du bas (de droite à gauche)
+    if offset <= right - ring:
+        return right - offset, bottom
+    offset -= right - ring
+
+    # Ligne verticale de gauche (de bas en haut)
+    return ring, bottom - offset
+
+
+def spiral_walk(width: int, height: int):
+    """
+    Parcourt une spirale carrée dans le sens des aiguilles d'une montre, contour par contour,
+    et génère les coordonnées de chaque case dans l'ordre des positions.
+    Équivalent à appeler la fonction 'spiral' pour chaque position, mais plus rapide pour une spirale entière.
+    """
+
+    # Bords du contour en cours
+    top, left, bottom, right = 0, 0, height - 1, width - 1
+
+    # Tant qu'il reste des contours
+    while top <= bottom and left <= right:
+
+        # Ligne horizontale du haut (de gauche à droite)
+        for x in range(left, right + 1):
+            yield x, top
+        # Ligne verticale de droite (de haut en bas)
+        for y in range(top + 1, bottom + 1):
+            yield right, y
+
+        # Ligne horizontale du bas (de droite à gauche), si le contour a plus d'une ligne
+        if top < bottom:
+            for x in range(right - 1, left - 1, -1):
+                yield x, bottom
+        # Ligne verticale de gauche (de bas en haut), si le contour a plus d'une colonne
+        if left < right:
+            for y in range(bottom - 1, top, -1):
+                yield left, y
+
+        # Passe au contour suivant
+        top, left, bottom, right = top + 1, left + 1, bottom - 1, right - 1
+
+
+# Définition des classes
+
+class Board:
+    """
+    Une classe qui représente le plateau du jeu, sans aucun affichage.
+    Le plateau est constitué de dimensions et de cases, indexées par leur position.
+    """
+
+    @classmethod
+    def from_file(cls, file_name: str = BOARD_PATH, tiles_file: str = TILES_PATH) -> 'Board':
+        """
+        Charge un plateau de jeu depuis un fichier JSON, à partir de sa version compilée (voir 'load_compiled') :
+        les cases sont créées directement, et la table des déplacements est déjà remplie.
+        Lève une exception de disposition si le fichier est invalide.
+        """
+
+        # Récupère le plateau compilé
+        compiled = load_compiled(file_name, tiles_file)
+
+        # Crée les cases, avec leur nom et leur action selon leur type
+        tiles = dict[int, 'Tile']()
+        for position, kind, x, y in compiled.tiles:
+            name, action = compiled.types[kind]
+            tiles[position] = cls.create_tile(name, position, (x, y), actions.DEFAULTS.get(action))
+
+        # Crée le plateau, puis remplit sa table des déplacements (les déplacements ne sont jamais modifiés)
+        board_ = cls(compiled.width, compiled.height, tiles)
+        board_.moves.update(compiled.moves)
+        return board_
+
+    @classmethod
+    def from_json(cls, file_name: str = BOARD_PATH, tiles_file: str = TILES_PATH) -> 'Board':
+        """
+        Charge un plateau de jeu directement depuis un fichier JSON, sans passer par sa version compilée.
+        Les fichiers ne sont lus qu'une seule fois (voir 'load_board' et 'load_tiles').
+        Lève une exception de disposition si le fichier est invalide.
+        """
+
+        # Charge les informations du plateau et des cases
+        data = load_board(file_name)
+        definitions = load_tiles(tiles_file)
+
+        # Stocke la largeur et hauteur du plateau
+        width: int = data.get('width', 8)
+        height: int = data.get('height', 8)
+
+        # Vérifie que la largeur du plateau est strictement positive
+        if not 0 < width:
+            # Lève une exception de disposition
+            raise LayoutException(file_name, f"The width of the board should be positive, got {width} instead!")
+
+        # Vérifie que la hauteur du plateau est strictement positive
+        if not 0 < height:
+            # Lève une exception de disposition
+            raise LayoutException(file_name, f"The height of the board should be positive, got {height} instead!")
+
+        # Crée une cartographie du plateau (emplacement des cases selon leur position)
+        tiles = dict[int, 'Tile']()
+
+        # Stocke les cases à charger dans une liste
+        names: list[str] = data.get("tiles", [])
+
+        # Stocke la taille attendue et la taille réelle du plateau
+        size, tiles_length = width * height, len(names)
+
+        # Vérifie que le nombre de cases est égal à la taille du plateau (les déplacements précalculés parcourent
+        # toutes les positions du plateau, qui doivent donc toutes avoir une case)
+        if tiles_length != size:
+            # Lève une exception de disposition
+            raise LayoutException(file_name, f"{size} tiles were expected but {tiles_length} were given!")
+
+        # Itère pour chaque case à charger avec leur indice en tant que position
+        for position, name in enumerate(names):
+
+            # Vérifie que la case est définie dans le fichier des cases
+            if name not in definitions:
+                # Lève une exception de disposition
+                raise LayoutException(tiles_file, f"The tile '{name}' is not defined!")
+
+            # Récupère l'action associée à la case (None lorsque introuvable)
+            action = actions.DEFAULTS.get(definitions.get(name))
+            tiles[position] = cls.create_tile(name, position, layout(width, height).coordinates[position], action)
+
+        # Crée et retourne un nouveau plateau de dimensions indiquées dans le fichier
+        return cls(width, height, tiles)
+
+    @classmethod
+    def create_tile(cls, name: str, index: int, position: (int, int), action: type or None) -> 'Tile':
+        """
+        Construit une case du plateau lors du chargement.
+        Cette méthode peut être réécrite pour créer des cases graphiques.
+        """
+        return Tile(name, index, position, action)
+
+    def __init__(self, width: int, height: int, tiles: dict[int, 'Tile']):
+        """
+        Construit une nouvelle instance de la classe Board avec les cases
+        et les dimensions du plateau en paramètre.
+        """
+
+        # Dimensions du plateau
+        self.width = width
+        self.height = height
+
+        # Table des déplacements précalculés, et positions des cases selon leur nom
+        self.moves = dict[(int, int), 'Move']()
+        self.positions = dict[str, list[int]]()
+
+        # Cases du plateau (toute modification invalide les déplacements précalculés)
+        self.tiles = TileMap(self, tiles)
+
+    def compile(self) -> dict[(int, int), 'Move']:
+        """
+        Précalcule les déplacements depuis chaque position pour chaque total de dés possible,
+        et retourne la table des déplacements, indexée par le couple (position, distance).
+        """
+
+        # Pour chaque position que peut occuper une oie, et chaque total de dés
+        for position in range(1, self.size):
+            for distance in DISTANCES:
+                # Calcule et stocke le déplacement
+                self.move(position, distance)
+
+        # Retourne la table des déplacements
+        return self.moves
+
+    def get_position(self, x: int, y: int) -> int or None:
+        """
+        Retourne la position de la case se trouvant aux coordonnées données, ou None s'il n'y en a pas.
+        """
+        return self.layout.positions.get((x, y))
+
+    def invalidate(self):
+        """
+        Supprime les déplacements précalculés et l'index des cases,
+        méthode appelée lorsque les cases du plateau sont modifiées.
+        """
+        self.moves.clear()
+        self.positions.clear()
+
+    @property
+    def layout(self) -> 'Layout':
+        """
+        Retourne la disposition en spirale du plateau, partagée entre tous les plateaux de mêmes dimensions.
+        """
+        return layout(self.width, self.height)
+
+    def move(self, position: int, distance: int) -> 'Move':
+        """
+        Retourne le déplacement d'une oie seule depuis une position et d'une distance donnée,
+        en le calculant seulement s'il n'est pas encore dans la table des déplacements.
+        """
+
+        # Tente de récupérer le déplacement dans la table
+        try:
+            return self.moves[position, distance]
+
+        # Si le déplacement n'a pas encore été calculé
+        except KeyError:
+            # Calcule et stocke le déplacement
+            move = self.moves[position, distance] = self.resolve(position, distance)
+            return move
+
+    def next_tile(self, tile: 'Tile') -> 'Tile' or None:
+        """
+        Retourne la prochaine case portant le même nom que la case donnée, ou None s'il n'y en a pas.
+        """
+
+        # Construit l'index des positions des cases selon leur nom, s'il n'existe pas encore
+        if not self.positions:
+            for position in sorted(self.tiles):
+                self.positions.setdefault(self.tiles[position].name, []).append(position)
+
+        # Recherche la première position supérieure à celle de la case
+        positions = self.positions.get(tile.name, [])
+        index = bisect.bisect_right(positions, tile.index)
+
+        # Retourne la case trouvée
+        return self.tiles[positions[index]] if index < len(positions) else None
+
+    def resolve(self, position: int, distance: int) -> 'Move':
+        """
+        Calcule le déplacement d'une oie seule, partant d'une position et avançant d'une distance donnée,
+        en activant réellement les cases du plateau (oies, ponts, labyrinthe, tête de mort...)
+        jusqu'à ce qu'elle s'arrête. Les autres oies ne sont pas prises en compte,
+        et les dés ne sont pas relancés : une case relançant les dés est indiquée dans le résultat.
+        """
+
+        # Crée une partie d'essai à un seul joueur, et place son oie
+        probe = ProbeGame(self)
+        player_ = probe.players[0]
+        player_.goose.place(position)
+        player_.goose.last_position = position
+
+        # Déplace l'oie
+        player_.move_of(distance)
+
+        # Le déplacement ne peut être rejoué directement que si les seuls effets restants
+        # sont ceux de la case d'arrivée
+        tile = self.tiles.get(player_.goose.position)
+        reusable = all(name == tile.name for name in player_.effects)
+
+        # Si les effets restants ne peuvent être levés que par un autre joueur
+        captive = any(action.other_player_rescue for action in player_.effects.values())
+
+        # Retourne le résultat du déplacement
+        return Move(
+            player_.goose.position, player_.goose.last_position, probe.path, tuple(player_.effects), captive,
+            player_.stopped, probe.rerolled, probe.winner is not None, reusable
+        )
+
+    @property
+    def size(self):
+        """
+        Retourne la superficie du plateau de jeu (en nombre de cases).
+        Peut servir à calculer le nombre de cases totales que le plateau compte.
+        """
+        return self.width * self.height
+
+
+class CompiledBoard:
+    """
+    Une classe représentant un plateau compilé : ses dimensions, le type de chaque case (nom et nom de l'action),
+    les coordonnées des cases, et la table des déplacements précalculés.
+    Un plateau compilé peut être enregistré sous une forme binaire compacte, puis rechargé sans relire les fichiers
+    JSON, ni recalculer la disposition et les déplacements (voir 'load_compiled').
+
+    Forme binaire : un en-tête, la table des chaînes de caractères (noms des cases et des actions), les types,
+    les cases (position, type, coordonnées), les déplacements (position, distance, arrivée, position précédente,
+    état, taille du chemin et nombre d'effets), puis les chemins et les effets restants de tous les déplacements
+    à la suite. Les nombres sont enregistrés en petit-boutiste.
+    """
+
+    # Signature et version de la forme binaire (la version change avec la forme binaire ou la classe 'Move')
+    MAGIC = b"GOOSEBRD"
+    VERSION = 1
+
+    # En-tête (signature, version, largeur, hauteur, nombre de chaînes, de types, de cases et de déplacements)
+    HEADER = struct.Struct("<8sB6I")
+    # Type de case (chaîne du nom et chaîne de l'action), et case (position, type, coordonnées)
+    TYPE = struct.Struct("<2I")
+    TILE = struct.Struct("<4I")
+    # Déplacement (position, distance, arrivée, position précédente, état, taille du chemin et nombre d'effets)
+    MOVE = struct.Struct("<IBiiBHB")
+
+    # États d'un déplacement, enregistrés sur un octet
+    STOPPED = 1
+    REROLL = 2
+    FINISHED = 4
+    REUSABLE = 8
+    CAPTIVE = 16
+
+    @classmethod
+    def from_board(cls, board_: 'Board') -> 'CompiledBoard':
+        """
+        Compile un plateau : relève le type et les coordonnées de chaque case, et précalcule tous ses déplacements.
+        """
+
+        # Types des cases (nom de la case, et nom de son action selon les actions par défaut)
+        names = {action: name for name, action in actions.DEFAULTS.items()}
+        types_ = list[tuple[str, str or None]]()
+        tiles = list[tuple[int, int, int, int]]()
+
+        # Pour chaque case, relève son type et ses coordonnées
+        for position, tile in sorted(board_.tiles.items()):
+            kind = (tile.name, names.get(tile.action))
+            if kind not in types_:
+                types_.append(kind)
+            tiles.append((position, types_.index(kind), tile.x, tile.y))
+
+        # Crée le plateau compilé avec tous les déplacements
+        return cls(board_.width, board_.height, types_, tiles, dict(board_.compile()))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompiledBoard':
+        """
+        Lit un plateau compilé depuis sa forme binaire.
+        Lève une exception 'ValueError' si la forme binaire n'est pas reconnue ou qu'elle est incohérente
+        (fichier tronqué ou corrompu : indice hors de la table des chaînes ou des types, action inconnue,
+        position hors du plateau, distance impossible...).
+        """
+
+        # Lit l'en-tête
+        magic, version, width, height, strings, kinds, count, moves = CompiledBoard.HEADER.unpack_from(data)
+        if magic != CompiledBoard.MAGIC or version != CompiledBoard.VERSION:
+            raise ValueError("Unknown compiled board format!")
+        offset = CompiledBoard.HEADER.size
+
+        # Lit la table des chaînes de caractères (taille de la table, puis chaînes séparées par un caractère nul)
+        size, = struct.unpack_from("<I", data, offset)
+        table = bytes(data[offset + 4:offset + 4 + size]).decode("UTF-8").split("\0")[:strings]
+        offset += 4 + size
+
+        def lookup(index: int) -> str:
+            """
+            Fonction locale retournant une chaîne de la table à partir de son indice,
+            et levant une exception 'ValueError' si l'indice est en dehors de la table.
+            """
+            if not 0 <= index < len(table):
+                raise ValueError(f"Invalid string index {index} in compiled board!")
+            return table[index]
+
+        # Lit les types des cases (la chaîne vide correspond à l'absence d'action)
+        types_ = [
+            (lookup(name), lookup(action) or None)
+            for name, action in CompiledBoard.TYPE.iter_unpack(data[offset:offset + kinds * CompiledBoard.TYPE.size])
+        ]
+        offset += kinds * CompiledBoard.TYPE.size
+
+        # Vérifie que chaque action existe
+        for name, action in types_:
+            if action is not None and action not in actions.DEFAULTS:
+                raise ValueError(f"Unknown action '{action}' in compiled board!")
+
+        # Lit les cases
+        tiles = list(CompiledBoard.TILE.iter_unpack(data[offset:offset + count * CompiledBoard.TILE.size]))
+        offset += count * CompiledBoard.TILE.size
+
+        # Vérifie que le nombre de cases est complet, que chaque position du plateau a exactement une case,
+        # et que le type de chaque case existe
+        positions = range(width * height)
+        if (
+                len(tiles) != count or count != len(positions)
+                or sorted(position for position, _, _, _ in tiles) != list(positions)
+                or any(not 0 <= kind < len(types_) for _, kind, _, _ in tiles)
+        ):
+            raise ValueError("Invalid tiles in compiled board!")
+
+        # Lit les déplacements, puis les chemins et effets restants de tous les déplacements à la suite
+        records = list(CompiledBoard.MOVE.iter_unpack(data[offset:offset + moves * CompiledBoard.MOVE.size]))
+        offset += moves * CompiledBoard.MOVE.size
+        if len(records) != moves:
+            raise ValueError("Truncated moves in compiled board!")
+        values = struct.unpack_from(f"<{sum(record[5] + record[6] for record in records)}i", data, offset)
+
+        # Crée les déplacements, en vérifiant que leurs positions sont sur le plateau et que leur distance est possible
+        moves_table = dict[(int, int), 'Move']()
+        index = 0
+        for position, distance, arrival, last, state, length, effects in records:
+            path = values[index:index + length]
+            if (
+                    position not in positions or arrival not in positions or last not in positions
+                    or distance not in DISTANCES or any(step not in positions for step in path)
+            ):
+                raise ValueError(f"Invalid move from position {position} in compiled board!")
+            moves_table[position, distance] = Move(
+                arrival, last, path,
+                tuple(lookup(name) for name in values[index + length:index + length + effects]),
+                bool(state & CompiledBoard.CAPTIVE), bool(state & CompiledBoard.STOPPED),
+                bool(state & CompiledBoard.REROLL), bool(state & CompiledBoard.FINISHED),
+                bool(state & CompiledBoard.REUSABLE)
+            )
+            index += length + effects
+
+        # Crée le plateau compilé
+        return cls(width, height, types_, tiles, moves_table)
+
+    def __init__(
+            self, width: int, height: int, types_: list[tuple[str, str or None]],
+            tiles: list[tuple[int, int, int, int]], moves: dict[(int, int), 'Move']
+    ):
+        """
+        Construit une nouvelle instance de la classe 'CompiledBoard' à partir des dimensions du plateau,
+        des types de cases (nom de la case et nom de son action), des cases (position, indice du type, coordonnées)
+        et de la table des déplacements précalculés.
+        """
+
+        # Dimensions du plateau
+        self.width = width
+        self.height = height
+        # Types et cases du plateau
+        self.types = types_
+        self.tiles = tiles
+        # Table des déplacements précalculés
+        self.moves = moves
+
+    def to_bytes(self) -> bytes:
+        """
+        Retourne la forme binaire du plateau compilé.
+        """
+
+        # Table des chaînes de caractères (la chaîne vide correspond à l'absence d'action)
+        strings = [""]
+        for name, action in self.types:
+            strings += [string for string in (name, action or "") if string not in strings]
+        for move in self.moves.values():
+            strings += [name for name in move.effects if name not in strings]
+        table = "\0".join(strings).encode("UTF-8")
+
+        # En-tête, table des chaînes, types et cases
+        parts = [
+            CompiledBoard.HEADER.pack(
+                CompiledBoard.MAGIC, CompiledBoard.VERSION, self.width, self.height,
+                len(strings), len(self.types), len(self.tiles), len(self.moves)
+            ),
+            struct.pack("<I", len(table)), table
+        ]
+        parts += [
+            CompiledBoard.TYPE.pack(strings.index(name), strings.index(action or "")) for name, action in self.types
+        ]
+        parts += [CompiledBoard.TILE.pack(*tile) for tile in self.tiles]
+
+        # Déplacements, puis chemins et effets restants de tous les déplacements à la suite
+        values = list[int]()
+        for (position, distance), move in sorted(self.moves.items()):
+            state = (
+                CompiledBoard.STOPPED * move.stopped | CompiledBoard.REROLL * move.reroll
+                | CompiledBoard.FINISHED * move.finished | CompiledBoard.REUSABLE * move.reusable
+                | CompiledBoard.CAPTIVE * move.captive
+            )
+            parts.append(CompiledBoard.MOVE.pack(
+                position, distance, move.position, move.last_position, state, len(move.path), len(move.effects)
+            ))
+            values += sorted(move.path)
+            values += [strings.index(name) for name in move.effects]
+        parts.append(struct.pack(f"<{len(values)}i", *values))
+
+        # Retourne la forme binaire
+        return b"".join(parts)
+
+
+class Dice:
+    """
+    Classe représentant un dé à six faces, lancé de façon aléatoire
+    à l'aide du générateur de nombres aléatoires de la partie.
+    """
+
+    def __init__(self, game: 'Game'):
+        """
+        Construit une nouvelle instance de la classe 'Dice' représentant un dé
+        et permettant de simuler des lancés de dés.
+        """
+
+        # La partie en cours
+        self.game = game
+
+        # Valeur du dé
+        self.value = 1
+        # Si le dé a changé entre temps
+        self.rolled = False
+
+    def get_value(self):
+        """
+        Retourne la valeur du dé et réinitialise l'état du dé.
+        """
+
+        # Réinitialise l'état du dé
+        self.rolled = False
+        # Retourne la valeur du dé
+        return self.value
+
+    def roll(self):
+        """
+        Lance le dé et change sa valeur.
+        """
+
+        # Stocke le résultat du lancé de dé
+        self.value = self.game.random.randint(1, 6)
+        # Indique que le dé a été lancé
+        self.rolled = True
+
+
+class Game:
+    """
+    Une classe représentant une partie sans affichage :
+    elle possède un plateau, des dés et des joueurs, gère l'ordre des tours et le vainqueur.
+    """
+
+    # Nombre minimum de joueurs pour jouer, et nombre maximum (None lorsqu'illimité)
+    MINIMUM = 2
+    MAXIMUM = None
+    # Si les déplacements précalculés du plateau sont utilisés
+    PRECOMPUTED = True
+
+    def __init__(self, board_: 'Board', players: int = 0, seed: int = None):
+        """
+        Construit une nouvelle partie sur le plateau donné, avec un nombre de joueurs donné.
+        Une graine peut être fournie pour que les lancés de dés soient reproductibles.
+        """
+
+        # Le plateau de jeu
+        self.board = board_
+        # Le générateur de nombres aléatoires de la partie
+        self.random = random.Random(seed)
+
+        # Liste des joueurs
+        self.players: list['Player'] = []
+        self.player_cache: list['Player'] = []
+        # Index d'occupation du plateau : joueurs actifs présents sur chaque position (dans leur ordre d'arrivée)
+        self.occupancy = dict[int, dict['Player', None]]()
+        # Nombre de fois où un joueur a rejoint la partie, servant à numéroter les joueurs dans leur ordre
+        self.joined = 0
+        # Tour de jeu
+        self.turn = 0
+        # Le gagnant de la partie
+        self.winner = None
+
+        # Ajoute les dés
+        self.dices = self.create_dices()
+
+        # Ajoute les joueurs
+        for _ in range(players):
+            self.add_player()
+
+    def add_player(self):
+        """
+        Crée et ajoute un joueur à la liste des joueurs, si le nombre maximum n'est pas atteint.
+        """
+        identifier = len(self.players)
+        if self.MAXIMUM is None or identifier < self.MAXIMUM:
+            self.join(self.create_player(identifier))
+
+    def create_dices(self) -> tuple['Dice', ...]:
+        """
+        Construit les dés de la partie.
+        Cette méthode peut être réécrite pour créer des dés graphiques.
+        """
+        return Dice(self), Dice(self)
+
+    def create_player(self, identifier: int) -> 'Player':
+        """
+        Construit un joueur de la partie.
+        Cette méthode peut être réécrite pour créer des joueurs graphiques.
+        """
+        return Player(self, identifier)
+
+    def enough_players(self) -> bool:
+        """
+        Indique si le nombre de joueurs nécessaire pour une partie est atteint.
+        """
+        return len(self.players) >= self.MINIMUM
+
+    def get_occupant(self, position: int) -> 'Player' or None:
+        """
+        Retourne le joueur dont l'oie se trouve sur la position donnée, ou None s'il n'y en a pas.
+        Lorsque plusieurs oies se trouvent sur la position, retourne le premier joueur dans l'ordre des joueurs.
+        """
+
+        # Récupère les joueurs présents sur la position
+        occupants = self.occupancy.get(position)
+
+        # S'il n'y a personne
+        if not occupants:
+            return None
+
+        # Retourne le seul joueur présent, ou le premier dans l'ordre des joueurs
+        return next(iter(occupants)) if len(occupants) == 1 else min(occupants, key=lambda player_: player_.rank)
+
+    def get_player(self) -> 'Player':
+        """
+        Retourne le joueur en train de jouer (à qui c'est le tour).
+        """
+        return self.players[self.turn]
+
+    def join(self, player_: 'Player'):
+        """
+        Ajoute un joueur aux joueurs actifs et à l'index d'occupation.
+        Le joueur est numéroté selon son arrivée, ce qui correspond à son ordre dans la liste des joueurs,
+        et son identifiant devient son indice dans la liste (un joueur revenant dans la partie est renuméroté).
+        """
+        self.joined += 1
+        player_.rank = self.joined
+        player_.id = len(self.players)
+        self.players.append(player_)
+        self.occupy(player_)
+
+    def next_turn(self):
+        """
+        Passe au tour de l'oie suivante, si la dernière oie à déjà jouée,
+        c'est donc au tour de la première oie.
+        """
+
+        # S'il reste des joueurs qui n'ont pas encore joué
+        if self.turn < len(self.players) - 1:
+            # Passer au joueur suivant
+            self.turn += 1
+        # Sinon
+        else:
+            # Reprendre depuis le début
+            self.turn = 0
+
+    def occupy(self, player_: 'Player'):
+        """
+        Ajoute un joueur actif à l'index d'occupation, sur la position de son oie.
+        """
+        self.occupancy.setdefault(player_.goose.position, {})[player_] = None
+
+    def play_turn(self):
+        """
+        Joue le tour du joueur en cours sans affichage : lance les dés puis fait jouer le joueur.
+        """
+
+        # Lance les dés
+        for dice in self.dices:
+            dice.roll()
+
+        # Fait jouer le joueur
+        self.get_player().play()
+
+    def restore_player(self):
+        """
+        Ramène dans la partie le dernier joueur ayant quitté, avec sa progression.
+        """
+        self.join(self.player_cache.pop(-1))
+
+    def run(self, max_turns: int = None) -> 'Player' or None:
+        """
+        Joue la partie jusqu'à ce qu'un joueur gagne, ou que le nombre maximum de tours soit atteint.
+        Retourne le vainqueur, ou None s'il n'y en a pas.
+        """
+
+        # Nombre de tours joués
+        turns = 0
+
+        # Tant qu'il n'y a pas de vainqueur et que la limite de tours n'est pas atteinte
+        while self.winner is None and (max_turns is None or turns < max_turns):
+            # Joue un tour
+            self.play_turn()
+            turns += 1
+
+        # Retourne le vainqueur
+        return self.winner
+
+    def vacate(self, player_: 'Player'):
+        """
+        Retire un joueur de l'index d'occupation, de la position de son oie.
+        """
+
+        # Retire le joueur de la position
+        occupants = self.occupancy[player_.goose.position]
+        del occupants[player_]
+
+        # Supprime la position lorsqu'elle est libre
+        if not occupants:
+            del self.occupancy[player_.goose.position]
+
+    def win(self, player_: 'Player'):
+        """
+        Méthode qui place un joueur en tant que vainqueur.
+        """
+        self.winner = player_
+
+
+class Goose:
+    """
+    Classe représentant la position de l'oie que contrôle le joueur sur le plateau.
+    """
+
+    def __init__(self, player_: 'Player'):
+        """
+        Construit une nouvelle instance de la classe Goose représentant une oie.
+        Une oie est associée à un joueur et possède une position.
+        """
+
+        # Le joueur associé à l'oie
+        self.player = player_
+
+        # Attributs relatifs à la position de l'oie (la position est modifiée avec la méthode 'place')
+        self.position = 1
+        self.last_position = 0
+        self.finished = False
+
+    def able_to_move(self, position: int) -> bool:
+        """
+        Retourne un booléen précisant si l'oie est en capacité de se déplacer
+        sur la position donnée.
+        """
+        return 0 < position < self.player.game.board.size
+
+    def go_to(self, position: int):
+        """
+        Déplace l'oie à une position donnée, si elle est atteignable.
+        """
+
+        # Permet de déterminer si le joueur a sauvé un autre joueur durant le calcul
+        has_rescued = False
+        # Permet de déterminer si le joueur a bougé
+        has_moved = False
+
+        # Si l'oie est capable de se déplacer sur la case à la position donnée
+        if self.able_to_move(position):
+
+            # Récupère le joueur se trouvant déjà sur la position, à l'aide de l'index d'occupation
+            player_ = self.player.game.get_occupant(position)
+
+            # Si la position est déjà prise par un autre joueur
+            if player_ is not None:
+
+                # Itère parmi les actions pouvant être désactivées par un autre joueur
+                for action in list(player_.rescuable.values()):
+
+                    # Envoyer des secours
+                    action.rescue(self.player)
+                    # Indique que le joueur à sauvé un autre joueur
+                    has_rescued = True
+
+                # Sauvegarde la dernière position du joueur
+                current_last_position = self.last_position
+
+                # Va à la dernière position du joueur
+                self.last_position = self.position
+                self.place(player_.goose.last_position)
+
+                # Indique que le joueur s'est déplacé
+                has_moved = True
+
+                # Si le joueur à sauvé un autre joueur
+                if has_rescued:
+
+                    # Déplacer le joueur sauvé à la dernière position
+                    player_.goose.last_position = player_.goose.position
+                    player_.goose.place(current_last_position)
+
+            # Si le joueur ne s'est pas encore déplacé
+            if not has_moved:
+
+                # Sinon, va à la position de la case
+                self.last_position = self.position
+                self.place(position)
+
+            # Si le joueur n'a sauvé personne et a atteint la case visée
+            # (une oie renvoyée par une autre oie n'active pas la case, ce qui pourrait boucler à l'infini)
+            if not has_rescued and self.position == position:
+                # Récupère la case et l'active
+                tile = self.player.game.board.tiles.get(self.position)
+                tile.activate(self.position - self.last_position, self.player)
+
+            # Indique que l'opération a fonctionné
+            return True
+
+        # Indique que l'opération a échoué
+        return False
+
+    def jump(self, distance: int) -> bool:
+        """
+        Déplace l'oie d'une distance donnée en une seule fois, à l'aide des déplacements précalculés du plateau.
+        Retourne False sans déplacer l'oie lorsque le déplacement doit être calculé case par case :
+        lorsqu'une autre oie se trouve sur son chemin, ou que le déplacement laisse des effets intermédiaires.
+        """
+
+        # Si la partie n'utilise pas les déplacements précalculés
+        if not self.player.game.PRECOMPUTED:
+            return False
+
+        # Récupère le déplacement précalculé
+        move = self.player.game.board.move(self.position, distance)
+
+        # Si le déplacement ne peut pas être rejoué directement
+        if not move.reusable or (move.path and not self.able_to_move(move.position)):
+            return False
+
+        # Si une autre oie se trouve sur le chemin, à l'aide de l'index d'occupation
+        # (en parcourant le plus petit des deux, positions occupées ou positions du chemin)
+        occupancy = self.player.game.occupancy
+        for position in occupancy if len(occupancy) < len(move.path) else move.path:
+            occupants = occupancy.get(position)
+            if occupants and position in move.path and (len(occupants) > 1 or self.player not in occupants):
+                return False
+
+        # Si l'oie s'est déplacée
+        if move.path:
+
+            # Va à la position d'arrivée
+            self.last_position = move.last_position
+            self.place(move.position)
+
+            # Active la case d'arrivée, qui n'a plus que des effets sur place (arrêt, relance, victoire...)
+            tile = self.player.game.board.tiles.get(self.position)
+            tile.activate(self.position - self.last_position, self.player)
+
+        # Indique que l'opération a fonctionné
+        return True
+
+    def move_of(self, tiles: int) -> bool:
+        """
+        Fait avancer l'oie d'un certain nombre de cases.
+        """
+        return self.go_to(self.position + tiles)
+
+    def place(self, position: int):
+        """
+        Place l'oie sur une position, en tenant à jour l'index d'occupation de la partie
+        lorsque le joueur y est actif. Toute modification de la position de l'oie doit passer par cette méthode.
+        """
+
+        # Si le joueur est actif, il est retiré de son ancienne position
+        game_ = self.player.game
+        active = self.player in game_.occupancy.get(self.position, {})
+        if active:
+            game_.vacate(self.player)
+
+        # Change la position de l'oie
+        self.position = position
+
+        # Si le joueur est actif, il est ajouté sur sa nouvelle position
+        if active:
+            game_.occupy(self.player)
+
+
+class Layout:
+    """
+    Une classe représentant la disposition en spirale d'un plateau de dimensions données :
+    les coordonnées de chaque position, et la position se trouvant à chaque coordonnée.
+    """
+
+    def __init__(self, width: int, height: int):
+        """
+        Construit une nouvelle instance de la classe 'Layout', en calculant les coordonnées de toutes les positions.
+        """
+
+        # Dimensions de la disposition
+        self.width = width
+        self.height = height
+
+        # Coordonnées de chaque position (parcours de la spirale), et position de chaque coordonnée
+        self.coordinates: tuple[(int, int), ...] = tuple(spiral_walk(width, height))
+        self.positions: dict[(int, int), int] = {
+            coordinates: position for position, coordinates in enumerate(self.coordinates)
+        }
+
+
+class LayoutException(Exception):
+    """
+    Une classe représentant une erreur de disposition du plateau, levée lors du chargement de fichiers.
+    Les classes graphiques la transforment en erreur de chargement.
+    """
+
+    def __init__(self, file: str, *messages: str):
+        """
+        Construit une nouvelle instance de la classe 'LayoutException' représentant une erreur de disposition.
+        """
+
+        # Appel du constructeur de la superclasse 'Exception'
+        super().__init__()
+
+        # Stocke le fichier et le message à afficher
+        self.file = file
+        self.message = " ".join(messages)
+
+    def __str__(self) -> str:
+        """
+        Renvoie une chaîne de caractères représentant le message de l'erreur.
+        """
+
+        # Retourne le message d'erreur
+        return f"[{self.file}]: {self.message}"
+
+
+class Move:
+    """
+    Une classe représentant le résultat du déplacement d'une oie seule sur le plateau :
+    la case d'arrivée, la case précédente, les effets restants et l'état du joueur.
+    """
+
+    def __init__(
+            self, position: int, last_position: int, path: list[int] or frozenset[int], effects: tuple[str, ...],
+            captive: bool, stopped: bool, reroll: bool, finished: bool, reusable: bool
+    ):
+        """
+        Construit une nouvelle instance de la classe 'Move' représentant un déplacement résolu.
+        """
+
+        # Position d'arrivée et position précédente de l'oie
+        self.position = position
+        self.last_position = last_position
+        # Positions atteintes par l'oie pendant le déplacement
+        self.path = frozenset(path)
+
+        # Noms des effets encore actifs après le déplacement
+        self.effects = effects
+        # Si les effets restants ne peuvent être levés que par un autre joueur
+        self.captive = captive
+
+        # Si le joueur est stoppé, doit relancer les dés, ou a gagné
+        self.stopped = stopped
+        self.reroll = reroll
+        self.finished = finished
+        # Si le déplacement peut être rejoué directement dans une partie
+        self.reusable = reusable
+
+
+class Player:
+    """
+    Une classe représentant un joueur sans affichage, avec une oie, des effets et un état.
+    """
+
+    def __init__(self, game_: 'Game', identifier: int):
+        """
+        Construit une nouvelle instance de la classe 'Player' représentant un joueur.
+        Un joueur est associé à un jeu, possède un identifiant correspondant à son indice dans la liste
+        des joueurs du jeu, ainsi qu'une oie et des effets.
+        """
+
+        # Le jeu
+        self.game = game_
+
+        # L'identifiant, et le rang d'arrivée du joueur dans la partie (donné lorsqu'il rejoint la partie)
+        self.id = identifier
+        self.rank = 0
+
+        # Les effets du joueur, et parmi eux, ceux pouvant être désactivés par un autre joueur
+        self.effects: dict[str, 'actions.Action'] = {}
+        self.rescuable: dict[str, 'actions.Action'] = {}
+
+        # L'état du joueur (False lui permet de se mouvoir, et True non)
+        self.stopped = False
+
+        # L'oie du joueur
+        self.goose = self.create_goose()
+
+    def add_effect(self, name: str, action: 'actions.Action') -> 'actions.Action':
+        """
+        Ajoute l'action donnée dans le dictionnaire des effets, puis retourne l'action.
+        """
+
+        # Ajout dans le dictionnaire
+        self.effects[name] = action
+
+        # Si l'action peut être désactivée par un autre joueur, l'ajoute aux actions à secourir
+        if action.other_player_rescue:
+            self.rescuable[name] = action
+        # Sinon, elle remplace une éventuelle action du même nom
+        else:
+            self.rescuable.pop(name, None)
+
+        # Retourne l'action
+        return action
+
+    def create_goose(self) -> 'Goose':
+        """
+        Construit l'oie du joueur.
+        Cette méthode peut être réécrite pour créer une oie graphique.
+        """
+        return Goose(self)
+
+    def dice_move(self) -> int:
+        """
+        Fait avancer le joueur en fonction des dés.
+        """
+
+        # Marque la distance à parcourir
+        distance = 0
+
+        # Parcours tous les dés du jeu
+        for dice in self.game.dices:
+
+            # Si le dé a été lancé durant le tour
+            if dice.rolled:
+
+                # Ajoute la valeur du dé la distance et réinitialise l'état du dé
+                distance += dice.get_value()
+
+        # Fait avancer le joueur
+        self.move_of(distance)
+
+        # Retourne la distance parcourue
+        return distance
+
+    def discard_effect(self, name: str) -> 'actions.Action':
+        """
+        Supprime l'effet du dictionnaire des effets du joueur.
+        """
+
+        # Retire l'action du dictionnaire des effets
+        self.rescuable.pop(name, None)
+        return self.effects.pop(name, self)
+
+    def move_of(self, distance: int):
+        """
+        Semblable à self.goose.move_of() mais fait reculer l'oie lorsqu'elle va trop loin.
+        L'oie ne rebondit qu'en avançant : une oie qui recule avant la première case reste sur place,
+        sans quoi une suite de cases oie pourrait la faire rebondir indéfiniment entre les deux bords.
+        """
+
+        # Si le joueur n'est pas stoppé, que la distance à parcourir n'est pas nulle,
+        # et que le déplacement précalculé ne peut pas être appliqué directement
+        if not self.stopped and distance != 0 and not self.goose.jump(distance):
+
+            # Avancer
+            if not self.goose.move_of(distance) and not self.stopped and distance > 0:
+
+                # S'il est impossible d'avancer, reculer
+                self.goose.move_of(-distance)
+
+    def play(self) -> int:
+        """
+        Lance le tour du joueur et retourne la distance tirée aux dés.
+        Lorsque le joueur était stoppé au début de son tour, il passe son tour
+        et ses effets sont mis à jour (ce qui peut le libérer).
+        """
+
+        # Stocke l'état du joueur au début du tour
+        stopped = self.stopped
+
+        # Fait avancer de la valeur des dés et vérifie si la distance parcourue n'est pas nulle
+        distance = self.dice_move()
+        if distance > 0:
+
+            # Si le joueur était stoppé, son tour met à jour ses effets
+            if stopped:
+                self.update_effects()
+
+            # Passe au tour suivant
+            self.game.next_turn()
+
+        # Retourne la distance tirée
+        return distance
+
+    def quit(self):
+        """
+        Fait quitter le joueur du jeu. Sauvegarde sa progression.
+        Les joueurs suivants sont renumérotés, et le tour reste à celui qui devait jouer
+        (au joueur suivant lorsque c'est le joueur en cours qui quitte la partie).
+        """
+
+        # Ajoute le joueur au cache des joueurs en le supprimant des joueurs actifs et de l'index d'occupation
+        index = self.game.players.index(self)
+        self.game.players.remove(self)
+        self.game.vacate(self)
+        self.game.player_cache.append(self)
+
+        # Renumérote les joueurs restants selon leur indice dans la liste
+        for identifier, player_ in enumerate(self.game.players):
+            player_.id = identifier
+
+        # Décale le tour si un joueur le précédant a quitté, et reprend depuis le début s'il dépasse la liste
+        if index < self.game.turn:
+            self.game.turn -= 1
+        if self.game.turn >= len(self.game.players):
+            self.game.turn = 0
+
+    def update_effects(self):
+        """
+        Met à jour toutes les actions encore actives du joueur (une fois par tour passé).
+        """
+        for action in list(self.effects.values()):
+            action.update()
+
+
+class ProbeDice(Dice):
+    """
+    Un dé d'essai, qui ne se lance jamais réellement mais signale à sa partie qu'il aurait dû l'être.
+    """
+
+    def roll(self):
+        """
+        Indique à la partie que les dés auraient dû être relancés, sans changer la valeur du dé.
+        """
+        self.game.rerolled = True
+
+
+class ProbeGame(Game):
+    """
+    Une partie d'essai à un seul joueur, servant à calculer les déplacements sur un plateau.
+    Les déplacements y sont calculés case par case, sans utiliser les déplacements précalculés.
+    """
+
+    PRECOMPUTED = False
+
+    def __init__(self, board_: 'Board'):
+        """
+        Construit une nouvelle partie d'essai sur le plateau donné.
+        """
+
+        # Si les dés auraient dû être relancés pendant le déplacement
+        self.rerolled = False
+        # Positions atteintes par l'oie pendant le déplacement
+        self.path: list[int] = []
+
+        # Appel du constructeur de la superclasse
+        super().__init__(board_, 1)
+
+    def create_dices(self) -> tuple['Dice', ...]:
+        """
+        Construit les dés d'essai de la partie.
+        """
+        return ProbeDice(self), ProbeDice(self)
+
+    def create_player(self, identifier: int) -> 'Player':
+        """
+        Construit le joueur d'essai de la partie.
+        """
+        return ProbePlayer(self, identifier)
+
+
+class ProbeGoose(Goose):
+    """
+    Une oie d'essai, qui enregistre dans sa partie les positions qu'elle atteint.
+    """
+
+    def go_to(self, position: int):
+        """
+        Enregistre la position si elle est atteignable, puis déplace l'oie.
+        """
+
+        # Si l'oie est capable de se déplacer sur la case, enregistre la position
+        if self.able_to_move(position):
+            self.player.game.path.append(position)
+
+        # Déplace l'oie
+        return super().go_to(position)
+
+
+class ProbePlayer(Player):
+    """
+    Un joueur d'essai, possédant une oie d'essai.
+    """
+
+    def create_goose(self) -> 'Goose':
+        """
+        Construit l'oie d'essai du joueur.
+        """
+        return ProbeGoose(self)
+
+
+class Tile:
+    """
+    Une classe qui représente une case du plateau, sans affichage.
+
+    Une case est représentée par un nom, un indice (sa position dans le parcours),
+    ses coordonnées et une action exécutée lorsqu'un joueur atterri dessus.
+    """
+
+    def __init__(self, name: str, index: int, position: (int, int), action: type or None):
+        """
+        Construit une instance de la classe Tile.
+        Une case requiert un nom, un indice, des coordonnées et une action (None lorsqu'elle n'en a pas).
+        """
+
+        # Le nom de la case
+        self.name = name
+        # L'indice de la case
+        self.index = index
+        # Ses coordonnées
+        self.x, self.y = position
+        # L'action associée à la case
+        self.action = action
+
+    def activate(self, distance: int, p: 'Player'):
+        """
+        Méthode appelée lorsqu'un joueur arrive sur cette case.
+        Ajoute une action à la liste des effets du joueur.
+        """
+
+        # Si l'action de la case n'est pas nulle (inexistante)
+        if self.action is not None:
+            # Ajouter une nouvelle action à la liste d'effets du joueur
+            action: 'actions.Action' = self.action(distance, self, p)
+            p.add_effect(self.name, action).activate()
+
+
+class TileMap(dict):
+    """
+    Un dictionnaire des cases d'un plateau, indexées par leur position,
+    qui invalide les déplacements précalculés du plateau à chaque modification.
+    """
+
+    def __init__(self, board_: 'Board', tiles: dict[int, 'Tile']):
+        """
+        Construit un nouveau dictionnaire des cases du plateau donné.
+        """
+
+        # Appel du constructeur de la superclasse
+        super().__init__(tiles)
+
+        # Le plateau
+        self.board = board_
+
+    def __delitem__(self, position: int):
+        """
+        Supprime une case et invalide les déplacements précalculés.
+        """
+        super().__delitem__(position)
+        self.board.invalidate()
+
+    def __setitem__(self, position: int, tile: 'Tile'):
+        """
+        Remplace une case et invalide les déplacements précalculés.
+        """
+        super().__setitem__(position, tile)
+        self.board.invalidate()
+
+    def clear(self):
+        """
+        Supprime toutes les cases et invalide les déplacements précalculés.
+        """
+        super().clear()
+        self.board.invalidate()
+
+    def pop(self, *args) -> 'Tile':
+        """
+        Retire une case et invalide les déplacements précalculés.
+        """
+        tile = super().pop(*args)
+        self.board.invalidate()
+        return tile
+
+    def popitem(self) -> (int, 'Tile'):
+        """
+        Retire la dernière case et invalide les déplacements précalculés.
+        """
+        item = super().popitem()
+        self.board.invalidate()
+        return item
+
+    def setdefault(self, position: int, tile: 'Tile' = None) -> 'Tile':
+        """
+        Ajoute une case si la position est libre et invalide les déplacements précalculés.
+        """
+        tile = super().setdefault(position, tile)
+        self.board.invalidate()
+        return tile
+
+    def update(self, *args, **kwargs):
+        """
+        Ajoute ou remplace des cases et invalide les déplacements précalculés.
+        """
+        super().update(*args, **kwargs)
+        self.board.invalidate()
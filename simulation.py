@@ -0,0 +1,260 @@
+"""
+Ce fichier contient un simulateur de parties par lots, qui fait avancer un grand nombre de parties
+indépendantes en même temps à l'aide de tableaux NumPy, sans affichage.
+
+Les déplacements sont lus dans la table des déplacements précalculés du plateau (voir 'rules.Board.compile'),
+ce qui permet de réutiliser exactement les actions des cases (oies, ponts, labyrinthe, tête de mort, hôtel,
+puits, prison...) ainsi que le rebond en fin de plateau, puis toutes les parties sont avancées d'un tour à la fois.
+
+Les collisions entre oies ne sont prises en compte que pour délivrer les oies prisonnières :
+une oie arrivant sur une oie prisonnière la libère, et prend sa place de prisonnière
+si l'action de la case la transmet (comme le puits).
+Les autres collisions (une oie arrivant sur une case occupée renvoie l'autre oie en arrière) ne sont pas simulées :
+les parties simulées sont donc en moyenne un peu plus courtes que les vraies parties.
+"""
+
+# Imports des bibliothèques
+import argparse
+import numpy
+
+# Import d'autres fichiers
+import rules
+
+
+# Définition des constantes
+
+# États d'une oie
+FREE = 0
+SKIP = 1
+CAPTIVE = 2
+
+# Résultats d'un déplacement
+NOTHING = 0
+STOP = 1
+JAIL = 2
+WELL = 3
+REROLL = 4
+END = 5
+
+
+# Définition des fonctions
+
+def compile_board(board_: 'rules.Board') -> ('numpy.ndarray', 'numpy.ndarray'):
+    """
+    Calcule pour chaque position et chaque distance, la position d'arrivée et le résultat du déplacement.
+    Retourne deux tableaux de dimensions (taille du plateau, 13), indexés par la position puis la distance.
+    """
+
+    # Tableaux des positions d'arrivée et des résultats
+    destinations = numpy.zeros((board_.size, 13), dtype=numpy.int64)
+    outcomes = numpy.zeros((board_.size, 13), dtype=numpy.int8)
+
+    # Pour chaque déplacement précalculé du plateau
+    for (position, distance), move in list(board_.compile().items()):
+
+        # Si le déplacement part d'une position et d'un total de dés possibles
+        if 0 < position < board_.size and distance in rules.DISTANCES:
+            destinations[position, distance] = move.position
+
+            # Détermine le résultat du déplacement
+            if move.finished:
+                outcomes[position, distance] = END
+            elif move.reroll:
+                outcomes[position, distance] = REROLL
+            elif move.captive:
+                outcomes[position, distance] = WELL if transfers_captivity(board_, move.position) else JAIL
+            elif move.stopped:
+                outcomes[position, distance] = STOP
+
+    # Retourne les tableaux
+    return destinations, outcomes
+
+
+def transfers_captivity(board_: 'rules.Board', position: int) -> bool:
+    """
+    Indique si une oie qui délivre une oie prisonnière sur la case donnée devient prisonnière à son tour,
+    en jouant la délivrance avec deux joueurs à l'aide du moteur de règles.
+    """
+
+    # Crée une partie d'essai à deux joueurs
+    probe = rules.Game(board_, 2)
+    captive, rescuer = probe.players
+
+    # Emprisonne le premier joueur sur la case
+    captive.goose.place(0)
+    captive.goose.go_to(position)
+
+    # Le second joueur arrive sur la case
+    rescuer.goose.place(0)
+    rescuer.goose.go_to(position)
+
+    # Indique si le second joueur est à présent prisonnier
+    return rescuer.stopped
+
+
+def simulate(
+        board_: 'rules.Board', games: int = 10000, players: int = 4, max_turns: int = 1000, seed: int = None
+) -> 'Simulation':
+    """
+    Simule un nombre donné de parties indépendantes sur un plateau, avec un nombre de joueurs donné.
+    Les parties sont arrêtées après un nombre maximum de tours (un tour correspond au tour d'un seul joueur).
+    Les oies renvoyées en arrière par une collision ne sont pas simulées (seule la libération des prisonnières
+    l'est), les durées obtenues sont donc plus courtes que celles des vraies parties.
+    """
+
+    # Générateur de nombres aléatoires
+    generator = numpy.random.default_rng(seed)
+    # Déplacements précalculés
+    destinations, outcomes = compile_board(board_)
+
+    # Positions et états des oies de chaque partie (les oies commencent sur la case 1)
+    positions = numpy.ones((games, players), dtype=numpy.int64)
+    states = numpy.full((games, players), FREE, dtype=numpy.int8)
+
+    # Résultats des parties (-1 lorsque la partie n'est pas terminée)
+    lengths = numpy.full(games, -1, dtype=numpy.int64)
+    winners = numpy.full(games, -1, dtype=numpy.int64)
+    # Nombre de passages sur chaque case
+    visits = numpy.zeros(board_.size, dtype=numpy.int64)
+
+    # Indices des parties en cours
+    alive = numpy.arange(games)
+
+    # Pour chaque tour, tant qu'il reste des parties en cours
+    for turn in range(max_turns):
+        if alive.size == 0:
+            break
+
+        # Le joueur à qui c'est le tour (identique pour toutes les parties, chaque tour passe au joueur suivant)
+        seat = turn % players
+        state = states[alive, seat]
+
+        # Les joueurs devant passer un tour sont libérés
+        states[alive[state == SKIP], seat] = FREE
+
+        # Les joueurs libres se déplacent
+        movers = alive[state == FREE]
+        current = positions[movers, seat]
+        outcome = numpy.full(movers.size, REROLL, dtype=numpy.int8)
+        rolling = numpy.arange(movers.size)
+
+        # Tant que des joueurs doivent lancer les dés
+        while rolling.size > 0:
+
+            # Lance les dés en une seule fois
+            distance = generator.integers(1, 7, (rolling.size, 2)).sum(axis=1)
+
+            # Applique les déplacements précalculés
+            start = current[rolling]
+            current[rolling] = destinations[start, distance]
+            outcome[rolling] = outcomes[start, distance]
+
+            # Garde les joueurs devant relancer les dés
+            rolling = rolling[outcome[rolling] == REROLL]
+
+        # Enregistre les nouvelles positions et les passages
+        positions[movers, seat] = current
+        visits += numpy.bincount(current, minlength=board_.size)
+
+        # Délivre les oies prisonnières sur la case d'arrivée
+        rescued = numpy.zeros(movers.size, dtype=bool)
+        for other in range(players):
+            if other != seat:
+                hit = (positions[movers, other] == current) & (states[movers, other] == CAPTIVE)
+                states[movers[hit], other] = FREE
+                rescued |= hit
+
+        # Applique les effets de la case d'arrivée
+        states[movers[(outcome == STOP) & ~rescued], seat] = SKIP
+        states[movers[(outcome == JAIL) & ~rescued], seat] = CAPTIVE
+        states[movers[outcome == WELL], seat] = CAPTIVE
+
+        # Enregistre les parties terminées
+        finished = movers[outcome == END]
+        lengths[finished] = turn + 1
+        winners[finished] = seat
+
+        # Retire les parties terminées
+        if finished.size > 0:
+            alive = alive[lengths[alive] < 0]
+
+    # Retourne les résultats
+    return Simulation(players, lengths, winners, visits)
+
+
+# Définition des classes
+
+class Simulation:
+    """
+    Une classe représentant les résultats d'une simulation de parties par lots.
+    """
+
+    def __init__(
+            self, players: int, lengths: 'numpy.ndarray', winners: 'numpy.ndarray', visits: 'numpy.ndarray'
+    ):
+        """
+        Construit une nouvelle instance de la classe 'Simulation', à partir des durées des parties,
+        des vainqueurs (-1 pour les parties non terminées) et du nombre de passages sur chaque case.
+        """
+
+        # Nombre de joueurs par partie
+        self.players = players
+        # Durée (en tours) et vainqueur de chaque partie
+        self.lengths = lengths
+        self.winners = winners
+        # Nombre de passages sur chaque case
+        self.visits = visits
+
+    @property
+    def finished(self) -> 'numpy.ndarray':
+        """
+        Retourne un tableau de booléens indiquant les parties terminées.
+        """
+        return self.lengths >= 0
+
+    @property
+    def length_distribution(self) -> 'numpy.ndarray':
+        """
+        Retourne la distribution de la durée des parties terminées :
+        l'élément d'indice t correspond à la proportion des parties terminées en t tours.
+        """
+        return numpy.bincount(self.lengths[self.finished]) / len(self.lengths)
+
+    @property
+    def visit_distribution(self) -> 'numpy.ndarray':
+        """
+        Retourne la proportion des passages sur chaque case.
+        """
+        return self.visits / max(self.visits.sum(), 1)
+
+    @property
+    def win_rates(self) -> 'numpy.ndarray':
+        """
+        Retourne le taux de victoire de chaque place autour de la table.
+        """
+        return numpy.bincount(self.winners[self.finished], minlength=self.players) / len(self.winners)
+
+
+# Vérifie si ce fichier que ce fichier est exécuté et non importé.
+if __name__ == '__main__':
+
+    # Lit les arguments de la ligne de commande
+    parser = argparse.ArgumentParser(description="Simule des parties par lots sur un plateau.")
+    parser.add_argument("board", nargs="?", default=rules.BOARD_PATH, help="Le fichier du plateau.")
+    parser.add_argument("--games", type=int, default=10000, help="Le nombre de parties.")
+    parser.add_argument("--players", type=int, default=4, help="Le nombre de joueurs par partie.")
+    parser.add_argument("--max-turns", type=int, default=1000, help="Le nombre maximum de tours par partie.")
+    parser.add_argument("--seed", type=int, default=None, help="La graine du générateur aléatoire.")
+    arguments = parser.parse_args()
+
+    # Simule les parties
+    result = simulate(
+        rules.Board.from_file(arguments.board), arguments.games, arguments.players, arguments.max_turns, arguments.seed
+    )
+
+    # Affiche les résultats
+    print(f"Parties terminées : {result.finished.mean():.2%}")
+    print(f"Durée moyenne : {result.lengths[result.finished].mean():.2f} tours")
+    print("(les oies renvoyées en arrière par une collision ne sont pas simulées, les parties sont plus courtes)")
+    print("Taux de victoire :", ", ".join(f"{rate:.2%}" for rate in result.win_rates))
+    print("Passages par case :", ", ".join(f"{rate:.3f}" for rate in result.visit_distribution))